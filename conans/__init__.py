@@ -21,7 +21,9 @@ REVISIONS = "revisions"  # Only when enabled in config, not by default look at s
 ONLY_V2 = "only_v2"  # Remotes and virtuals from Artifactory returns this capability
 MATRIX_PARAMS = "matrix_params"
 OAUTH_TOKEN = "oauth_token"
-SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS]  # Server is always with revisions
+BATCH_METADATA = "batch_metadata"  # Only when v2
+SERVER_CAPABILITIES = [COMPLEX_SEARCH_CAPABILITY, REVISIONS,  # Server is always with revisions
+                       BATCH_METADATA, CHECKSUM_DEPLOY]
 DEFAULT_REVISION_V1 = "0"
 
 __version__ = '1.31.0-dev'
@@ -0,0 +1,77 @@
+import errno
+import os
+import stat
+
+from conans.paths import CONANINFO, CONAN_MANIFEST
+from conans.util.files import mkdir, sha256sum
+from conans.util.log import logger
+
+# These files are rewritten in place by Conan, they cannot be shared
+_NOT_SHARED = (CONANINFO, CONAN_MANIFEST)
+
+
+class BlobStore(object):
+    """ Content-addressed storage of the package files, keyed by their sha256. The files of the
+    package folders are replaced by hardlinks to these blobs, so the identical files of different
+    package revisions and package_ids (headers, unchanged libraries) are stored only once.
+
+    Hardlinked files share also their permissions and modification times, so the executable bit
+    is part of the key. The package folders must not be modified after they are created. The
+    blobs not used by any package anymore are removed by prune().
+    """
+
+    def __init__(self, folder):
+        self._folder = folder
+
+    def _blob_path(self, path):
+        key = sha256sum(path)
+        if os.stat(path).st_mode & stat.S_IXUSR:
+            key += "x"
+        return os.path.join(self._folder, key[:2], key)
+
+    def deduplicate(self, folder):
+        """ replaces every regular file in "folder" by a hardlink to the blob with the same
+        contents, storing it as a new blob if it didn't exist
+        """
+        for root, _, files in os.walk(folder):
+            for f in files:
+                path = os.path.join(root, f)
+                if f in _NOT_SHARED or os.path.islink(path):
+                    continue
+                try:
+                    self._link(path, self._blob_path(path))
+                except OSError as e:
+                    # e.g. the store is in a different filesystem, keep the file as is
+                    logger.debug("BLOB STORE: Cannot share %s: %s" % (path, str(e)))
+
+    @staticmethod
+    def _link(path, blob):
+        if not os.path.exists(blob):
+            mkdir(os.path.dirname(blob))
+            try:
+                os.link(path, blob)
+                return
+            except OSError as e:
+                if e.errno != errno.EEXIST:  # Another process could have stored it meanwhile
+                    raise
+        if os.path.samefile(path, blob):
+            return
+        tmp = path + ".conan_blob"
+        os.link(blob, tmp)
+        try:
+            os.unlink(path)
+        except OSError:
+            os.unlink(tmp)
+            raise
+        os.rename(tmp, path)
+
+    def prune(self):
+        """ removes the blobs that are not linked from any package folder
+        """
+        if not os.path.isdir(self._folder):
+            return
+        for root, _, files in os.walk(self._folder):
+            for f in files:
+                path = os.path.join(root, f)
+                if os.stat(path).st_nlink == 1:
+                    os.unlink(path)
@@ -7,8 +7,11 @@ from os.path import join
 from jinja2 import Environment, select_autoescape, FileSystemLoader, ChoiceLoader
 
 from conans.assets.templates import dict_loader
+from conans.client.cache.blob_store import BlobStore
+from conans.client.cache.cache_index import CacheIndex
 from conans.client.cache.editable import EditablePackages
 from conans.client.cache.remote_registry import RemoteRegistry
+from conans.client.cache.tgz_cache import TgzCache
 from conans.client.conf import ConanClientConfigParser, get_default_client_conf, \
     get_default_settings_yml
 from conans.client.conf.detect import detect_defaults_settings
@@ -28,6 +31,7 @@ from conans.util.locks import Lock
 CONAN_CONF = 'conan.conf'
 CONAN_SETTINGS = "settings.yml"
 LOCALDB = ".conan.db"
+CACHE_INDEX = ".conan_index.db"
 REMOTES = "remotes.json"
 PROFILES_FOLDER = "profiles"
 HOOKS_FOLDER = "hooks"
@@ -74,6 +78,7 @@ class ClientCache(object):
         # Caching
         self._no_lock = None
         self._config = None
+        self._index = None
         self.editable_packages = EditablePackages(self.cache_folder)
         # paths
         self._store_folder = self.config.storage_path or self.cache_folder
@@ -81,16 +86,71 @@ class ClientCache(object):
         _ = self.config.short_paths_home
 
     def all_refs(self):
+        index = self.index
+        if index:
+            refs = index.refs()
+            # The recipes whose folders were removed by other paths than the remover
+            removed = [ref for ref in refs
+                       if not os.path.isdir(join(self._store_folder, ref.dir_repr()))]
+            for ref in removed:
+                index.remove_recipe(ref)
+            return [ref for ref in refs if ref not in removed]
+        return self._walk_refs()
+
+    def _walk_refs(self):
         subdirs = list_folder_subdirs(basedir=self._store_folder, level=4)
         return [ConanFileReference.load_dir_repr(folder) for folder in subdirs]
 
+    @property
+    def index(self):
+        """ the CacheIndex of the recipes and packages in the store, None if not enabled. It is
+        populated walking the store the first time, remove its file to rebuild it
+        """
+        if self._index is None and self.config.cache_index:
+            if not os.path.exists(self._store_folder):
+                os.makedirs(self._store_folder)
+            self._index = CacheIndex.create(join(self._store_folder, CACHE_INDEX))
+            if not self._index.refs():
+                refs_revisions = []
+                for ref in self._walk_refs():
+                    try:
+                        revision = self.package_layout(ref).recipe_revision()
+                    except ConanException:  # Not a valid recipe folder, without metadata
+                        continue
+                    refs_revisions.append((ref, revision))
+                self._index.update_recipes(refs_revisions)
+        return self._index
+
     @property
     def store(self):
         return self._store_folder
 
+    @property
+    def blob_store(self):
+        """ the BlobStore to share the package files, None if not configured
+        """
+        blob_store_folder = self.config.blob_store
+        if blob_store_folder:
+            return BlobStore(blob_store_folder)
+
+    @property
+    def tgz_cache(self):
+        """ the TgzCache of the package tgz files, None if not configured
+        """
+        tgz_cache_folder = self.config.tgz_cache
+        if tgz_cache_folder:
+            return TgzCache(tgz_cache_folder, self.config.tgz_cache_size)
+
     def installed_as_editable(self, ref):
         return isinstance(self.package_layout(ref), PackageEditableLayout)
 
+    @property
+    def compiled_recipes_folder(self):
+        """ the folder to keep the bytecode of the recipes and the parsed conandata.yml, to load
+        them faster, None if not configured
+        """
+        return self.config.compiled_recipes
+
     @property
     def config_install_file(self):
         return os.path.join(self.cache_folder, "config_install.json")
@@ -107,7 +167,8 @@ class ClientCache(object):
             check_ref_case(ref, self.store)
             base_folder = os.path.normpath(os.path.join(self.store, ref.dir_repr()))
             return PackageCacheLayout(base_folder=base_folder, ref=ref,
-                                      short_paths=short_paths, no_lock=self._no_locks())
+                                      short_paths=short_paths, no_lock=self._no_locks(),
+                                      index=self.index)
 
     @property
     def remotes_path(self):
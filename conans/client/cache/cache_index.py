@@ -0,0 +1,108 @@
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from conans.errors import ConanException
+from conans.model.ref import ConanFileReference
+
+RECIPES_TABLE = "recipes"
+PACKAGES_TABLE = "packages"
+
+
+class CacheIndex(object):
+    """ SQLite index of the recipes and binary packages of the local cache, so they can be listed
+    without walking the store folders and reading every metadata.json and conaninfo.txt.
+
+    The recipes are kept up to date when their metadata is updated (export, download, copy) and
+    when they are removed. The packages cache the minimal conaninfo of every package revision,
+    and they are checked against the packages folder and metadata.json when they are read, so
+    packages created or removed by other paths are never reported wrongly.
+    """
+
+    def __init__(self, dbfile):
+        self._dbfile = dbfile
+
+    @staticmethod
+    def create(dbfile):
+        # The tables are created only if they don't exist
+        connection = sqlite3.connect(dbfile, detect_types=sqlite3.PARSE_DECLTYPES)
+        try:
+            cursor = connection.cursor()
+            cursor.execute("create table if not exists %s "
+                           "(reference TEXT PRIMARY KEY, revision TEXT, timestamp REAL)"
+                           % RECIPES_TABLE)
+            cursor.execute("create table if not exists %s "
+                           "(reference TEXT, package_id TEXT, revision TEXT, "
+                           "recipe_revision TEXT, info TEXT, timestamp REAL, "
+                           "PRIMARY KEY (reference, package_id))" % PACKAGES_TABLE)
+            connection.commit()
+        except Exception as e:
+            raise ConanException("Could not initialize the cache index %s: %s" % (dbfile, e))
+        finally:
+            connection.close()
+        return CacheIndex(dbfile)
+
+    @contextmanager
+    def _connect(self):
+        connection = sqlite3.connect(self._dbfile, detect_types=sqlite3.PARSE_DECLTYPES,
+                                     timeout=60)
+        connection.text_factory = str
+        try:
+            with connection:  # commits or rollbacks the transaction
+                yield connection.cursor()
+        except sqlite3.Error as e:
+            raise ConanException("Error in the cache index, remove the '%s' file to rebuild it: "
+                                 "%s" % (self._dbfile, e))
+        finally:
+            connection.close()
+
+    # Recipes
+    def refs(self):
+        with self._connect() as cursor:
+            cursor.execute("select reference from %s order by reference" % RECIPES_TABLE)
+            return [ConanFileReference.load_dir_repr(r[0]) for r in cursor.fetchall()]
+
+    def update_recipe(self, ref, revision):
+        with self._connect() as cursor:
+            cursor.execute("insert or replace into %s values (?, ?, ?)" % RECIPES_TABLE,
+                           (ref.dir_repr(), revision, time.time()))
+
+    def update_recipes(self, refs_revisions):
+        now = time.time()
+        with self._connect() as cursor:
+            cursor.executemany("insert or replace into %s values (?, ?, ?)" % RECIPES_TABLE,
+                               [(ref.dir_repr(), revision, now)
+                                for ref, revision in refs_revisions])
+
+    def remove_recipe(self, ref):
+        """ removes the recipe and all its packages """
+        with self._connect() as cursor:
+            cursor.execute("delete from %s where reference=?" % RECIPES_TABLE, (ref.dir_repr(),))
+            cursor.execute("delete from %s where reference=?" % PACKAGES_TABLE,
+                           (ref.dir_repr(),))
+
+    # Packages
+    def packages(self, ref):
+        """ {package_id: (package revision, recipe revision, conaninfo serialize_min())} """
+        with self._connect() as cursor:
+            cursor.execute("select package_id, revision, recipe_revision, info from %s "
+                           "where reference=? order by package_id" % PACKAGES_TABLE,
+                           (ref.dir_repr(),))
+            return OrderedDict((package_id, (revision, recipe_revision, json.loads(info)))
+                               for package_id, revision, recipe_revision, info
+                               in cursor.fetchall())
+
+    def update_package(self, pref, recipe_revision, info_min):
+        assert pref.revision, "The index stores package revisions"
+        with self._connect() as cursor:
+            cursor.execute("insert or replace into %s values (?, ?, ?, ?, ?, ?)" % PACKAGES_TABLE,
+                           (pref.ref.dir_repr(), pref.id, pref.revision, recipe_revision,
+                            json.dumps(info_min), time.time()))
+
+    def remove_packages(self, ref, package_ids):
+        with self._connect() as cursor:
+            cursor.executemany("delete from %s where reference=? and package_id=?"
+                               % PACKAGES_TABLE,
+                               [(ref.dir_repr(), package_id) for package_id in package_ids])
@@ -0,0 +1,79 @@
+import os
+import sqlite3
+import time
+
+from conans.util.files import RACY_SECONDS
+from conans.util.log import logger
+
+HASHES_TABLE = "hashes"
+
+
+def _stat_key(st):
+    mtime = getattr(st, "st_mtime_ns", None)
+    if mtime is None:  # Python 2
+        mtime = int(st.st_mtime * 1e9)
+    return st.st_size, mtime, st.st_ino
+
+
+class HashCache(object):
+    """ SQLite cache of the md5 of the files, keyed by their absolute path, and only valid while
+    their size, modification time and inode don't change, so creating the manifest of a folder
+    doesn't read again all the files that were not modified.
+
+    The files modified in the last RACY_SECONDS are never cached. The cache never fails, errors
+    are logged and the files are read as if they were not cached.
+    """
+
+    def __init__(self, dbfile):
+        self._dbfile = dbfile
+
+    def _connect(self):
+        folder = os.path.dirname(self._dbfile)
+        if folder and not os.path.exists(folder):
+            os.makedirs(folder)
+        connection = sqlite3.connect(self._dbfile, timeout=60)
+        connection.text_factory = str
+        connection.execute("create table if not exists %s (path TEXT PRIMARY KEY, size INTEGER, "
+                           "mtime INTEGER, inode INTEGER, md5 TEXT)" % HASHES_TABLE)
+        return connection
+
+    def md5sums(self, paths, compute):
+        """ returns {path: md5} of the absolute paths, calling compute(list of paths) -> list of
+        md5 only for the ones that are not cached or were modified
+        """
+        stats = {}
+        for path in paths:
+            stats[path] = _stat_key(os.stat(path))
+
+        try:
+            connection = self._connect()
+        except sqlite3.Error as e:
+            logger.debug("HASH CACHE: Cannot open %s: %s" % (self._dbfile, str(e)))
+            return dict(zip(paths, compute(paths)))
+
+        try:
+            result = {}
+            cursor = connection.cursor()
+            for path in paths:
+                cursor.execute("select size, mtime, inode, md5 from %s where path=?"
+                               % HASHES_TABLE, (path, ))
+                row = cursor.fetchone()
+                if row and tuple(row[:3]) == stats[path]:
+                    result[path] = row[3]
+
+            missing = [path for path in paths if path not in result]
+            result.update(zip(missing, compute(missing)))
+
+            not_racy = (time.time() - RACY_SECONDS) * 1e9
+            entries = [(path, ) + stats[path] + (result[path], ) for path in missing
+                       if stats[path][1] < not_racy]
+            if entries:
+                with connection:
+                    connection.executemany("insert or replace into %s values (?, ?, ?, ?, ?)"
+                                           % HASHES_TABLE, entries)
+            return result
+        except sqlite3.Error as e:
+            logger.debug("HASH CACHE: Error in %s: %s" % (self._dbfile, str(e)))
+            return dict(zip(paths, compute(paths)))
+        finally:
+            connection.close()
@@ -0,0 +1,83 @@
+import os
+import shutil
+import uuid
+
+from conans.util.files import mkdir
+from conans.util.log import logger
+
+
+class TgzCache(object):
+    """ Bounded cache of the package tgz files, keyed by the summary_hash of the package manifest,
+    so a package that was downloaded or already compressed can be uploaded again (to other
+    remotes, or after being removed and installed again) without compressing it. The least
+    recently used tgz files are removed when the total size of the cache exceeds max_size.
+
+    The files are hardlinked when possible, the tgz files are never modified once they are
+    created, they are removed and created again.
+    """
+
+    def __init__(self, folder, max_size):
+        self._folder = folder
+        self._max_size = max_size
+
+    def _tgz_path(self, summary_hash):
+        return os.path.join(self._folder, "%s.tgz" % summary_hash)
+
+    def get(self, summary_hash, dest_path):
+        """ puts the cached tgz of the manifest in dest_path, returns False if it is not cached
+        """
+        tgz_path = self._tgz_path(summary_hash)
+        try:
+            _link_or_copy(tgz_path, dest_path)
+            os.utime(tgz_path, None)  # Now it is the most recently used one
+        except (IOError, OSError):
+            return False
+        return True
+
+    def store(self, summary_hash, tgz_path):
+        """ keeps the tgz_path file in the cache, removing the least recently used ones if
+        the cache is full. It never fails, the cache is an optimization
+        """
+        cached_path = self._tgz_path(summary_hash)
+        try:
+            if os.path.exists(cached_path):
+                os.utime(cached_path, None)
+                return
+            mkdir(self._folder)
+            # Other processes can be storing it concurrently, the rename is atomic
+            tmp_path = "%s.%s" % (cached_path, uuid.uuid4().hex)
+            _link_or_copy(tgz_path, tmp_path)
+            os.utime(tmp_path, None)
+            try:
+                os.rename(tmp_path, cached_path)
+            except OSError:
+                os.unlink(tmp_path)  # Windows doesn't replace it, somebody else stored it
+            self._prune()
+        except (IOError, OSError) as e:
+            logger.debug("TGZ CACHE: Cannot store %s: %s" % (tgz_path, str(e)))
+
+    def _prune(self):
+        entries = []
+        for f in os.listdir(self._folder):
+            if not f.endswith(".tgz"):
+                continue
+            path = os.path.join(self._folder, f)
+            st = os.stat(path)
+            entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self._max_size:
+                break
+            try:
+                os.unlink(path)
+            except OSError:  # Another process removed or is using it
+                continue
+            total -= size
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except (AttributeError, OSError):  # Python 2 in Windows or different filesystems
+        shutil.copy2(src, dst)
@@ -85,3 +85,7 @@ def package_copy(src_ref, user_channel, package_ids, cache, user_io, short_paths
         for package_id, (revision, recipe_revision) in package_revisions.items():
             metadata.packages[package_id].revision = revision
             metadata.packages[package_id].recipe_revision = recipe_revision
+    for package_id, (revision, recipe_revision) in package_revisions.items():
+        if revision:
+            dst_layout.summarize_package(PackageReference(dest_ref, package_id, revision),
+                                         recipe_revision)
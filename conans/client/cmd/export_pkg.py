@@ -67,6 +67,9 @@ def export_pkg(app, recorder, full_ref, source_folder, build_folder, package_fol
                                       conan_file_path, ref, local=True)
 
     packager.update_package_metadata(prev, layout, package_id, full_ref.revision)
+    blob_store = cache.blob_store
+    if blob_store:
+        blob_store.deduplicate(dest_package_folder)
     pref = PackageReference(pref.ref, pref.id, prev)
     if pkg_node.graph_lock_node:
         # after the package has been created we need to update the node PREV
@@ -160,17 +160,20 @@ class CmdUpload(object):
               local cache one
             - Retrieve the sources (exports_sources), if they are not cached, and
               uploading to a different remote. "complete_recipe_sources"
-            - Gather files and create 2 .tgz (exports, exports_sources) with
-              "_compress_recipe_files"
+            - Gather files "_gather_recipe_files" and, if the remote manifest is not the
+              same, create 2 .tgz (exports, exports_sources) with "_compress_recipe_files"
             - Decide which files have to be uploaded and deleted from the server
               based on the different with the remote snapshot "_recipe_files_to_upload"
               This can raise if upload policy is not overwrite
             - Execute the real transfer "remote_manager.upload_recipe()"
-        - For every package_id of every ref: "_upload_package"
-            - Gather files and create package.tgz. "_compress_package_files"
+        - For every package_id of every ref, queued in the upload pool: "_prepare_package"
+            - Gather files "_gather_package_files"
             - (Optional) Do the integrity check of the package
-            - Decide which files to upload and delete from server:
-              "_package_files_to_upload". Can raise if policy is NOT overwrite
+            - Compare the local manifest with the remote one, if they are the same the
+              package is not compressed. Can raise if policy is NOT overwrite
+            - Create package.tgz "_compress_package_files" and decide which files to delete
+              from server
+        - For every package_id of every ref: "_upload_package"
             - Do the actual upload
 
     All the REVISIONS are local defined, not retrieved from servers
@@ -189,7 +192,10 @@ class CmdUpload(object):
         self._remote_manager = remote_manager
         self._loader = loader
         self._hook_manager = hook_manager
+        # The only pool of the upload, for the references, the compression of the packages,
+        # ahead of their upload, and the upload of the packages and their files
         self._upload_thread_pool = None
+        self._package_uploads = []  # AsyncResults of the packages of every reference
         self._exceptions_list = []
 
     def upload(self, reference_or_pattern, remotes, upload_recorder, package_id=None,
@@ -223,8 +229,14 @@ class CmdUpload(object):
                                          [(ref, conanfile, prefs) for (ref, conanfile, prefs) in
                                           refs])
 
+        # The packages keep adding the upload of their files to the pool, it cannot be closed
+        # until they are finished
+        for package_upload in self._package_uploads:
+            package_upload.wait()
         self._upload_thread_pool.close()
         self._upload_thread_pool.join()
+        for package_upload in self._package_uploads:
+            package_upload.get()  # Raises the errors of the post_upload hook
 
         if len(self._exceptions_list) > 0:
             for exc, ref, trace, remote in self._exceptions_list:
@@ -257,20 +269,25 @@ class CmdUpload(object):
             total = len(prefs)
             p_remote = recipe_remote
 
-            def upload_package_index(index_pref):
-                index, pref = index_pref
+            def prepare_package(index, pref):
+                up_msg = "\rUploading package %d/%d: %s to '%s'" % (index + 1, total,
+                                                                    str(pref.id),
+                                                                    p_remote.name)
+                self._output.info(left_justify_message(up_msg))
+                return self._prepare_package(pref, integrity_check, policy, p_remote)
+
+            def upload_package(pref, compressed):
                 try:
-                    up_msg = "\rUploading package %d/%d: %s to '%s'" % (index + 1, total,
-                                                                        str(pref.id),
-                                                                        p_remote.name)
-                    self._output.info(left_justify_message(up_msg))
-                    self._upload_package(pref, retry, retry_wait, integrity_check, policy, p_remote)
+                    the_files, deleted = compressed.get()
+                    self._upload_package(pref, the_files, deleted, retry, retry_wait, policy,
+                                         p_remote)
                     upload_recorder.add_package(pref, p_remote.name, p_remote.url)
                 except BaseException as pkg_exc:
                     trace = traceback.format_exc()
                     return pkg_exc, pref, trace, p_remote
 
-            def upload_package_callback(ret):
+            def upload_package_callback(uploads):
+                ret = [upload.get() for upload in uploads]
                 package_exceptions = [r for r in ret if r is not None]
                 self._exceptions_list.extend(package_exceptions)
                 if not package_exceptions:
@@ -279,12 +296,17 @@ class CmdUpload(object):
                     self._hook_manager.execute("post_upload", conanfile_path=conanfile_path,
                                                reference=ref, remote=recipe_remote)
 
-            # This doesn't wait for the packages to end, so the function returns
-            # and the "pool entry" for the recipe is released
-            self._upload_thread_pool.map_async(upload_package_index,
-                                               [(index, pref) for index, pref
-                                                in enumerate(prefs)],
-                                               callback=upload_package_callback)
+            # This doesn't wait for the packages to end, so the function returns and the "pool
+            # entry" for the recipe is released. Every task is queued after the tasks it waits
+            # for, so they are always started before it and the pool never waits for itself
+            uploads = []
+            for index, pref in enumerate(prefs):
+                compressed = self._upload_thread_pool.apply_async(prepare_package, (index, pref))
+                uploads.append(self._upload_thread_pool.apply_async(upload_package,
+                                                                    (pref, compressed)))
+            package_upload = self._upload_thread_pool.apply_async(upload_package_callback,
+                                                                  (uploads, ))
+            self._package_uploads.append(package_upload)
         else:
             # FIXME: I think it makes no sense to specify a remote to "post_upload"
             # FIXME: because the recipe can have one and the package a different one
@@ -303,12 +325,9 @@ class CmdUpload(object):
                                    reference=ref, remote=remote)
 
         t1 = time.time()
-        cache_files = self._compress_recipe_files(ref)
-
-        with self._cache.package_layout(ref).update_metadata() as metadata:
-            metadata.recipe.checksums = calc_files_checksum(cache_files)
-
-        local_manifest = FileTreeManifest.loads(load(cache_files["conanmanifest.txt"]))
+        export_folder = self._cache.package_layout(ref).export()
+        files, symlinks, src_files, src_symlinks = self._gather_recipe_files(ref)
+        local_manifest = FileTreeManifest.loads(load(files[CONAN_MANIFEST]))
 
         remote_manifest = None
         if policy != UPLOAD_POLICY_FORCE:
@@ -324,20 +343,41 @@ class CmdUpload(object):
                                      " fix these issues.")
 
             remote_manifest = self._check_recipe_date(ref, remote, local_manifest)
-        if policy == UPLOAD_POLICY_SKIP:
-            return ref
 
-        files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files, remote,
-                                                                remote_manifest, local_manifest)
+        # The recipe is not compressed at all if the remote one has the same manifest, the
+        # checksums of the remote files are kept, and only computed if they are missing
+        if (policy != UPLOAD_POLICY_SKIP and remote_manifest is not None and
+                remote_manifest == local_manifest):
+            self._remote_manager.check_credentials(remote)
+            files_to_upload, deleted = None, None
+            checksums = self._cache.package_layout(ref).load_metadata().recipe.checksums
+            if not checksums:
+                cache_files = _compress_recipe_files(files, symlinks, src_files, src_symlinks,
+                                                     export_folder, self._output)
+                checksums = calc_files_checksum(cache_files)
+                with self._cache.package_layout(ref).update_metadata() as metadata:
+                    metadata.recipe.checksums = checksums
+            cache_files = {name: os.path.join(export_folder, name) for name in checksums}
+        else:
+            cache_files = _compress_recipe_files(files, symlinks, src_files, src_symlinks,
+                                                 export_folder, self._output)
+            checksums = calc_files_checksum(cache_files)
+            with self._cache.package_layout(ref).update_metadata() as metadata:
+                metadata.recipe.checksums = checksums
+            if policy == UPLOAD_POLICY_SKIP:
+                return ref
+            files_to_upload, deleted = self._recipe_files_to_upload(ref, policy, cache_files,
+                                                                    remote, remote_manifest,
+                                                                    local_manifest)
 
         if files_to_upload or deleted:
             self._remote_manager.upload_recipe(ref, files_to_upload, deleted, remote, retry,
-                                               retry_wait)
+                                               retry_wait, self._upload_thread_pool)
             self._upload_recipe_end_msg(ref, remote)
         else:
             self._output.info("Recipe is up to date, upload skipped")
         duration = time.time() - t1
-        log_recipe_upload(ref, duration, cache_files, remote.name)
+        log_recipe_upload(ref, duration, cache_files, remote.name, checksums)
         self._hook_manager.execute("post_upload_recipe", conanfile_path=conanfile_path,
                                    reference=ref, remote=remote)
 
@@ -348,42 +388,81 @@ class CmdUpload(object):
 
         return ref
 
-    def _upload_package(self, pref, retry=None, retry_wait=None, integrity_check=False,
-                        policy=None, p_remote=None):
-
+    def _prepare_package(self, pref, integrity_check, policy, p_remote):
+        """ runs the pre_upload_package hook, checks the package against the remote one and
+        compresses it, it can be done before uploading it, in the compression pool. Returns the
+        files and the remote files to be deleted, or (None, None) if the remote package has the
+        same manifest, so it is not compressed at all
+        """
         assert (pref.revision is not None), "Cannot upload a package without PREV"
         assert (pref.ref.revision is not None), "Cannot upload a package without RREV"
 
-        pkg_layout = self._cache.package_layout(pref.ref)
-        conanfile_path = pkg_layout.conanfile()
+        conanfile_path = self._cache.package_layout(pref.ref).conanfile()
         self._hook_manager.execute("pre_upload_package", conanfile_path=conanfile_path,
                                    reference=pref.ref,
                                    package_id=pref.id,
                                    remote=p_remote)
 
-        t1 = time.time()
-        the_files = self._compress_package_files(pref, integrity_check)
+        files, symlinks, package_folder = self._gather_package_files(pref, integrity_check)
+        if policy == UPLOAD_POLICY_SKIP:
+            the_files = _compress_package_files(files, symlinks, package_folder, self._output,
+                                                self._cache.tgz_cache)
+            return the_files, set()
+
+        self._remote_manager.check_credentials(p_remote)
+        remote_snapshot = self._remote_manager.get_package_snapshot(pref, p_remote)
+        if remote_snapshot and policy != UPLOAD_POLICY_FORCE:
+            if is_package_snapshot_complete(remote_snapshot):
+                remote_manifest, _ = self._remote_manager.get_package_manifest(pref, p_remote)
+                local_manifest = FileTreeManifest.loads(load(files[CONAN_MANIFEST]))
+                if remote_manifest == local_manifest:
+                    # Not compressed, the checksums of the remote files are computed if missing
+                    metadata = self._cache.package_layout(pref.ref).load_metadata()
+                    if not metadata.packages[pref.id].checksums:
+                        the_files = _compress_package_files(files, symlinks, package_folder,
+                                                            self._output, self._cache.tgz_cache)
+                        with self._cache.package_layout(pref.ref).update_metadata() as metadata:
+                            metadata.packages[pref.id].checksums = calc_files_checksum(the_files)
+                    return None, None
+                if policy == UPLOAD_POLICY_NO_OVERWRITE:
+                    raise ConanException("Local package is different from the remote package. "
+                                         "Forbidden overwrite.")
+            else:
+                remote_snapshot = None
 
+        the_files = _compress_package_files(files, symlinks, package_folder, self._output,
+                                            self._cache.tgz_cache)
+        deleted = set(remote_snapshot or []).difference(the_files)
+        return the_files, deleted
+
+    def _upload_package(self, pref, the_files, deleted, retry=None, retry_wait=None, policy=None,
+                        p_remote=None):
+        pkg_layout = self._cache.package_layout(pref.ref)
+        conanfile_path = pkg_layout.conanfile()
+
+        t1 = time.time()
         if policy == UPLOAD_POLICY_SKIP:
             return None
-        files_to_upload, deleted = self._package_files_to_upload(pref, policy, the_files, p_remote)
 
-        if files_to_upload or deleted:
-            self._remote_manager.upload_package(pref, files_to_upload, deleted, p_remote, retry,
-                                                retry_wait)
+        if the_files is not None:
+            self._remote_manager.upload_package(pref, the_files, deleted, p_remote, retry,
+                                                retry_wait, self._upload_thread_pool)
             logger.debug("UPLOAD: Time upload package: %f" % (time.time() - t1))
+            checksums = calc_files_checksum(the_files)
         else:
             self._output.info("Package is up to date, upload skipped")
+            # The checksums of the remote files are kept, they were filled if missing
+            checksums = pkg_layout.load_metadata().packages[pref.id].checksums
+            package_folder = self._cache.package_layout(pref.ref, short_paths=None).package(pref)
+            the_files = {name: os.path.join(package_folder, name) for name in checksums}
 
         duration = time.time() - t1
-        log_package_upload(pref, duration, the_files, p_remote)
+        log_package_upload(pref, duration, the_files, p_remote, checksums)
         self._hook_manager.execute("post_upload_package", conanfile_path=conanfile_path,
                                    reference=pref.ref, package_id=pref.id, remote=p_remote)
 
         logger.debug("UPLOAD: Time uploader upload_package: %f" % (time.time() - t1))
 
-        # Update the package metadata
-        checksums = calc_files_checksum(the_files)
         with pkg_layout.update_metadata() as metadata:
             cur_package_remote = metadata.packages[pref.id].remote
             if not cur_package_remote:
@@ -392,7 +471,7 @@ class CmdUpload(object):
 
         return pref
 
-    def _compress_recipe_files(self, ref):
+    def _gather_recipe_files(self, ref):
         export_folder = self._cache.package_layout(ref).export()
 
         for f in (EXPORT_TGZ_NAME, EXPORT_SOURCES_TGZ_NAME):
@@ -407,13 +486,9 @@ class CmdUpload(object):
             raise ConanException("Cannot upload corrupted recipe '%s'" % str(ref))
         export_src_folder = self._cache.package_layout(ref).export_sources()
         src_files, src_symlinks = gather_files(export_src_folder)
-        the_files = _compress_recipe_files(files, symlinks, src_files, src_symlinks, export_folder,
-                                           self._output)
-
-        return the_files
-
-    def _compress_package_files(self, pref, integrity_check):
+        return files, symlinks, src_files, src_symlinks
 
+    def _gather_package_files(self, pref, integrity_check):
         t1 = time.time()
         # existing package, will use short paths if defined
         package_folder = self._cache.package_layout(pref.ref, short_paths=None).package(pref)
@@ -439,9 +514,7 @@ class CmdUpload(object):
             self._package_integrity_check(pref, files, package_folder)
             logger.debug("UPLOAD: Time remote_manager check package integrity : %f"
                          % (time.time() - t1))
-
-        the_files = _compress_package_files(files, symlinks, package_folder, self._output)
-        return the_files
+        return files, symlinks, package_folder
 
     def _recipe_files_to_upload(self, ref, policy, files, remote, remote_manifest,
                                 local_manifest):
@@ -472,23 +545,6 @@ class CmdUpload(object):
 
         return files, deleted
 
-    def _package_files_to_upload(self, pref, policy, the_files, remote):
-        self._remote_manager.check_credentials(remote)
-        remote_snapshot = self._remote_manager.get_package_snapshot(pref, remote)
-
-        if remote_snapshot and policy != UPLOAD_POLICY_FORCE:
-            if not is_package_snapshot_complete(remote_snapshot):
-                return the_files, set()
-            remote_manifest, _ = self._remote_manager.get_package_manifest(pref, remote)
-            local_manifest = FileTreeManifest.loads(load(the_files["conanmanifest.txt"]))
-            if remote_manifest == local_manifest:
-                return None, None
-            if policy == UPLOAD_POLICY_NO_OVERWRITE:
-                raise ConanException("Local package is different from the remote package. Forbidden"
-                                     " overwrite.")
-        deleted = set(remote_snapshot).difference(the_files)
-        return the_files, deleted
-
     def _upload_recipe_end_msg(self, ref, remote):
         msg = "\rUploaded conan recipe '%s' to '%s'" % (str(ref), remote.name)
         url = remote.url.replace("https://api.bintray.com/conan", "https://bintray.com")
@@ -584,13 +640,22 @@ def _compress_recipe_files(files, symlinks, src_files, src_symlinks, dest_folder
     return result
 
 
-def _compress_package_files(files, symlinks, dest_folder, output):
+def _compress_package_files(files, symlinks, dest_folder, output, tgz_cache=None):
     tgz_path = files.get(PACKAGE_TGZ_NAME)
+    summary_hash = None
+    if tgz_cache:
+        summary_hash = FileTreeManifest.loads(load(files[CONAN_MANIFEST])).summary_hash
+        if not tgz_path:
+            tgz_path = os.path.join(dest_folder, PACKAGE_TGZ_NAME)
+            if not tgz_cache.get(summary_hash, tgz_path):
+                tgz_path = None
     if not tgz_path:
         if output and not output.is_terminal:
             output.writeln("Compressing package...")
         tgz_files = {f: path for f, path in files.items() if f not in [CONANINFO, CONAN_MANIFEST]}
         tgz_path = compress_files(tgz_files, symlinks, PACKAGE_TGZ_NAME, dest_folder, output)
+    if tgz_cache:
+        tgz_cache.store(summary_hash, tgz_path)
 
     return {PACKAGE_TGZ_NAME: tgz_path,
             CONANINFO: files[CONANINFO],
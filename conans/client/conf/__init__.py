@@ -132,11 +132,14 @@ _t_default_client_conf = Template(textwrap.dedent("""
     [general]
     default_profile = {{default_profile}}
     compression_level = 9                 # environment CONAN_COMPRESSION_LEVEL
+    # compressor = gzip                   # environment CONAN_COMPRESSOR (gzip, parallel_gzip)
     sysrequires_sudo = True               # environment CONAN_SYSREQUIRES_SUDO
     request_timeout = 60                  # environment CONAN_REQUEST_TIMEOUT (seconds)
     default_package_id_mode = semver_direct_mode # environment CONAN_DEFAULT_PACKAGE_ID_MODE
     # retry = 2                             # environment CONAN_RETRY
     # retry_wait = 5                        # environment CONAN_RETRY_WAIT (seconds)
+    # http_keep_alive = True                # environment CONAN_HTTP_KEEP_ALIVE
+    # connection_pool_size = 10             # Connections kept alive to each remote
     # sysrequires_mode = enabled          # environment CONAN_SYSREQUIRES_MODE (allowed modes enabled/verify/disabled)
     # vs_installation_preference = Enterprise, Professional, Community, BuildTools # environment CONAN_VS_INSTALLATION_PREFERENCE
     # verbose_traceback = False           # environment CONAN_VERBOSE_TRACEBACK
@@ -174,6 +177,11 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # temp_test_folder = True             # environment CONAN_TEMP_TEST_FOLDER
 
     # cacert_path                         # environment CONAN_CACERT_PATH
+    # stream_package_download = False     # environment CONAN_STREAM_PACKAGE_DOWNLOAD
+    # download_segments = 4               # Parallel Range requests for the large files
+    # segmented_download_min_size = 100   # Size (MB) of the files downloaded in segments
+    # cache_index = False                 # environment CONAN_CACHE_INDEX
+    # hash_cache = /path/to/hashes.db     # environment CONAN_HASH_CACHE (md5 of unmodified files)
     # scm_to_conandata                    # environment CONAN_SCM_TO_CONANDATA
     {% if conan_v2 %}
     revisions_enabled = 1
@@ -187,6 +195,12 @@ _t_default_client_conf = Template(textwrap.dedent("""
     # path beginning with "~" (if the environment var CONAN_USER_HOME is specified, this directory, even
     # with "~/", will be relative to the conan user home, not to the system user home)
     path = ./data
+    # blob_store = /path/to/blobs  # Share identical package files with hardlinks
+    #                              # (same filesystem as path)
+    # tgz_cache = /path/to/tgz_cache  # Keep the package tgz files, to upload them
+    #                                 # without compressing them again
+    # tgz_cache_size = 2048  # Size (MB) of the tgz_cache, the least recently used files are removed
+    # compiled_recipes = /path/to/compiled_recipes  # Bytecode of recipes, parsed conandata.yml
 
     [proxies]
     # Empty (or missing) section will try to use system proxies.
@@ -231,6 +245,7 @@ class ConanClientConfigParser(ConfigParser, object):
         ],
         "general": [
             ("CONAN_COMPRESSION_LEVEL", "compression_level", 9),
+            ("CONAN_COMPRESSOR", "compressor", None),
             ("CONAN_NON_INTERACTIVE", "non_interactive", False),
             ("CONAN_SKIP_BROKEN_SYMLINKS_CHECK", "skip_broken_symlinks_check", False),
             ("CONAN_CACHE_NO_LOCKS", "cache_no_locks", False),
@@ -239,6 +254,7 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_REQUEST_TIMEOUT", "request_timeout", None),
             ("CONAN_RETRY", "retry", None),
             ("CONAN_RETRY_WAIT", "retry_wait", None),
+            ("CONAN_HTTP_KEEP_ALIVE", "http_keep_alive", None),
             ("CONAN_VS_INSTALLATION_PREFERENCE", "vs_installation_preference", None),
             ("CONAN_CPU_COUNT", "cpu_count", None),
             ("CONAN_READ_ONLY_CACHE", "read_only_cache", None),
@@ -265,6 +281,9 @@ class ConanClientConfigParser(ConfigParser, object):
             ("CONAN_MSBUILD_VERBOSITY", "msbuild_verbosity", None),
             ("CONAN_CACERT_PATH", "cacert_path", None),
             ("CONAN_DEFAULT_PACKAGE_ID_MODE", "default_package_id_mode", None),
+            ("CONAN_STREAM_PACKAGE_DOWNLOAD", "stream_package_download", False),
+            ("CONAN_CACHE_INDEX", "cache_index", False),
+            ("CONAN_HASH_CACHE", "hash_cache", None),
             # ("CONAN_DEFAULT_PROFILE_PATH", "default_profile", DEFAULT_PROFILE_NAME),
         ],
         "hooks": [
@@ -437,6 +456,139 @@ class ConanClientConfigParser(ConfigParser, object):
         except ValueError:
             raise ConanException("Specify a numeric parameter for 'parallel_download'")
 
+    @property
+    def parallel_recipe_download(self):
+        try:
+            parallel = self.get_item("general.parallel_recipe_download")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_recipe_download'")
+
+    @property
+    def parallel_binary_check(self):
+        try:
+            parallel = self.get_item("general.parallel_binary_check")
+        except ConanException:
+            return None
+
+        try:
+            return int(parallel) if parallel is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'parallel_binary_check'")
+
+    @property
+    def download_segments(self):
+        try:
+            segments = self.get_item("general.download_segments")
+        except ConanException:
+            return None
+
+        try:
+            return int(segments) if segments is not None else None
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'download_segments'")
+
+    @property
+    def segmented_download_min_size(self):
+        """ size in bytes of the smallest file downloaded in segments
+        """
+        try:
+            min_size = self.get_item("general.segmented_download_min_size")
+        except ConanException:
+            min_size = 100
+        try:
+            return int(float(min_size) * 1024 * 1024)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'segmented_download_min_size'")
+
+    @property
+    def stream_package_download(self):
+        try:
+            stream = get_env("CONAN_STREAM_PACKAGE_DOWNLOAD")
+            if stream is None:
+                stream = self.get_item("general.stream_package_download")
+            return str(stream).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def cache_index(self):
+        try:
+            cache_index = get_env("CONAN_CACHE_INDEX")
+            if cache_index is None:
+                cache_index = self.get_item("general.cache_index")
+            return str(cache_index).lower() in ("1", "true")
+        except ConanException:
+            return False
+
+    @property
+    def connection_pool_size(self):
+        """ maximum number of connections kept alive to each remote, by default enough for all
+        the threads that can use them concurrently in parallel downloads and uploads
+        """
+        try:
+            pool_size = self.get_item("general.connection_pool_size")
+        except ConanException:
+            from conans.client.tools.oss import cpu_count
+            return max(10, self.parallel_download or 0, self.parallel_recipe_download or 0,
+                       self.parallel_binary_check or 0, self.download_segments or 0,
+                       cpu_count())
+        try:
+            return int(pool_size)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'connection_pool_size'")
+
+    @property
+    def http_keep_alive(self):
+        try:
+            keep_alive = get_env("CONAN_HTTP_KEEP_ALIVE")
+            if keep_alive is None:
+                keep_alive = self.get_item("general.http_keep_alive")
+            return str(keep_alive).lower() not in ("0", "false")
+        except ConanException:
+            return True
+
+    @property
+    def blob_store(self):
+        try:
+            blob_store = self.get_item("storage.blob_store")
+            return blob_store
+        except ConanException:
+            return None
+
+    @property
+    def tgz_cache(self):
+        try:
+            tgz_cache = self.get_item("storage.tgz_cache")
+            return tgz_cache
+        except ConanException:
+            return None
+
+    @property
+    def tgz_cache_size(self):
+        """ size in bytes of the tgz_cache
+        """
+        try:
+            size = self.get_item("storage.tgz_cache_size")
+        except ConanException:
+            size = 2048
+        try:
+            return int(float(size) * 1024 * 1024)
+        except ValueError:
+            raise ConanException("Specify a numeric parameter for 'tgz_cache_size'")
+
+    @property
+    def compiled_recipes(self):
+        try:
+            compiled_recipes = self.get_item("storage.compiled_recipes")
+            return compiled_recipes
+        except ConanException:
+            return None
+
     @property
     def download_cache(self):
         try:
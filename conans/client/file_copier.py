@@ -1,10 +1,12 @@
 import fnmatch
 import os
+import re
 import shutil
+import time
 from collections import defaultdict
 
 from conans.errors import ConanException
-from conans.util.files import mkdir, walk
+from conans.util.files import RACY_SECONDS, mkdir, walk
 
 
 def report_copied_files(copied, output, message_suffix="Copied"):
@@ -27,6 +29,66 @@ def report_copied_files(copied, output, message_suffix="Copied"):
     return True
 
 
+def _compile_patterns(patterns, normcase=True):
+    """ a single regex matching the fnmatch patterns, like fnmatch.fnmatch() does, or like
+    fnmatch.fnmatchcase() if not normcase
+    """
+    if normcase:
+        patterns = [os.path.normcase(p) for p in patterns]
+    return re.compile("|".join("(?:%s)" % fnmatch.translate(p) for p in patterns))
+
+
+def _mtime(folder):
+    try:
+        return os.stat(folder).st_mtime
+    except OSError:
+        return None
+
+
+class _FolderWalk(object):
+    """ the files and linked folders of a source folder, walked once and reused by all the
+    copies from it while none of its folders is modified (the modification time of a folder
+    changes when files are added, removed or renamed in it).
+
+    A walk is never reused if any of its folders was modified in the last RACY_SECONDS before
+    it.
+    """
+
+    def __init__(self, src, links, excluded_folders):
+        self.folders = []  # [(relative_path, files)], the parent folders before their children
+        self.linked_folders = []
+        not_racy = time.time() - RACY_SECONDS
+        self._mtimes = {src: _mtime(src)}
+        for root, subfolders, files in walk(src, followlinks=True):
+            if root in excluded_folders:
+                subfolders[:] = []
+                continue
+
+            if links and os.path.islink(root):
+                self.linked_folders.append(os.path.relpath(root, src))
+                subfolders[:] = []
+                continue
+            basename = os.path.basename(root)
+            # Skip git or svn subfolders
+            if basename in [".git", ".svn"]:
+                subfolders[:] = []
+                continue
+            if basename == "test_package":  # DO NOT export test_package/build folder
+                try:
+                    subfolders.remove("build")
+                except ValueError:
+                    pass
+
+            self._mtimes[root] = _mtime(root)
+            self.folders.append((os.path.relpath(root, src), files))
+
+        self._racy = any(mtime is None or mtime >= not_racy for mtime in self._mtimes.values())
+
+    def modified(self):
+        return self._racy or any(_mtime(folder) != mtime
+                                 for folder, mtime in self._mtimes.items())
+
+
 class FileCopier(object):
     """ main responsible of copying files from place to place:
     package: build folder -> package folder
@@ -46,6 +108,7 @@ class FileCopier(object):
         self._src_folders = source_folders
         self._dst_folder = root_destination_folder
         self._copied = []
+        self._walks = {}  # {(src, links, excluded_folders): _FolderWalk}
 
     def report(self, output):
         return report_copied_files(self._copied, output)
@@ -105,63 +168,55 @@ class FileCopier(object):
         self._copied.extend(files_to_copy)
         return copied_files
 
-    @staticmethod
-    def _filter_files(src, pattern, links, excludes, ignore_case, excluded_folders):
+    def _walk(self, src, links, excluded_folders):
+        key = (src, links, tuple(excluded_folders))
+        folder_walk = self._walks.get(key)
+        if folder_walk is None or folder_walk.modified():
+            folder_walk = _FolderWalk(src, links, excluded_folders)
+            self._walks[key] = folder_walk
+        return folder_walk
 
+    def _filter_files(self, src, pattern, links, excludes, ignore_case, excluded_folders):
         """ return a list of the files matching the patterns
         The list will be relative path names wrt to the root src folder
         """
-        filenames = []
-        linked_folders = []
-
         if excludes:
             if not isinstance(excludes, (tuple, list)):
                 excludes = (excludes, )
             if ignore_case:
                 excludes = [e.lower() for e in excludes]
+            excludes = _compile_patterns(excludes)
         else:
-            excludes = []
+            excludes = None
 
-        for root, subfolders, files in walk(src, followlinks=True):
-            if root in excluded_folders:
-                subfolders[:] = []
+        folder_walk = self._walk(src, links, excluded_folders)
+        filenames = []
+        excluded_paths = set()  # The folders excluded, their subfolders are excluded too
+        for relative_path, files in folder_walk.folders:
+            if relative_path != "." and (os.path.dirname(relative_path) or ".") in excluded_paths:
+                excluded_paths.add(relative_path)
                 continue
-
-            if links and os.path.islink(root):
-                linked_folders.append(os.path.relpath(root, src))
-                subfolders[:] = []
+            if excludes and excludes.match(os.path.normcase(relative_path)):
+                excluded_paths.add(relative_path)
                 continue
-            basename = os.path.basename(root)
-            # Skip git or svn subfolders
-            if basename in [".git", ".svn"]:
-                subfolders[:] = []
-                continue
-            if basename == "test_package":  # DO NOT export test_package/build folder
-                try:
-                    subfolders.remove("build")
-                except ValueError:
-                    pass
-
-            relative_path = os.path.relpath(root, src)
-            for exclude in excludes:
-                if fnmatch.fnmatch(relative_path, exclude):
-                    subfolders[:] = []
-                    files = []
-                    break
             for f in files:
                 relative_name = os.path.normpath(os.path.join(relative_path, f))
                 filenames.append(relative_name)
 
+        linked_folders = [f for f in folder_walk.linked_folders
+                          if (os.path.dirname(f) or ".") not in excluded_paths]
+
         if ignore_case:
             filenames = {f.lower(): f for f in filenames}
-            pattern = pattern.lower()
-            files_to_copy = fnmatch.filter(filenames, pattern)
+            pattern = _compile_patterns([pattern.lower()])
+            files_to_copy = [f for f in filenames if pattern.match(os.path.normcase(f))]
         else:
-            files_to_copy = [n for n in filenames if fnmatch.fnmatchcase(os.path.normpath(n),
-                                                                         pattern)]
+            pattern = _compile_patterns([pattern], normcase=False)
+            files_to_copy = [n for n in filenames if pattern.match(os.path.normpath(n))]
 
-        for exclude in excludes:
-            files_to_copy = [f for f in files_to_copy if not fnmatch.fnmatch(f, exclude)]
+        if excludes:
+            files_to_copy = [f for f in files_to_copy
+                             if not excludes.match(os.path.normcase(f))]
 
         if ignore_case:
             files_to_copy = [filenames[f] for f in files_to_copy]
@@ -220,14 +275,18 @@ class FileCopier(object):
         managing symlinks if necessary
         """
         copied_files = []
+        created_folders = set()
         for filename in files:
             abs_src_name = os.path.join(src, filename)
             filename = filename if keep_path else os.path.basename(filename)
             abs_dst_name = os.path.normpath(os.path.join(dst, filename))
-            try:
-                os.makedirs(os.path.dirname(abs_dst_name))
-            except Exception:
-                pass
+            dst_folder = os.path.dirname(abs_dst_name)
+            if dst_folder not in created_folders:
+                try:
+                    os.makedirs(dst_folder)
+                except Exception:
+                    pass
+                created_folders.add(dst_folder)
             if symlinks and os.path.islink(abs_src_name):
                 linkto = os.readlink(abs_src_name)  # @UndefinedVariable
                 try:
@@ -1,5 +1,6 @@
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
+from conans.errors import ConanException
 from conans.model.ref import PackageReference
 
 RECIPE_DOWNLOADED = "Downloaded"
@@ -242,6 +243,44 @@ class Edge(object):
         return hash((self.src, self.dst))
 
 
+def order_levels(nodes, get_neighbors):
+    """ topological order by levels, in linear time (Kahn's algorithm with in-degree counters).
+    The first level will be the one which nodes don't have neighbors. Second level will be with
+    nodes that only have neighbors in the first level, and so on. The neighbors not contained in
+    "nodes" are ignored, so it can order any subset of a graph.
+    :param nodes: the nodes to order, can be any hashable and sortable object
+    :param get_neighbors: function returning the neighbors of a node
+    return [[node1, node34], [node3], [node23, node8],...]
+    """
+    nodes = set(nodes)
+    pending = {}  # {node: number of its neighbors not in a level yet}
+    dependants = defaultdict(list)  # {node: [nodes that have it as a neighbor]}
+    for node in nodes:
+        neighbors = set(n for n in get_neighbors(node) if n in nodes)
+        pending[node] = len(neighbors)
+        for neighbor in neighbors:
+            dependants[neighbor].append(node)
+
+    result = []
+    current_level = [node for node, count in pending.items() if count == 0]
+    while current_level:
+        current_level.sort()
+        result.append(current_level)
+        next_level = []
+        for node in current_level:
+            for dependant in dependants[node]:
+                pending[dependant] -= 1
+                if pending[dependant] == 0:
+                    next_level.append(dependant)
+        current_level = next_level
+
+    if sum(len(level) for level in result) != len(nodes):
+        not_ordered = sorted(str(node) for node, count in pending.items() if count > 0)
+        raise ConanException("There is a loop in the graph, these nodes cannot be ordered: %s"
+                             % ", ".join(not_ordered))
+    return result
+
+
 class DepsGraph(object):
     def __init__(self, initial_node_id=None):
         self.nodes = set()
@@ -270,16 +309,15 @@ class DepsGraph(object):
                 yield node
 
     def _inverse_closure(self, references):
-        closure = set()
-        current = [n for n in self.nodes if str(n.ref) in references or "ALL" in references]
-        closure.update(current)
+        closure = set(n for n in self.nodes if str(n.ref) in references or "ALL" in references)
+        current = list(closure)
         while current:
-            new_current = set()
+            new_current = []
             for n in current:
-                closure.add(n)
-                new_neighs = n.inverse_neighbors()
-                to_add = set(new_neighs).difference(current)
-                new_current.update(to_add)
+                for neigh in n.inverse_neighbors():
+                    if neigh not in closure:
+                        closure.add(neigh)
+                        new_current.append(neigh)
             current = new_current
         return closure
 
@@ -321,12 +359,14 @@ class DepsGraph(object):
 
     def build_order(self, references):
         new_graph = self.collapse_graph()
-        levels = new_graph.inverse_levels()
         closure = new_graph._inverse_closure(references)
+        # The closure contains all the dependants of its nodes, so its inverse levels are the
+        # same ones of the full graph
+        levels = order_levels(closure, Node.inverse_neighbors)
         result = []
         for level in reversed(levels):
             new_level = [n.ref for n in level
-                         if (n in closure and n.recipe not in (RECIPE_CONSUMER, RECIPE_VIRTUAL))]
+                         if n.recipe not in (RECIPE_CONSUMER, RECIPE_VIRTUAL)]
             if new_level:
                 result.append(new_level)
         return result
@@ -340,32 +380,16 @@ class DepsGraph(object):
         return ret
 
     def by_levels(self, nodes_subset=None):
-        return self._order_levels(True, nodes_subset)
-
-    def inverse_levels(self):
-        return self._order_levels(False)
-
-    def _order_levels(self, direct, nodes_subset=None):
         """ order by node degree. The first level will be the one which nodes dont have
         dependencies. Second level will be with nodes that only have dependencies to
         first level nodes, and so on
         return [[node1, node34], [node3], [node23, node8],...]
         """
-        result = []
-        opened = nodes_subset if nodes_subset is not None else self.nodes
-        while opened:
-            current_level = []
-            for o in opened:
-                o_neighs = o.neighbors() if direct else o.inverse_neighbors()
-                if not any(n in opened for n in o_neighs):
-                    current_level.append(o)
-
-            current_level.sort()
-            result.append(current_level)
-            # now initialize new level
-            opened = opened.difference(current_level)
+        nodes = nodes_subset if nodes_subset is not None else self.nodes
+        return order_levels(nodes, Node.neighbors)
 
-        return result
+    def inverse_levels(self):
+        return order_levels(self.nodes, Node.inverse_neighbors)
 
     def mark_private_skippable(self, nodes_subset=None, root=None):
         """ check which nodes are reachable from the root, mark the non reachable as BINARY_SKIP.
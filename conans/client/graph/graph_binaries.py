@@ -1,9 +1,12 @@
 import os
+from collections import OrderedDict
+from multiprocessing.pool import ThreadPool
 
 from conans.client.graph.build_mode import BuildMode
 from conans.client.graph.graph import (BINARY_BUILD, BINARY_CACHE, BINARY_DOWNLOAD, BINARY_MISSING,
                                        BINARY_UPDATE, RECIPE_EDITABLE, BINARY_EDITABLE,
                                        RECIPE_CONSUMER, RECIPE_VIRTUAL, BINARY_SKIP, BINARY_UNKNOWN)
+from conans.client.rest.rest_client_v2 import PackageMetadata
 from conans.errors import NoRemoteAvailable, NotFoundException, conanfile_exception_formatter, \
     ConanException
 from conans.model.info import ConanInfo, PACKAGE_ID_UNKNOWN
@@ -21,7 +24,10 @@ class GraphBinariesAnalyzer(object):
         self._remote_manager = remote_manager
         # These are the nodes with pref (not including PREV) that have been evaluated
         self._evaluated = {}  # {pref: [nodes]}
+        self._prefetched = {}  # {(pref, remote name): (PackageMetadata, NotFoundException)}
         self._fixed_package_id = cache.config.full_transitive_package_id
+        # Number of threads to check concurrently the binaries in the remotes
+        self._parallel = cache.config.parallel_binary_check
 
     @staticmethod
     def _check_update(upstream_manifest, package_folder, output):
@@ -78,8 +84,7 @@ class GraphBinariesAnalyzer(object):
             output = node.conanfile.output
             if remote:
                 try:
-                    tmp = self._remote_manager.get_package_manifest(pref, remote)
-                    upstream_manifest, pref = tmp
+                    upstream_manifest, pref = self._get_package_manifest(pref, remote)
                 except NotFoundException:
                     output.warn("Can't update, no package in remote")
                 except NoRemoteAvailable:
@@ -102,7 +107,7 @@ class GraphBinariesAnalyzer(object):
         remote_info = None
         if remote:
             try:
-                remote_info, pref = self._remote_manager.get_package_info(pref, remote)
+                remote_info, pref = self._get_package_info(pref, remote)
             except NotFoundException:
                 pass
             except Exception:
@@ -113,8 +118,10 @@ class GraphBinariesAnalyzer(object):
         # revisions iterate all remotes
         if not remote or (not remote_info and self._cache.config.revisions_enabled):
             for r in remotes.values():
+                if remote and r.name == remote.name:
+                    continue  # Already checked
                 try:
-                    remote_info, pref = self._remote_manager.get_package_info(pref, r)
+                    remote_info, pref = self._get_package_info(pref, r)
                 except NotFoundException:
                     pass
                 else:
@@ -133,6 +140,118 @@ class GraphBinariesAnalyzer(object):
 
         return recipe_hash, remote
 
+    def _prefetch_packages_metadata(self, nodes, build_mode, update, remotes):
+        """ retrieves with a single request per remote the metadata of the binaries of "nodes"
+        that will be checked in the remotes, instead of 2 requests per binary. The remotes that
+        don't support it are queried per binary later, as usual, or concurrently here if
+        general.parallel_binary_check is defined. The compatible packages of the nodes are
+        retrieved too, as they will be checked if the main binary is missing
+        """
+        if not remotes or build_mode.all:
+            return
+
+        prefs_by_remote = OrderedDict()  # {remote name: (remote, [pref])}
+        for node in nodes:
+            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL, RECIPE_EDITABLE):
+                continue
+            if node.package_id == PACKAGE_ID_UNKNOWN:
+                continue
+            locked = node.graph_lock_node
+            if locked and locked.package_id:
+                candidates = [PackageReference(node.ref, node.package_id, locked.prev)]
+            else:
+                candidates = [PackageReference(node.ref, node.package_id)]
+                for compatible_package in node.conanfile.compatible_packages:
+                    package_id = compatible_package.package_id()
+                    if package_id != node.package_id:
+                        candidates.append(PackageReference(node.ref, package_id))
+            package_layout = self._cache.package_layout(node.ref,
+                                                        short_paths=node.conanfile.short_paths)
+            for pref in candidates:
+                if pref in self._evaluated:
+                    continue
+                if not update and os.path.exists(package_layout.package(pref)):
+                    continue
+                remote = remotes.selected
+                if not remote:
+                    metadata = package_layout.load_metadata()
+                    remote_name = metadata.packages[pref.id].remote or metadata.recipe.remote
+                    remote = remotes.get(remote_name)
+                # Without a remote, all of them are checked in order, query them in advance
+                # only if they can be queried concurrently
+                candidate_remotes = [remote] if remote else \
+                    list(remotes.values()) if self._parallel else []
+                for r in candidate_remotes:
+                    prefs = prefs_by_remote.setdefault(r.name, (r, []))[1]
+                    if pref not in prefs:
+                        prefs.append(pref)
+
+        def _get_packages_metadata(item):
+            remote, prefs = item
+            try:
+                return self._remote_manager.get_packages_metadata(prefs, remote)
+            except ConanException:
+                return None  # The errors will be reported by the requests per binary
+
+        items = list(prefs_by_remote.values())
+        unsupported = []  # [(pref, remote)] to be checked per binary
+        for (remote, prefs), results in zip(items, self._map(_get_packages_metadata, items)):
+            if results is None:
+                unsupported.extend((pref, remote) for pref in prefs)
+                continue
+            for pref, (metadata, exc) in zip(prefs, results):
+                # Other errors, like authentication ones, are handled by the requests per binary
+                if exc is None or isinstance(exc, NotFoundException):
+                    self._prefetched[(pref, remote.name)] = metadata, exc
+
+        if not self._parallel:
+            return
+
+        def _get_package_info(item):
+            pref, remote = item
+            try:
+                info, pref = self._remote_manager.get_package_info(pref, remote)
+                return PackageMetadata(pref, info, None, None), None
+            except NotFoundException as e:
+                return None, e
+            except Exception:
+                return None, None  # The errors will be reported by the requests per binary
+
+        for (pref, remote), (metadata, exc) in zip(unsupported,
+                                                   self._map(_get_package_info, unsupported)):
+            if metadata is not None or exc is not None:
+                self._prefetched[(pref, remote.name)] = metadata, exc
+
+    def _map(self, func, items):
+        """ func(item) for every item, concurrently if general.parallel_binary_check is defined
+        """
+        if not self._parallel or len(items) < 2:
+            return [func(item) for item in items]
+        thread_pool = ThreadPool(min(self._parallel, len(items)))
+        try:
+            return thread_pool.map(func, items)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+
+    def _pop_prefetched(self, pref, remote):
+        metadata, exc = self._prefetched.pop((pref, remote.name), (None, None))
+        if exc is not None:
+            raise exc
+        return metadata
+
+    def _get_package_info(self, pref, remote):
+        metadata = self._pop_prefetched(pref, remote)
+        if metadata is None or metadata.info is None:
+            return self._remote_manager.get_package_info(pref, remote)
+        return metadata.info, metadata.pref
+
+    def _get_package_manifest(self, pref, remote):
+        metadata = self._pop_prefetched(pref, remote)
+        if metadata is None or metadata.manifest is None:
+            return self._remote_manager.get_package_manifest(pref, remote)
+        return metadata.manifest, metadata.pref
+
     def _evaluate_is_cached(self, node, pref):
         previous_nodes = self._evaluated.get(pref)
         if previous_nodes:
@@ -346,19 +465,26 @@ class GraphBinariesAnalyzer(object):
     def evaluate_graph(self, deps_graph, build_mode, update, remotes, nodes_subset=None, root=None):
         default_package_id_mode = self._cache.config.default_package_id_mode
         default_python_requires_id_mode = self._cache.config.default_python_requires_id_mode
-        for node in deps_graph.ordered_iterate(nodes_subset=nodes_subset):
-            self._propagate_options(node)
-
-            self._compute_package_id(node, default_package_id_mode, default_python_requires_id_mode)
-            if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
-                continue
-            if node.package_id == PACKAGE_ID_UNKNOWN:
-                assert node.binary is None, "Node.binary should be None"
-                node.binary = BINARY_UNKNOWN
-                # annotate pattern, so unused patterns in --build are not displayed as errors
-                build_mode.forced(node.conanfile, node.ref)
-                continue
-            self._evaluate_node(node, build_mode, update, remotes)
+        for level in deps_graph.by_levels(nodes_subset):
+            # The nodes of the same level don't depend on each other, so all their package_ids
+            # can be computed first, and the remotes queried together for all of them
+            for node in level:
+                self._propagate_options(node)
+                self._compute_package_id(node, default_package_id_mode,
+                                         default_python_requires_id_mode)
+            self._prefetch_packages_metadata(level, build_mode, update, remotes)
+
+            for node in level:
+                if node.recipe in (RECIPE_CONSUMER, RECIPE_VIRTUAL):
+                    continue
+                if node.package_id == PACKAGE_ID_UNKNOWN:
+                    assert node.binary is None, "Node.binary should be None"
+                    node.binary = BINARY_UNKNOWN
+                    # annotate pattern, so unused patterns in --build are not displayed as errors
+                    build_mode.forced(node.conanfile, node.ref)
+                    continue
+                self._evaluate_node(node, build_mode, update, remotes)
+        self._prefetched.clear()
         deps_graph.mark_private_skippable(nodes_subset=nodes_subset, root=root)
 
     def reevaluate_node(self, node, remotes, build_mode, update):
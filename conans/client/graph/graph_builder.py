@@ -1,4 +1,5 @@
 import time
+from multiprocessing.pool import ThreadPool
 
 from conans.client.conanfile.configure import run_configure_method
 from conans.client.graph.graph import DepsGraph, Node, RECIPE_EDITABLE, CONTEXT_HOST, CONTEXT_BUILD
@@ -40,12 +41,15 @@ class DepsGraphBuilder(object):
                             expand_node(previous_node)                # recursion
     """
 
-    def __init__(self, proxy, output, loader, resolver, recorder):
+    def __init__(self, proxy, output, loader, resolver, recorder, parallel=None):
         self._proxy = proxy
         self._output = output
         self._loader = loader
         self._resolver = resolver
         self._recorder = recorder
+        # Number of threads to retrieve concurrently the recipes of the requirements of a node
+        self._parallel = parallel
+        self._prefetched = {}  # {ConanFileReference: (proxy result, exception)}
 
     def load_graph(self, root_node, check_updates, update, remotes, profile_host, profile_build,
                    graph_lock=None):
@@ -94,6 +98,7 @@ class DepsGraphBuilder(object):
             graph_lock.lock_node(node, build_requires, build_requires=True)
 
         self._resolve_ranges(graph, build_requires, scope, update, remotes)
+        self._prefetch_recipes(node, build_requires, check_updates, update, remotes)
 
         for br in build_requires:
             context_switch = bool(br.build_require_context == CONTEXT_BUILD)
@@ -120,6 +125,8 @@ class DepsGraphBuilder(object):
         # basic node configuration: calling configure() and requirements() and version-ranges
         new_options, new_reqs = self._get_node_requirements(node, graph, down_ref, down_options,
                                                             down_reqs, graph_lock, update, remotes)
+        self._prefetch_recipes(node, node.conanfile.requires.values(), check_updates, update,
+                               remotes)
 
         # Expand each one of the current requirements
         for require in node.conanfile.requires.values():
@@ -129,6 +136,56 @@ class DepsGraphBuilder(object):
                                  profile_build, new_reqs, new_options, graph_lock,
                                  context_switch=False)
 
+    def _prefetch_recipes(self, node, requires, check_updates, update, remotes):
+        """ retrieves concurrently the recipes of the requirements of "node" that will create new
+        nodes, so the later _resolve_recipe() calls, done in the usual depth-first order, don't
+        need to wait for the network. The graph is still computed sequentially, so it is the same
+        """
+        if not self._parallel:
+            return
+
+        refs = []
+        for require in requires:
+            if require.override:
+                continue
+            context = CONTEXT_BUILD if require.build_require_context == CONTEXT_BUILD \
+                else node.context
+            name = require.ref.name
+            previous = node.public_deps.get(name, context=context)
+            previous_closure = node.public_closure.get(name, context=context)
+            if previous and not ((require.build_require or require.private)
+                                 and not previous_closure):
+                continue  # Closing a diamond, the recipe is not retrieved
+            if require.ref not in self._prefetched and require.ref not in refs:
+                refs.append(require.ref)
+
+        if len(refs) < 2:
+            return
+
+        def _get_recipe(ref):
+            try:
+                return self._proxy.get_recipe(ref, check_updates, update, remotes,
+                                              self._recorder), None
+            except Exception as e:
+                return None, e
+
+        thread_pool = ThreadPool(min(self._parallel, len(refs)))
+        try:
+            results = thread_pool.map(_get_recipe, refs)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        self._prefetched.update(zip(refs, results))
+
+    def _get_recipe(self, ref, check_updates, update, remotes):
+        prefetched = self._prefetched.pop(ref, None)
+        if prefetched is None:
+            return self._proxy.get_recipe(ref, check_updates, update, remotes, self._recorder)
+        result, exc = prefetched
+        if exc is not None:
+            raise exc
+        return result
+
     def _resolve_ranges(self, graph, requires, consumer, update, remotes):
         for require in requires:
             if require.locked_id:  # if it is locked, nothing to resolved
@@ -356,8 +413,7 @@ class DepsGraphBuilder(object):
     def _resolve_recipe(self, current_node, dep_graph, requirement, check_updates,
                         update, remotes, profile, graph_lock, original_ref=None):
         try:
-            result = self._proxy.get_recipe(requirement.ref, check_updates, update,
-                                            remotes, self._recorder)
+            result = self._get_recipe(requirement.ref, check_updates, update, remotes)
         except ConanException as e:
             if current_node.ref:
                 self._output.error("Failed requirement '%s' from '%s'"
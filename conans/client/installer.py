@@ -173,6 +173,9 @@ class _PackageBuilder(object):
 
         update_package_metadata(prev, package_layout, package_id, pref.ref.revision)
 
+        blob_store = self._cache.blob_store
+        if blob_store:
+            blob_store.deduplicate(package_folder)
         if get_env("CONAN_READ_ONLY_CACHE", False):
             make_read_only(package_folder)
         # FIXME: Conan 2.0 Clear the registry entry (package ref)
@@ -362,14 +365,12 @@ class BinaryInstaller(object):
             Or read "http://docs.conan.io/en/latest/faq/troubleshooting.html#error-missing-prebuilt-package"
             ''' % (missing_pkgs, build_str)))
 
-    def _download(self, downloads, processed_package_refs):
-        """ executes the download of packages (both download and update), only once for a given
+    @staticmethod
+    def _download_nodes(downloads, processed_package_refs):
+        """ filter the nodes to be downloaded (both download and update), only once for a given
         PREF, even if node duplicated
         :param downloads: all nodes to be downloaded or updated, included repetitions
         """
-        if not downloads:
-            return
-
         download_nodes = []
         for node in downloads:
             pref = node.pref
@@ -378,23 +379,63 @@ class BinaryInstaller(object):
             processed_package_refs.add(pref)
             assert node.prev, "PREV for %s is None" % str(node.pref)
             download_nodes.append(node)
+        return download_nodes
 
-        def _download(n):
-            npref = n.pref
-            layout = self._cache.package_layout(npref.ref, n.conanfile.short_paths)
-            with layout.package_lock(npref):
-                self._download_pkg(layout, npref, n)
+    def _download_node(self, node):
+        pref = node.pref
+        layout = self._cache.package_layout(pref.ref, node.conanfile.short_paths)
+        with layout.package_lock(pref):
+            self._download_pkg(layout, pref, node)
 
-        parallel = self._cache.config.parallel_download
-        if parallel is not None:
-            self._out.info("Downloading binary packages in %s parallel threads" % parallel)
-            thread_pool = ThreadPool(parallel)
-            thread_pool.map(_download, [n for n in download_nodes])
-            thread_pool.close()
-            thread_pool.join()
-        else:
-            for node in download_nodes:
-                _download(node)
+    def _download(self, downloads, processed_package_refs):
+        """ executes the download of packages (both download and update) sequentially, before
+        anything is built
+        """
+        for node in self._download_nodes(downloads, processed_package_refs):
+            self._download_node(node)
+
+    def _download_async(self, thread_pool, downloads, processed_package_refs):
+        """ launches the download of packages in the thread pool, without waiting for them
+        :return: {pref: AsyncResult} of the launched downloads
+        """
+        pending = {}
+        for node in self._download_nodes(downloads, processed_package_refs):
+            pending[node.pref] = thread_pool.apply_async(self._download_node, (node, ))
+        return pending
+
+    @staticmethod
+    def _schedule(nodes_by_level, pending):
+        """ yields the nodes in an order in which all the dependencies of a node are yielded
+        before it. Among the nodes whose dependencies are already processed, it prioritizes the
+        ones that are not waiting for a download, so they can be built while the download of
+        the others finishes. When all of them are waiting, it blocks on the first one.
+        :param pending: {pref: AsyncResult} of the ongoing downloads
+        """
+        nodes = [node for level in nodes_by_level for node in level]
+        node_set = set(nodes)
+        missing_deps = {node: len(set(n for n in node.neighbors() if n in node_set))
+                        for node in nodes}
+        ready = [node for node in nodes if not missing_deps[node]]
+
+        def _download_done(n):
+            if n.binary not in (BINARY_UPDATE, BINARY_DOWNLOAD):
+                return True
+            result = pending.get(n.pref)
+            return result is None or result.ready()
+
+        while ready:
+            node = next((n for n in ready if _download_done(n)), ready[0])
+            ready.remove(node)
+            if node.binary in (BINARY_UPDATE, BINARY_DOWNLOAD):
+                result = pending.pop(node.pref, None)
+                if result is not None:
+                    result.get()  # waits for it, raising if the download failed
+            yield node
+            for dependant in set(node.inverse_neighbors()):
+                if dependant in missing_deps:
+                    missing_deps[dependant] -= 1
+                    if not missing_deps[dependant]:
+                        ready.append(dependant)
 
     def _download_pkg(self, layout, pref, node):
         conanfile = node.conanfile
@@ -412,33 +453,54 @@ class BinaryInstaller(object):
         missing, downloads = self._classify(nodes_by_level)
         self._raise_missing(missing)
         processed_package_refs = set()
-        self._download(downloads, processed_package_refs)
 
-        for level in nodes_by_level:
-            for node in level:
-                ref, conan_file = node.ref, node.conanfile
-                output = conan_file.output
-
-                self._propagate_info(node, using_build_profile)
-                if node.binary == BINARY_EDITABLE:
-                    self._handle_node_editable(node, graph_info)
-                    # Need a temporary package revision for package_revision_mode
-                    # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
-                    node.prev = "editable"
-                else:
-                    if node.binary == BINARY_SKIP:  # Privates not necessary
-                        continue
-                    assert ref.revision is not None, "Installer should receive RREV always"
-                    if node.binary == BINARY_UNKNOWN:
-                        self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
-                        if node.binary == BINARY_MISSING:
-                            self._raise_missing([node])
-                    _handle_system_requirements(conan_file, node.pref, self._cache, output)
-                    self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+        parallel = self._cache.config.parallel_download
+        if parallel is None:
+            self._download(downloads, processed_package_refs)
+            for level in nodes_by_level:
+                for node in level:
+                    self._handle_node(node, keep_build, graph_info, remotes, build_mode, update,
+                                      processed_package_refs, using_build_profile)
+        else:
+            # The downloads run in background threads, and every node is processed (built) as
+            # soon as its own binary and the ones of its dependencies are available
+            if downloads:
+                self._out.info("Downloading binary packages in %s parallel threads" % parallel)
+            thread_pool = ThreadPool(parallel)
+            try:
+                pending = self._download_async(thread_pool, downloads, processed_package_refs)
+                for node in self._schedule(nodes_by_level, pending):
+                    self._handle_node(node, keep_build, graph_info, remotes, build_mode, update,
+                                      processed_package_refs, using_build_profile)
+            finally:
+                thread_pool.close()
+                thread_pool.join()
 
         # Finally, propagate information to root node (ref=None)
         self._propagate_info(root_node, using_build_profile)
 
+    def _handle_node(self, node, keep_build, graph_info, remotes, build_mode, update,
+                     processed_package_refs, using_build_profile):
+        ref, conan_file = node.ref, node.conanfile
+        output = conan_file.output
+
+        self._propagate_info(node, using_build_profile)
+        if node.binary == BINARY_EDITABLE:
+            self._handle_node_editable(node, graph_info)
+            # Need a temporary package revision for package_revision_mode
+            # Cannot be PREV_UNKNOWN otherwise the consumers can't compute their packageID
+            node.prev = "editable"
+        else:
+            if node.binary == BINARY_SKIP:  # Privates not necessary
+                return
+            assert ref.revision is not None, "Installer should receive RREV always"
+            if node.binary == BINARY_UNKNOWN:
+                self._binaries_analyzer.reevaluate_node(node, remotes, build_mode, update)
+                if node.binary == BINARY_MISSING:
+                    self._raise_missing([node])
+            _handle_system_requirements(conan_file, node.pref, self._cache, output)
+            self._handle_node_cache(node, keep_build, processed_package_refs, remotes)
+
     def _handle_node_editable(self, node, graph_info):
         # Get source of information
         package_layout = self._cache.package_layout(node.ref)
@@ -544,12 +606,13 @@ class BinaryInstaller(object):
         conan_file = node.conanfile
         # FIXME: Not the best place to assign the _conan_using_build_profile
         conan_file._conan_using_build_profile = using_build_profile
-        transitive = [it for it in node.transitive_closure.values()]
+        # Sets, these are checked for every node of the closure
+        transitive = set(node.transitive_closure.values())
 
-        br_host = []
+        br_host = set()
         for it in node.dependencies:
             if it.require.build_require_context == CONTEXT_HOST:
-                br_host.extend(it.dst.transitive_closure.values())
+                br_host.update(it.dst.transitive_closure.values())
 
         # Initialize some members if we are using different contexts
         if using_build_profile:
@@ -580,7 +643,7 @@ class BinaryInstaller(object):
 
         # Update the info but filtering the package values that not apply to the subtree
         # of this current node and its dependencies.
-        subtree_libnames = [node.ref.name for node in node_order]
+        subtree_libnames = set(node.ref.name for node in node_order)
         add_env_conaninfo(conan_file, subtree_libnames)
 
     def _call_package_info(self, conanfile, package_folder, ref):
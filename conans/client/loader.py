@@ -1,10 +1,13 @@
 import fnmatch
 import imp
 import inspect
+import marshal
 import os
 import sys
+import types
 import uuid
 
+import six
 import yaml
 
 from conans.client.conf.required_version import validate_conan_version
@@ -20,13 +23,18 @@ from conans.model.settings import Settings
 from conans.model.values import Values
 from conans.paths import DATA_YML
 from conans.util.conan_v2_mode import CONAN_V2_MODE_ENVVAR
-from conans.util.files import load
+from conans.util.files import load, mkdir
+from conans.util.log import logger
+from conans.util.sha import sha256
 
 
 class ConanFileLoader(object):
 
-    def __init__(self, runner, output, python_requires, generator_manager=None, pyreq_loader=None):
+    def __init__(self, runner, output, python_requires, generator_manager=None, pyreq_loader=None,
+                 compiled_folder=None):
         self._runner = runner
+        # To store the compiled recipes and parsed conandata.yml among runs
+        self._compiled_folder = compiled_folder
         self._generator_manager = generator_manager
         self._output = output
         self._pyreq_loader = pyreq_loader
@@ -54,7 +62,7 @@ class ConanFileLoader(object):
         try:
             self._python_requires.valid = True
             module, conanfile = parse_conanfile(conanfile_path, self._python_requires,
-                                                self._generator_manager)
+                                                self._generator_manager, self._compiled_folder)
             self._python_requires.valid = False
 
             self._python_requires.locked_versions = None
@@ -96,7 +104,7 @@ class ConanFileLoader(object):
             to the provided generator list
             @param conanfile_module: the module to be processed
             """
-        conanfile_module, module_id = _parse_conanfile(conanfile_path)
+        conanfile_module, module_id = _parse_conanfile(conanfile_path, self._compiled_folder)
         for name, attr in conanfile_module.__dict__.items():
             if (name.startswith("_") or not inspect.isclass(attr) or
                     attr.__dict__.get("__module__") != module_id):
@@ -104,18 +112,28 @@ class ConanFileLoader(object):
             if issubclass(attr, Generator) and attr != Generator:
                 self._generator_manager.add(attr.__name__, attr, custom=True)
 
-    @staticmethod
-    def _load_data(conanfile_path):
+    def _load_data(self, conanfile_path):
         data_path = os.path.join(os.path.dirname(conanfile_path), DATA_YML)
         if not os.path.exists(data_path):
             return None
 
+        text = load(data_path)
+        compiled_path = None
+        if self._compiled_folder:
+            compiled_path = _compiled_path(self._compiled_folder, text.encode("utf-8"), "data")
+            data = _load_compiled(compiled_path)
+            if data is not None:
+                return data
+
         try:
-            data = yaml.safe_load(load(data_path))
+            data = yaml.safe_load(text)
         except Exception as e:
             raise ConanException("Invalid yml format at {}: {}".format(DATA_YML, e))
 
-        return data or {}
+        data = data or {}
+        if compiled_path:
+            _save_compiled(compiled_path, data)  # If it only contains basic python types
+        return data
 
     def load_named(self, conanfile_path, name, version, user, channel, lock_python_requires=None):
         """ loads the basic conanfile object and evaluates its name and version
@@ -338,9 +356,9 @@ def _parse_module(conanfile_module, module_id, generator_manager):
     return result
 
 
-def parse_conanfile(conanfile_path, python_requires, generator_manager):
+def parse_conanfile(conanfile_path, python_requires, generator_manager, compiled_folder=None):
     with python_requires.capture_requires() as py_requires:
-        module, filename = _parse_conanfile(conanfile_path)
+        module, filename = _parse_conanfile(conanfile_path, compiled_folder)
         try:
             conanfile = _parse_module(module, filename, generator_manager)
 
@@ -362,7 +380,66 @@ def parse_conanfile(conanfile_path, python_requires, generator_manager):
             raise ConanException("%s: %s" % (conanfile_path, str(e)))
 
 
-def _parse_conanfile(conan_file_path):
+def _compiled_path(compiled_folder, contents, kind):
+    # The bytecode depends on the python version, and it contains the file name
+    key = sha256(imp.get_magic() + kind.encode("utf-8") + b"\n" + contents)
+    return os.path.join(compiled_folder, key[:2], "%s.%s" % (key, kind))
+
+
+def _load_compiled(compiled_path):
+    try:
+        with open(compiled_path, "rb") as f:
+            return marshal.load(f)
+    except (IOError, OSError, EOFError, ValueError, TypeError):  # Not cached or broken
+        return None
+
+
+def _save_compiled(compiled_path, value):
+    try:
+        contents = marshal.dumps(value)
+        mkdir(os.path.dirname(compiled_path))
+        tmp_path = "%s.%s" % (compiled_path, uuid.uuid4().hex)
+        with open(tmp_path, "wb") as f:
+            f.write(contents)
+        os.rename(tmp_path, compiled_path)  # Never read partially written
+    except (IOError, OSError, ValueError) as e:
+        logger.debug("Cannot store compiled file %s: %s" % (compiled_path, str(e)))
+
+
+def _load_source(module_id, conan_file_path, compiled_folder):
+    """ the same as imp.load_source(), but reusing the bytecode of the previous runs, stored in
+    compiled_folder
+    """
+    with open(conan_file_path, "rb") as f:
+        source = f.read()
+    code = compiled_path = None
+    if compiled_folder:
+        file_key = conan_file_path
+        if isinstance(file_key, six.text_type):
+            file_key = file_key.encode("utf-8")
+        compiled_path = _compiled_path(compiled_folder, file_key + b"\n" + source, "pyc")
+        code = _load_compiled(compiled_path)
+    if code is None:
+        code = compile(source, conan_file_path, "exec", dont_inherit=True)
+        if compiled_path:
+            _save_compiled(compiled_path, code)
+
+    module = types.ModuleType(module_id)
+    module.__file__ = conan_file_path
+    if six.PY3:  # The same module attributes that imp.load_source() sets
+        from importlib.util import spec_from_file_location
+        module.__spec__ = spec_from_file_location(module_id, conan_file_path)
+        module.__loader__ = module.__spec__.loader
+    sys.modules[module_id] = module
+    try:
+        six.exec_(code, module.__dict__)
+    except BaseException:
+        del sys.modules[module_id]
+        raise
+    return module
+
+
+def _parse_conanfile(conan_file_path, compiled_folder=None):
     """ From a given path, obtain the in memory python import module
     """
 
@@ -373,10 +450,10 @@ def _parse_conanfile(conan_file_path):
     current_dir = os.path.dirname(conan_file_path)
     sys.path.insert(0, current_dir)
     try:
-        old_modules = list(sys.modules.keys())
+        old_modules = set(sys.modules)
         with chdir(current_dir):
             sys.dont_write_bytecode = True
-            loaded = imp.load_source(module_id, conan_file_path)
+            loaded = _load_source(module_id, conan_file_path, compiled_folder)
             sys.dont_write_bytecode = False
 
         required_conan_version = getattr(loaded, "required_conan_version", None)
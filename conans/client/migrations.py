@@ -10,11 +10,12 @@ from conans.client.conf.config_installer import _ConfigOrigin, _save_configs
 from conans.client.tools import replace_in_file
 from conans.errors import ConanException
 from conans.migrations import Migrator
+from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.package_metadata import PackageMetadata
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.model.version import Version
-from conans.paths import CONANFILE
+from conans.paths import CONANFILE, CONANINFO
 from conans.paths import EXPORT_SOURCES_DIR_OLD
 from conans.paths import PACKAGE_METADATA
 from conans.paths.package_layouts.package_cache_layout import PackageCacheLayout
@@ -110,6 +111,9 @@ class ClientMigrator(Migrator):
         if old_version < Version("1.26.0"):
             migrate_editables_use_conanfile_name(self.cache, self.out)
 
+        if old_version < Version("1.31.0"):
+            _migrate_packages_summary(self.cache, self.out)
+
 
 def _get_refs(cache):
     folders = list_folder_subdirs(cache.store, 4)
@@ -181,6 +185,33 @@ def _migrate_full_metadata(cache, out):
                                  ":{}".format(ref, e))
 
 
+def _migrate_packages_summary(cache, out):
+    out.warn("Migration: Generating the packages summaries")
+    for ref in _get_refs(cache):
+        try:
+            base_folder = os.path.normpath(os.path.join(cache.store, ref.dir_repr()))
+            layout = PackageCacheLayout(base_folder=base_folder, ref=ref, short_paths=None,
+                                        no_lock=True)
+            prefs = _get_prefs(layout)
+            if not prefs or not os.path.exists(layout.package_metadata()):
+                continue
+            metadata = layout.load_metadata()
+            with layout.update_packages_summary() as summary:
+                for pref in prefs:
+                    package_metadata = metadata.packages[pref.id]
+                    info_path = os.path.join(layout.package(pref), CONANINFO)
+                    if not package_metadata.revision or not os.path.exists(info_path):
+                        continue
+                    info = ConanInfo.loads(load(info_path))
+                    summary.update_package(pref.id, package_metadata.revision,
+                                           package_metadata.recipe_revision,
+                                           info.serialize_min())
+        except Exception as e:
+            raise ConanException("Something went wrong while generating the packages summary "
+                                 "files in the cache, please try to fix the issue or wipe the "
+                                 "cache: {}:{}".format(ref, e))
+
+
 def _migrate_create_metadata(cache, out):
     out.warn("Migration: Generating missing metadata files")
     refs = _get_refs(cache)
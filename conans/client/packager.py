@@ -2,6 +2,7 @@ import os
 
 from conans.client.file_copier import FileCopier, report_copied_files
 from conans.model.manifest import FileTreeManifest
+from conans.model.ref import PackageReference
 from conans.paths import CONANINFO
 from conans.util.files import mkdir, save
 
@@ -39,6 +40,7 @@ def update_package_metadata(prev, layout, package_id, rrev):
     with layout.update_metadata() as metadata:
         metadata.packages[package_id].revision = prev
         metadata.packages[package_id].recipe_revision = rrev
+    layout.summarize_package(PackageReference(layout.ref, package_id, prev), rrev)
 
 
 def report_files_from_manifest(output, manifest):
@@ -9,6 +9,7 @@ from conans import DEFAULT_REVISION_V1
 from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanConnectionError, ConanException, NotFoundException, \
     NoRestV2Available, PackageNotFoundException
+from conans.model.manifest import FileTreeManifest
 from conans.paths import EXPORT_SOURCES_DIR_OLD, \
     EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME, rm_conandir
 from conans.search.search import filter_packages
@@ -44,16 +45,20 @@ class RemoteManager(object):
         assert pref.revision, "get_package_snapshot requires PREV"
         return self._call_remote(remote, "get_package_snapshot", pref)
 
-    def upload_recipe(self, ref, files_to_upload, deleted, remote, retry, retry_wait):
+    def upload_recipe(self, ref, files_to_upload, deleted, remote, retry, retry_wait,
+                      thread_pool=None):
+        """ the files are uploaded concurrently in the thread_pool if it is defined """
         assert ref.revision, "upload_recipe requires RREV"
         self._call_remote(remote, "upload_recipe", ref, files_to_upload, deleted,
-                          retry, retry_wait)
+                          retry, retry_wait, thread_pool)
 
-    def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait):
+    def upload_package(self, pref, files_to_upload, deleted, remote, retry, retry_wait,
+                       thread_pool=None):
+        """ the files are uploaded concurrently in the thread_pool if it is defined """
         assert pref.ref.revision, "upload_package requires RREV"
         assert pref.revision, "upload_package requires PREV"
         self._call_remote(remote, "upload_package", pref,
-                          files_to_upload, deleted, retry, retry_wait)
+                          files_to_upload, deleted, retry, retry_wait, thread_pool)
 
     def get_recipe_manifest(self, ref, remote):
         ref = self._resolve_latest_ref(ref, remote)
@@ -69,6 +74,15 @@ class RemoteManager(object):
         pref = self._resolve_latest_pref(pref, remote)
         return self._call_remote(remote, "get_package_info", pref), pref
 
+    def get_packages_metadata(self, prefs, remote):
+        """ Read the latest revision, ConanInfo, manifest and file list of several packages with
+        a single request. Returns None if the remote doesn't support it
+        """
+        try:
+            return self._call_remote(remote, "get_packages_metadata", prefs)
+        except NoRestV2Available:
+            return None
+
     def get_recipe(self, ref, remote):
         """
         Read the conans from remotes
@@ -139,9 +153,7 @@ class RemoteManager(object):
             snapshot = self._call_remote(remote, "get_package_snapshot", pref)
             if not is_package_snapshot_complete(snapshot):
                 raise PackageNotFoundException(pref)
-            zipped_files = self._call_remote(remote, "get_package", pref, dest_folder)
-
-            package_checksums = calc_files_checksum(zipped_files)
+            zipped_files, package_checksums = self._get_package_files(pref, dest_folder, remote)
 
             with self._cache.package_layout(pref.ref).update_metadata() as metadata:
                 metadata.packages[pref.id].revision = pref.revision
@@ -150,9 +162,18 @@ class RemoteManager(object):
 
             duration = time.time() - t1
             log_package_download(pref, duration, remote, zipped_files)
+            tgz_cache = self._cache.tgz_cache
+            if tgz_cache and PACKAGE_TGZ_NAME in zipped_files:
+                # Kept to upload it later without compressing the package again
+                manifest = FileTreeManifest.load(dest_folder)
+                tgz_cache.store(manifest.summary_hash, zipped_files[PACKAGE_TGZ_NAME])
             unzip_and_get_files(zipped_files, dest_folder, PACKAGE_TGZ_NAME, output=self._output)
             # Issue #214 https://github.com/conan-io/conan/issues/214
             touch_folder(dest_folder)
+            self._cache.package_layout(pref.ref).summarize_package(pref, pref.ref.revision)
+            blob_store = self._cache.blob_store
+            if blob_store:
+                blob_store.deduplicate(dest_folder)
             if get_env("CONAN_READ_ONLY_CACHE", False):
                 make_read_only(dest_folder)
             recorder.package_downloaded(pref, remote.url)
@@ -174,6 +195,27 @@ class RemoteManager(object):
 
         return pref
 
+    def _get_package_files(self, pref, dest_folder, remote):
+        """ downloads the package files, returning them and their checksums. If configured, the
+        package tgz is extracted while being downloaded, and it is not part of the returned files
+        """
+        config = self._cache.config
+        if config.stream_package_download and not config.download_cache and \
+                not config.tgz_cache:
+            try:
+                files, tgz_checksums = self._call_remote(remote, "get_package_extracted", pref,
+                                                         dest_folder)
+            except NoRestV2Available:
+                pass  # Only the revisions API can stream it, fallback to the regular download
+            else:
+                package_checksums = calc_files_checksum(files)
+                if tgz_checksums:
+                    package_checksums[PACKAGE_TGZ_NAME] = tgz_checksums
+                return files, package_checksums
+
+        zipped_files = self._call_remote(remote, "get_package", pref, dest_folder)
+        return zipped_files, calc_files_checksum(zipped_files)
+
     def search_recipes(self, remote, pattern=None, ignorecase=True):
         """
         returns (dict str(ref): {packages_info}
@@ -4,7 +4,7 @@ from conans.client.cache.remote_registry import Remote
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
 from conans.errors import NotFoundException
 from conans.model.ref import ConanFileReference, PackageReference, check_valid_ref
-from conans.paths import SYSTEM_REQS, rm_conandir
+from conans.paths import PACKAGES_SUMMARY, SYSTEM_REQS, rm_conandir
 from conans.search.search import filter_outdated, search_packages, search_recipes
 from conans.util.log import logger
 
@@ -69,6 +69,8 @@ class DiskRemover(object):
                 self._remove(os.path.join(path, package_id), package_layout.ref,
                              "package folder:%s" % package_id)
             self._remove(path, package_layout.ref, "packages")
+            self._remove_file(package_layout.packages_summary(), package_layout.ref,
+                              PACKAGES_SUMMARY)
             self._remove_file(package_layout.system_reqs(), package_layout.ref, SYSTEM_REQS)
         else:
             for package_id in ids_filter:  # remove just the specified packages
@@ -126,9 +128,14 @@ class ConanRemover(object):
             with package_layout.update_metadata() as metadata:
                 for package_id in package_ids:
                     metadata.clear_package(package_id)
+            if package_ids:
+                with package_layout.update_packages_summary() as summary:
+                    summary.remove_packages(package_ids)
 
         if not src and build_ids is None and package_ids is None:
             remover.remove(package_layout, output=self._user_io.out)
+            if package_layout.cache_index:
+                package_layout.cache_index.remove_recipe(ref)
 
     def remove(self, pattern, remote_name, src=None, build_ids=None, package_ids_filter=None,
                force=False, packages_query=None, outdated=False):
@@ -229,6 +236,9 @@ class ConanRemover(object):
 
         if not remote_name:
             self._cache.delete_empty_dirs(deleted_refs)
+            blob_store = self._cache.blob_store
+            if blob_store and deleted_refs:
+                blob_store.prune()
 
     def _ask_permission(self, ref, src, build_ids, package_ids_filter, force):
         def stringlist(alist):
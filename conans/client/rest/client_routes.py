@@ -212,6 +212,10 @@ class ClientV2Router(ClientCommonRouter):
         """get revisions for a package url"""
         return self.base_url + _format_pref(self.routes.package_revisions, pref)
 
+    def batch_metadata(self):
+        """Get the metadata of many recipes and packages in one request"""
+        return self.base_url + self.routes.batch_metadata
+
     def package_latest(self, pref):
         """Get the latest of a package"""
         assert pref.ref.revision is not None, "Cannot get the latest package without RREV"
@@ -10,6 +10,7 @@ from requests.adapters import HTTPAdapter
 
 from conans import __version__ as client_version
 from conans.util.files import save
+from conans.util.log import logger
 from conans.util.tracer import log_client_rest_api_call
 
 # Capture SSL warnings as pointed out here:
@@ -21,13 +22,19 @@ logging.captureWarnings(True)
 class ConanRequester(object):
 
     def __init__(self, config, http_requester=None):
+        self._adapter = None
         if http_requester:
             self._http_requester = http_requester
         else:
             self._http_requester = requests.Session()
-            adapter = HTTPAdapter(max_retries=config.retry)
-            self._http_requester.mount("http://", adapter)
-            self._http_requester.mount("https://", adapter)
+            # The connection pool of every remote host keeps alive as many connections as
+            # threads can use them concurrently, otherwise they are discarded and re-opened
+            pool_size = config.connection_pool_size
+            self._adapter = HTTPAdapter(max_retries=config.retry, pool_maxsize=pool_size)
+            self._http_requester.mount("http://", self._adapter)
+            self._http_requester.mount("https://", self._adapter)
+
+        self._keep_alive = config.http_keep_alive
 
         self._timeout_seconds = config.request_timeout
         self.proxies = config.proxies or {}
@@ -81,6 +88,8 @@ class ConanRequester(object):
             kwargs["timeout"] = self._timeout_seconds
         if not kwargs.get("headers"):
             kwargs["headers"] = {}
+        if not self._keep_alive and not kwargs["headers"].get("Connection"):
+            kwargs["headers"]["Connection"] = "close"
 
         # Only set User-Agent if none was provided
         if not kwargs["headers"].get("User-Agent"):
@@ -90,6 +99,20 @@ class ConanRequester(object):
 
         return kwargs
 
+    def connection_stats(self):
+        """ {"host:port": (opened connections, requests)} of the connection pools, the
+        requests that didn't open a new connection reused a kept-alive one
+        """
+        if self._adapter is None:
+            return {}
+        ret = {}
+        pools = self._adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                ret["%s:%s" % (pool.host, pool.port)] = (pool.num_connections, pool.num_requests)
+        return ret
+
     def get(self, url, **kwargs):
         return self._call_method("get", url, **kwargs)
 
@@ -116,6 +139,9 @@ class ConanRequester(object):
             tmp = getattr(self._http_requester, method)(url, **all_kwargs)
             duration = time.time() - t1
             log_client_rest_api_call(url, method.upper(), duration, all_kwargs.get("headers"))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("REST: connection pools (opened connections, requests): %s"
+                             % self.connection_stats())
             return tmp
         finally:
             if popped:
@@ -1,7 +1,11 @@
+import hashlib
+import json
 import os
 import re
 import time
 import traceback
+from multiprocessing.pool import ThreadPool
+from threading import Lock
 
 import six
 
@@ -9,7 +13,7 @@ from conans.client.rest import response_to_str
 from conans.errors import AuthenticationException, ConanConnectionError, ConanException, \
     NotFoundException, ForbiddenException, RequestErrorException
 from conans.util import progress_bar
-from conans.util.files import mkdir
+from conans.util.files import load, mkdir, rmdir, save, tar_extract
 from conans.util.log import logger
 from conans.util.tracer import log_download
 
@@ -44,15 +48,21 @@ class FileDownloader(object):
         return _call_with_retry(self._output, retry, retry_wait, self._download_file, url, auth,
                                 headers, file_path)
 
-    def _download_file(self, url, auth, headers, file_path, try_resume=False):
-        t1 = time.time()
-        if try_resume and file_path and os.path.exists(file_path):
-            range_start = os.path.getsize(file_path)
-            headers = headers.copy() if headers else {}
-            headers["range"] = "bytes={}-".format(range_start)
-        else:
-            range_start = 0
+    def download_extract(self, url, dest_folder, auth=None, retry=None, retry_wait=None,
+                         headers=None):
+        """ downloads a tgz file, extracting it into dest_folder while it is being received,
+        without storing it.
+        :return: {"md5": xxx, "sha1": xxx} checksums of the downloaded tgz file
+        """
+        retry = retry if retry is not None else self._config.retry
+        retry = retry if retry is not None else 2
+        retry_wait = retry_wait if retry_wait is not None else self._config.retry_wait
+        retry_wait = retry_wait if retry_wait is not None else 0
 
+        return _call_with_retry(self._output, retry, retry_wait, self._download_extract, url,
+                                auth, headers, dest_folder)
+
+    def _get_response(self, url, auth, headers):
         try:
             response = self._requester.get(url, stream=True, verify=self._verify_ssl, auth=auth,
                                            headers=headers)
@@ -70,6 +80,47 @@ class FileDownloader(object):
             elif response.status_code == 401:
                 raise AuthenticationException()
             raise ConanException("Error %d downloading file %s" % (response.status_code, url))
+        return response
+
+    def _download_extract(self, url, auth, headers, dest_folder):
+        t1 = time.time()
+        response = self._get_response(url, auth, headers)
+        try:
+            logger.debug("DOWNLOAD: %s" % url)
+            total_length = int(response.headers.get("Content-Length", 0))
+            description = "Downloading {}".format(url.split("?")[0].rsplit("/", 1)[-1])
+            progress = progress_bar.Progress(total_length, self._output, description)
+            reader = _ChunksReader(progress.update(response.iter_content(1024 * 100)))
+            tar_extract(reader, dest_folder, stream=True)
+            reader.read()  # The tar end-of-archive blocks might not be consumed by tarfile
+            gzip = (response.headers.get("content-encoding") == "gzip")
+            response.close()
+            if reader.size != total_length and not gzip:
+                raise ConanException("Transfer interrupted before complete: %s < %s"
+                                     % (reader.size, total_length))
+
+            duration = time.time() - t1
+            log_download(url, duration)
+            return {"md5": reader.md5.hexdigest(), "sha1": reader.sha1.hexdigest()}
+        except Exception as e:
+            logger.debug(e.__class__)
+            logger.debug(traceback.format_exc())
+            raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
+                                       % str(e))
+
+    def _download_file(self, url, auth, headers, file_path, try_resume=False):
+        t1 = time.time()
+        if try_resume and file_path and os.path.exists(file_path):
+            range_start = os.path.getsize(file_path)
+            headers = headers.copy() if headers else {}
+            headers["range"] = "bytes={}-".format(range_start)
+        else:
+            range_start = 0
+
+        response = self._get_response(url, auth, headers)
+        if not range_start and file_path and self._segmented(response):
+            response.close()
+            return self._download_segments(url, auth, headers, file_path, response.headers, t1)
 
         def read_response(size):
             for chunk in response.iter_content(size):
@@ -143,6 +194,153 @@ class FileDownloader(object):
             raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
                                        % str(e))
 
+    def _segmented(self, response):
+        """ if the file of the response has to be downloaded with parallel Range requests
+        """
+        # The configurations of some callers don't define them
+        segments = getattr(self._config, "download_segments", None)
+        if not segments or segments < 2:
+            return False
+        if response.headers.get("Accept-Ranges") != "bytes":
+            return False
+        if response.headers.get("content-encoding") == "gzip":
+            return False
+        total_length = int(response.headers.get("Content-Length") or 0)
+        return total_length >= max(self._config.segmented_download_min_size, segments)
+
+    def _download_segments(self, url, auth, headers, file_path, response_headers, t1):
+        """ downloads the file with parallel Range requests, every segment in a different file
+        of the "<file_path>.segments" folder, that are joined at the end. The downloaded parts
+        of the segments are kept if the download fails, so it can be resumed later, also by
+        other processes, as long as the server file (size, ETag, Last-Modified) is the same
+        """
+        total_length = int(response_headers["Content-Length"])
+        segments = self._config.download_segments
+        segment_size = -(-total_length // segments)  # ceil
+        ranges = [(start, min(start + segment_size, total_length) - 1)
+                  for start in range(0, total_length, segment_size)]
+
+        segments_folder = file_path + ".segments"
+        remote_file = {"size": total_length,
+                       "etag": response_headers.get("ETag"),
+                       "last_modified": response_headers.get("Last-Modified")}
+        remote_file_path = os.path.join(segments_folder, "file.json")
+        try:
+            if json.loads(load(remote_file_path)) != remote_file:
+                rmdir(segments_folder)  # The server file changed, the segments are useless
+        except (IOError, OSError, ValueError):
+            rmdir(segments_folder)
+        save(remote_file_path, json.dumps(remote_file))
+
+        def segment_path(index):
+            return os.path.join(segments_folder, str(index))
+
+        downloaded = sum(os.path.getsize(segment_path(i)) for i in range(len(ranges))
+                         if os.path.exists(segment_path(i)))
+        action = "Downloading" if not downloaded else "Continuing download of"
+        description = "{} {}".format(action, os.path.basename(file_path))
+        progress = progress_bar.Progress(total_length, self._output, description)
+        progress.initial_value(downloaded)
+        progress_lock = Lock()
+
+        def download_segment(index):
+            path = segment_path(index)
+            start, end = ranges[index]
+            downloaded_size = os.path.getsize(path) if os.path.exists(path) else 0
+            if start + downloaded_size > end:
+                return
+            segment_headers = headers.copy() if headers else {}
+            segment_headers["range"] = "bytes={}-{}".format(start + downloaded_size, end)
+            response = self._get_response(url, auth, segment_headers)
+            try:
+                if response.status_code != 206:
+                    raise ConanException("Error in segmented download from %s\n"
+                                         "Range requests not supported" % url)
+                with open(path, "ab") as file_handler:
+                    for chunk in response.iter_content(1024 * 100):
+                        file_handler.write(chunk)
+                        downloaded_size += len(chunk)
+                        with progress_lock:
+                            progress.increment(len(chunk))
+            finally:
+                response.close()
+            if start + downloaded_size != end + 1:
+                raise ConanException("Transfer interrupted before complete: %s < %s"
+                                     % (downloaded_size, end + 1 - start))
+
+        def download_segment_result(index):
+            try:
+                download_segment(index)
+            except Exception as exc:
+                logger.debug(traceback.format_exc())
+                return exc
+
+        thread_pool = ThreadPool(len(ranges))
+        try:
+            errors = [e for e in thread_pool.map(download_segment_result, range(len(ranges)))
+                      if e is not None]
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        progress.pb_close()
+        if errors:
+            for error in errors:
+                # These ones are not retried, the segments would be requested again in vain
+                if isinstance(error, (NotFoundException, ForbiddenException,
+                                      AuthenticationException)):
+                    raise error
+            raise ConanConnectionError("Download failed, check server, possibly try again\n%s"
+                                       % str(errors[0]))
+
+        with open(file_path, "wb") as file_handler:
+            for index in range(len(ranges)):
+                with open(segment_path(index), "rb") as segment_handler:
+                    while True:
+                        chunk = segment_handler.read(1024 * 1024)
+                        if not chunk:
+                            break
+                        file_handler.write(chunk)
+        rmdir(segments_folder)
+
+        duration = time.time() - t1
+        log_download(url, duration)
+
+
+class _ChunksReader(object):
+    """ Read-only file-like object over an iterator of chunks of bytes, as the one of a streamed
+    HTTP response, that computes the checksums of the contents while they are read
+    """
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._chunk = b""
+        self._pos = 0
+        self.size = 0
+        self.md5 = hashlib.md5()
+        self.sha1 = hashlib.sha1()
+
+    def read(self, size=-1):
+        parts = []
+        remaining = size
+        while remaining != 0:
+            if self._pos >= len(self._chunk):
+                self._chunk = next(self._chunks, None)
+                self._pos = 0
+                if self._chunk is None:
+                    self._chunk = b""
+                    break
+                continue
+            end = len(self._chunk) if remaining < 0 else self._pos + remaining
+            part = self._chunk[self._pos:end]
+            self._pos += len(part)
+            if remaining > 0:
+                remaining -= len(part)
+            parts.append(part)
+        data = b"".join(parts)
+        self.size += len(data)
+        self.md5.update(data)
+        self.sha1.update(data)
+        return data
+
 
 def _call_with_retry(out, retry, retry_wait, method, *args, **kwargs):
     for counter in range(retry + 1):
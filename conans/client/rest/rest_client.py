@@ -1,7 +1,7 @@
-from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS
+from conans import CHECKSUM_DEPLOY, REVISIONS, ONLY_V2, OAUTH_TOKEN, MATRIX_PARAMS, BATCH_METADATA
 from conans.client.rest.rest_client_v1 import RestV1Methods
 from conans.client.rest.rest_client_v2 import RestV2Methods
-from conans.errors import OnlyV2Available, AuthenticationException
+from conans.errors import OnlyV2Available, AuthenticationException, NoRestV2Available
 from conans.search.search import filter_packages
 from conans.util.log import logger
 
@@ -82,6 +82,12 @@ class RestApiClient(object):
     def get_package_info(self, pref):
         return self._get_api().get_package_info(pref)
 
+    def get_packages_metadata(self, prefs):
+        api = self._get_api()
+        if not self._capable(BATCH_METADATA):
+            raise NoRestV2Available("The remote doesn't support batched metadata requests")
+        return api.get_packages_metadata(prefs)
+
     def get_recipe(self, ref, dest_folder):
         return self._get_api().get_recipe(ref, dest_folder)
 
@@ -94,6 +100,9 @@ class RestApiClient(object):
     def get_package(self, pref, dest_folder):
         return self._get_api().get_package(pref, dest_folder)
 
+    def get_package_extracted(self, pref, dest_folder):
+        return self._get_api().get_package_extracted(pref, dest_folder)
+
     def get_package_snapshot(self, ref):
         return self._get_api().get_package_snapshot(ref)
 
@@ -103,11 +112,14 @@ class RestApiClient(object):
     def get_package_path(self, pref, path):
         return self._get_api().get_package_path(pref, path)
 
-    def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait):
-        return self._get_api().upload_recipe(ref, files_to_upload, deleted, retry, retry_wait)
+    def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait, thread_pool=None):
+        return self._get_api().upload_recipe(ref, files_to_upload, deleted, retry, retry_wait,
+                                             thread_pool)
 
-    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
-        return self._get_api().upload_package(pref, files_to_upload, deleted, retry, retry_wait)
+    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait,
+                       thread_pool=None):
+        return self._get_api().upload_package(pref, files_to_upload, deleted, retry, retry_wait,
+                                              thread_pool)
 
     def authenticate(self, user, password):
         api_v1 = RestV1Methods(self._remote_url, self._token, self._custom_headers, self._output,
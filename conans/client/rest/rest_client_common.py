@@ -1,4 +1,5 @@
 import json
+import threading
 
 from requests.auth import AuthBase, HTTPBasicAuth
 
@@ -7,6 +8,7 @@ from conans.errors import (EXCEPTION_CODE_MAPPING, ConanException,
                            AuthenticationException, RecipeNotFoundException,
                            PackageNotFoundException)
 from conans.model.ref import ConanFileReference
+from conans.paths import CONAN_MANIFEST
 from conans.util.files import decode_text
 from conans.util.log import logger
 
@@ -22,6 +24,57 @@ class JWTAuth(AuthBase):
         return request
 
 
+def _run_tasks(thread_pool, func, items):
+    """ [func(item) for item in items], run concurrently in the thread_pool. The calling thread
+    can be a thread of the same pool, so it never waits for the tasks that didn't start yet,
+    it runs them itself. The concurrency is bounded by the size of the pool
+    """
+    if thread_pool is None or len(items) < 2:
+        return [func(item) for item in items]
+
+    lock = threading.Lock()
+    started = set()
+
+    def start(index):
+        with lock:
+            if index in started:
+                return False
+            started.add(index)
+            return True
+
+    def run_in_pool(index):
+        if start(index):
+            return func(items[index])
+
+    pending = [(index, thread_pool.apply_async(run_in_pool, (index, )))
+               for index in range(1, len(items))]
+    results = [None] * len(items)
+    run_by_pool = []
+    for index, item in enumerate(items):
+        if start(index):
+            results[index] = func(item)
+        else:
+            run_by_pool.append(index)
+    for index, async_result in pending:
+        if index in run_by_pool:  # Already running, it doesn't wait for the queued tasks
+            results[index] = async_result.get()
+    return results
+
+
+def upload_files_in_order(files, upload_file, thread_pool=None):
+    """ yields (filename, upload_file(filename)) of all the files. The conan_package.tgz and
+    conan_export.tgz are uploaded first to avoid uploading conaninfo.txt or conanmanifest.txt
+    with missing files due to a network failure, and conanmanifest.txt the last one. The files
+    of each group are uploaded concurrently in the thread_pool, if any
+    """
+    tgz_files = [f for f in sorted(files) if f.endswith(".tgz")]
+    other_files = [f for f in sorted(files) if f not in tgz_files and f != CONAN_MANIFEST]
+    groups = [tgz_files, other_files, [f for f in files if f == CONAN_MANIFEST]]
+    for group in groups:
+        for filename, result in zip(group, _run_tasks(thread_pool, upload_file, group)):
+            yield filename, result
+
+
 def get_exception_from_error(error_code):
     tmp = {v: k for k, v in EXCEPTION_CODE_MAPPING.items()  # All except NotFound
            if k not in (RecipeNotFoundException, PackageNotFoundException)}
@@ -203,9 +256,9 @@ class RestCommonMethods(object):
             raise ConanException("Unexpected server response %s" % result)
         return result
 
-    def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait):
+    def upload_recipe(self, ref, files_to_upload, deleted, retry, retry_wait, thread_pool=None):
         if files_to_upload:
-            self._upload_recipe(ref, files_to_upload, retry, retry_wait)
+            self._upload_recipe(ref, files_to_upload, retry, retry_wait, thread_pool)
         if deleted:
             self._remove_conanfile_files(ref, deleted)
 
@@ -223,9 +276,10 @@ class RestCommonMethods(object):
         snap = self._get_snapshot(url)
         return snap
 
-    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait):
+    def upload_package(self, pref, files_to_upload, deleted, retry, retry_wait,
+                       thread_pool=None):
         if files_to_upload:
-            self._upload_package(pref, files_to_upload, retry, retry_wait)
+            self._upload_package(pref, files_to_upload, retry, retry_wait, thread_pool)
         if deleted:
             raise Exception("This shouldn't be happening, deleted files "
                             "in local package present in remote: %s.\n Please, report it at "
@@ -9,7 +9,8 @@ from conans.client.remote_manager import check_compressed_files
 from conans.client.rest.client_routes import ClientV1Router
 from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_uploader import FileUploader
-from conans.client.rest.rest_client_common import RestCommonMethods, handle_return_deserializer
+from conans.client.rest.rest_client_common import RestCommonMethods, handle_return_deserializer, \
+    upload_files_in_order
 from conans.client.rest.file_downloader import FileDownloader
 from conans.errors import ConanException, NotFoundException, NoRestV2Available, \
     PackageNotFoundException
@@ -130,7 +131,7 @@ class RestV1Methods(RestCommonMethods):
         urls = self.get_json(url, data=data)
         return {filepath: complete_url(self.remote_url, url) for filepath, url in urls.items()}
 
-    def _upload_recipe(self, ref, files_to_upload, retry, retry_wait):
+    def _upload_recipe(self, ref, files_to_upload, retry, retry_wait, thread_pool=None):
         # Get the upload urls and then upload files
         url = self.router.recipe_upload_urls(ref)
         file_sizes = {filename.replace("\\", "/"): os.stat(abs_path).st_size
@@ -139,9 +140,9 @@ class RestV1Methods(RestCommonMethods):
         if self._matrix_params:
             urls = self.router.add_matrix_params(urls)
         self._upload_files(urls, files_to_upload, self._output, retry, retry_wait,
-                           display_name=str(ref))
+                           display_name=str(ref), thread_pool=thread_pool)
 
-    def _upload_package(self, pref, files_to_upload, retry, retry_wait):
+    def _upload_package(self, pref, files_to_upload, retry, retry_wait, thread_pool=None):
         # Get the upload urls and then upload files
         url = self.router.package_upload_urls(pref)
         file_sizes = {filename: os.stat(abs_path).st_size for filename,
@@ -153,19 +154,20 @@ class RestV1Methods(RestCommonMethods):
         logger.debug("Requesting upload urls...Done!")
         short_pref_name = "%s:%s" % (pref.ref, pref.id[0:4])
         self._upload_files(urls, files_to_upload, self._output, retry, retry_wait,
-                           display_name=short_pref_name)
+                           display_name=short_pref_name, thread_pool=thread_pool)
 
-    def _upload_files(self, file_urls, files, output, retry, retry_wait, display_name=None):
+    def _upload_files(self, file_urls, files, output, retry, retry_wait, display_name=None,
+                      thread_pool=None):
         t1 = time.time()
         failed = []
         uploader = FileUploader(self.requester, output, self.verify_ssl, self._config)
-        # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
-        # or conanamanifest.txt with missing files due to a network failure
-        for filename, resource_url in sorted(file_urls.items()):
+
+        def upload_file(filename):
             if output and not output.is_terminal:
                 msg = "Uploading: %s" % filename if not display_name else (
                             "Uploading %s -> %s" % (filename, display_name))
                 output.writeln(msg)
+            resource_url = file_urls[filename]
             auth, dedup = self._file_server_capabilities(resource_url)
             try:
                 headers = self._artifacts_properties if not self._matrix_params else {}
@@ -173,6 +175,10 @@ class RestV1Methods(RestCommonMethods):
                                 retry=retry, retry_wait=retry_wait,
                                 headers=headers, display_name=display_name)
             except Exception as exc:
+                return exc
+
+        for filename, exc in upload_files_in_order(file_urls, upload_file, thread_pool):
+            if exc is not None:
                 output.error("\nError uploading file: %s, '%s'" % (filename, exc))
                 failed.append(filename)
 
@@ -340,9 +346,15 @@ class RestV1Methods(RestCommonMethods):
     def get_latest_recipe_revision(self, ref):
         raise NoRestV2Available("The remote doesn't support revisions")
 
+    def get_package_extracted(self, pref, dest_folder):
+        raise NoRestV2Available("The remote doesn't support revisions")
+
     def get_latest_package_revision(self, pref):
         raise NoRestV2Available("The remote doesn't support revisions")
 
+    def get_packages_metadata(self, prefs):
+        raise NoRestV2Available("The remote doesn't support revisions")
+
     def _post_json(self, url, payload):
         logger.debug("REST: post: %s" % url)
         response = self.requester.post(url,
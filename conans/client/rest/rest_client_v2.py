@@ -1,13 +1,15 @@
 import os
 import time
 import traceback
+from collections import namedtuple
 
 from conans import DEFAULT_REVISION_V1
 from conans.client.remote_manager import check_compressed_files
 from conans.client.rest.client_routes import ClientV2Router
 from conans.client.rest.download_cache import CachedFileDownloader
 from conans.client.rest.file_uploader import FileUploader
-from conans.client.rest.rest_client_common import RestCommonMethods, get_exception_from_error
+from conans.client.rest.rest_client_common import RestCommonMethods, get_exception_from_error, \
+    upload_files_in_order
 from conans.client.rest.file_downloader import FileDownloader
 from conans.errors import ConanException, NotFoundException, PackageNotFoundException, \
     RecipeNotFoundException, AuthenticationException, ForbiddenException
@@ -18,6 +20,9 @@ from conans.paths import EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_N
 from conans.util.files import decode_text
 from conans.util.log import logger
 
+# The latest revision of a package, with its conaninfo, manifest and file list
+PackageMetadata = namedtuple("PackageMetadata", "pref info manifest files")
+
 
 class RestV2Methods(RestCommonMethods):
 
@@ -83,6 +88,27 @@ class RestV2Methods(RestCommonMethods):
         content = self._get_remote_file_contents(url, use_cache=cache)
         return ConanInfo.loads(decode_text(content))
 
+    def get_packages_metadata(self, prefs):
+        """ Get the PackageMetadata of all the "prefs" in a single request. Returns a list of
+        (PackageMetadata, exception) in the same order, as the errors are per package
+        """
+        url = self.router.batch_metadata()
+        data = self.get_json(url, data={"packages": [repr(pref) for pref in prefs]})
+        ret = []
+        for item in data["packages"]:
+            error = item.get("error")
+            if error:
+                exc_class = get_exception_from_error(error["code"]) or ConanException
+                ret.append((None, exc_class(error["message"])))
+                continue
+            pref = PackageReference.loads(item["reference"])
+            info = ConanInfo.loads(item["conaninfo"]) if item["conaninfo"] is not None else None
+            manifest = FileTreeManifest.loads(item["manifest"]) \
+                if item["manifest"] is not None else None
+            files = [os.path.normpath(filename) for filename in item["files"]]
+            ret.append((PackageMetadata(pref, info, manifest, files), None))
+        return ret
+
     def get_recipe(self, ref, dest_folder):
         url = self.router.recipe_snapshot(ref)
         data = self._get_file_list_json(url)
@@ -129,6 +155,29 @@ class RestV2Methods(RestCommonMethods):
         ret = {fn: os.path.join(dest_folder, fn) for fn in files}
         return ret
 
+    def get_package_extracted(self, pref, dest_folder):
+        """ downloads the package files, but the package tgz is extracted into dest_folder
+        while it is being downloaded, so it is never written to disk
+        :return: ({filename: abs_path} of the other files, {"md5": , "sha1": } of the tgz)
+        """
+        url = self.router.package_snapshot(pref)
+        data = self._get_file_list_json(url)
+        files = data["files"]
+        check_compressed_files(PACKAGE_TGZ_NAME, files)
+        urls = {fn: self.router.package_file(pref, fn) for fn in files}
+        saved_files = [fn for fn in files if fn != PACKAGE_TGZ_NAME]
+        self._download_and_save_files(urls, dest_folder, saved_files, use_cache=False)
+        ret = {fn: os.path.join(dest_folder, fn) for fn in saved_files}
+        tgz_checksums = None
+        if PACKAGE_TGZ_NAME in files:
+            if self._output and not self._output.is_terminal:
+                self._output.writeln("Downloading %s" % PACKAGE_TGZ_NAME)
+            downloader = FileDownloader(self.requester, self._output, self.verify_ssl,
+                                        self._config)
+            tgz_checksums = downloader.download_extract(urls[PACKAGE_TGZ_NAME], dest_folder,
+                                                        auth=self.auth)
+        return ret, tgz_checksums
+
     def get_recipe_path(self, ref, path):
         url = self.router.recipe_snapshot(ref)
         files = self._get_file_list_json(url)
@@ -173,26 +222,27 @@ class RestV2Methods(RestCommonMethods):
                     ret.append(tmp)
         return sorted(ret)
 
-    def _upload_recipe(self, ref, files_to_upload, retry, retry_wait):
+    def _upload_recipe(self, ref, files_to_upload, retry, retry_wait, thread_pool=None):
         # Direct upload the recipe
         urls = {fn: self.router.recipe_file(ref, fn, add_matrix_params=True)
                 for fn in files_to_upload}
-        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=str(ref))
+        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=str(ref),
+                           thread_pool=thread_pool)
 
-    def _upload_package(self, pref, files_to_upload, retry, retry_wait):
+    def _upload_package(self, pref, files_to_upload, retry, retry_wait, thread_pool=None):
         urls = {fn: self.router.package_file(pref, fn, add_matrix_params=True)
                 for fn in files_to_upload}
 
         short_pref_name = "%s:%s" % (pref.ref, pref.id[0:4])
-        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=short_pref_name)
+        self._upload_files(files_to_upload, urls, retry, retry_wait, display_name=short_pref_name,
+                           thread_pool=thread_pool)
 
-    def _upload_files(self, files, urls, retry, retry_wait, display_name=None):
+    def _upload_files(self, files, urls, retry, retry_wait, display_name=None, thread_pool=None):
         t1 = time.time()
         failed = []
         uploader = FileUploader(self.requester, self._output, self.verify_ssl, self._config)
-        # conan_package.tgz and conan_export.tgz are uploaded first to avoid uploading conaninfo.txt
-        # or conanamanifest.txt with missing files due to a network failure
-        for filename in sorted(files):
+
+        def upload_file(filename):
             if self._output and not self._output.is_terminal:
                 msg = "Uploading: %s" % filename if not display_name else (
                             "Uploading %s -> %s" % (filename, display_name))
@@ -203,9 +253,13 @@ class RestV2Methods(RestCommonMethods):
                 uploader.upload(resource_url, files[filename], auth=self.auth,
                                 dedup=self._checksum_deploy, retry=retry, retry_wait=retry_wait,
                                 headers=headers, display_name=display_name)
-            except (AuthenticationException, ForbiddenException):
-                raise
             except Exception as exc:
+                return exc
+
+        for filename, exc in upload_files_in_order(files, upload_file, thread_pool):
+            if isinstance(exc, (AuthenticationException, ForbiddenException)):
+                raise exc
+            if exc is not None:
                 self._output.error("\nError uploading file: %s, '%s'" % (filename, exc))
                 failed.append(filename)
 
@@ -308,7 +308,10 @@ class _BaseDepsCppInfo(_CppInfo):
 
     def update(self, dep_cpp_info):
         def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
+            if not seq1:
+                return list(seq2)
+            seq2_items = set(seq2)
+            return [s for s in seq1 if s not in seq2_items] + seq2
 
         self.system_libs = merge_lists(self.system_libs, dep_cpp_info.system_libs)
         self.includedirs = merge_lists(self.includedirs, dep_cpp_info.include_paths)
@@ -404,7 +407,8 @@ class DepCppInfo(object):
 
     @staticmethod
     def _merge_lists(seq1, seq2):
-        return seq1 + [s for s in seq2 if s not in seq1]
+        seq1_items = set(seq1)
+        return seq1 + [s for s in seq2 if s not in seq1_items]
 
     def _aggregated_values(self, item):
         values = getattr(self, "_%s" % item)
@@ -243,7 +243,8 @@ class DepsEnvInfo(EnvInfo):
         self._dependencies_[pkg_name] = dep_env_info
 
         def merge_lists(seq1, seq2):
-            return [s for s in seq1 if s not in seq2] + seq2
+            seq2_items = set(seq2)
+            return [s for s in seq1 if s not in seq2_items] + seq2
 
         # With vars if its set the keep the set value
         for varname, value in dep_env_info.vars.items():
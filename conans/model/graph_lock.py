@@ -1,9 +1,9 @@
 import json
 import os
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
 
 from conans import DEFAULT_REVISION_V1
-from conans.client.graph.graph import RECIPE_VIRTUAL, RECIPE_CONSUMER
+from conans.client.graph.graph import RECIPE_VIRTUAL, RECIPE_CONSUMER, order_levels
 from conans.client.graph.python_requires import PyRequires
 from conans.client.graph.range_resolver import satisfying
 from conans.client.profile_loader import _load_profile
@@ -19,10 +19,16 @@ LOCKFILE_VERSION = "0.4"
 
 class GraphLockFile(object):
 
-    def __init__(self, profile_host, profile_build, graph_lock):
+    def __init__(self, profile_host, profile_build, graph_lock, profile_host_text=None,
+                 profile_build_text=None):
+        """ the profile_xxx_text are the dumped profiles of a loaded lockfile, they are parsed
+        only if they are used
+        """
         self._profile_host = profile_host
         self._profile_build = profile_build
         self._graph_lock = graph_lock
+        self._profile_host_text = profile_host_text
+        self._profile_build_text = profile_build_text
 
     @property
     def graph_lock(self):
@@ -30,10 +36,17 @@ class GraphLockFile(object):
 
     @property
     def profile_host(self):
+        if self._profile_host_text:
+            # FIXME: Reading private very ugly
+            self._profile_host, _ = _load_profile(self._profile_host_text, None, None)
+            self._profile_host_text = None
         return self._profile_host
 
     @property
     def profile_build(self):
+        if self._profile_build_text:
+            self._profile_build, _ = _load_profile(self._profile_build_text, None, None)
+            self._profile_build_text = None
         return self._profile_build
 
     @staticmethod
@@ -63,13 +76,9 @@ class GraphLockFile(object):
             # Do something with it, migrate, raise...
         profile_host = graph_json.get("profile_host", None)
         profile_build = graph_json.get("profile_build", None)
-        # FIXME: Reading private very ugly
-        if profile_host:
-            profile_host, _ = _load_profile(profile_host, None, None)
-        if profile_build:
-            profile_build, _ = _load_profile(profile_build, None, None)
         graph_lock = GraphLock.deserialize(graph_json["graph_lock"], revisions_enabled)
-        graph_lock_file = GraphLockFile(profile_host, profile_build, graph_lock)
+        graph_lock_file = GraphLockFile(None, None, graph_lock, profile_host_text=profile_host,
+                                        profile_build_text=profile_build)
         return graph_lock_file
 
     def _dumps(self, path):
@@ -86,9 +95,13 @@ class GraphLockFile(object):
                     pass
         result = {"graph_lock": serial_lock,
                   "version": LOCKFILE_VERSION}
-        if self._profile_host:
+        if self._profile_host_text:
+            result["profile_host"] = self._profile_host_text
+        elif self._profile_host:
             result["profile_host"] = self._profile_host.dumps()
-        if self._profile_build:
+        if self._profile_build_text:
+            result["profile_build"] = self._profile_build_text
+        elif self._profile_build:
             result["profile_build"] = self._profile_build.dumps()
         return json.dumps(result, indent=True)
 
@@ -96,6 +109,8 @@ class GraphLockFile(object):
         self._graph_lock.only_recipes()
         self._profile_host = None
         self._profile_build = None
+        self._profile_host_text = None
+        self._profile_build_text = None
 
 
 class GraphLockNode(object):
@@ -117,12 +132,34 @@ class GraphLockNode(object):
         self._relaxed = False
         self._modified = modified  # Exclusively now for "conan_build_info" command
         self._path = path
+        # The serialized {"ref", "python_requires", "options"} of a deserialized node, parsed
+        # only when they are used. Most of the commands only need some nodes of the lockfile
+        self._serialized = None
         if not revisions_enabled:
             if ref:
                 self._ref = ref.copy_clear_rev()
             if prev:
                 self._prev = DEFAULT_REVISION_V1
 
+    def _parse(self):
+        if self._serialized is None:
+            return
+        data, self._serialized = self._serialized, None
+        json_ref = data.get("ref")
+        ref = ConanFileReference.loads(json_ref) if json_ref else None
+        if ref and not self._revisions_enabled:
+            ref = ref.copy_clear_rev()
+        self._ref = ref if ref and ref.name else None
+        python_requires = data.get("python_requires")
+        if python_requires:
+            python_requires = [ConanFileReference.loads(py_req, validate=False)
+                               for py_req in python_requires]
+        if not self._revisions_enabled:
+            python_requires = [r.copy_clear_rev() for r in python_requires or []]
+        self._python_requires = python_requires
+        options = data.get("options")
+        self._options = OptionsValues.loads(options) if options else None
+
     @property
     def context(self):
         return self._context
@@ -151,15 +188,26 @@ class GraphLockNode(object):
 
     @property
     def ref(self):
+        self._parse()
         return self._ref
 
+    @property
+    def ref_repr(self):
+        """ repr() of the reference, without parsing it if the node was deserialized
+        """
+        if self._serialized is not None:
+            return self._serialized.get("ref") or None
+        return repr(self._ref) if self._ref else None
+
     @property
     def python_requires(self):
+        self._parse()
         return self._python_requires
 
     @ref.setter
     def ref(self, value):
         # only used at export time, to assign rrev
+        self._parse()
         if not self._revisions_enabled:
             value = value.copy_clear_rev()
         if self._ref:
@@ -181,7 +229,7 @@ class GraphLockNode(object):
     def package_id(self, value):
         if (self._package_id is not None and self._package_id != PACKAGE_ID_UNKNOWN and
                 self._package_id != value):
-            raise ConanException("Attempt to change package_id of locked '%s'" % repr(self._ref))
+            raise ConanException("Attempt to change package_id of locked '%s'" % repr(self.ref))
         if value != self._package_id:  # When the package_id is being assigned, prev becomes invalid
             self._prev = None
         self._package_id = value
@@ -195,7 +243,7 @@ class GraphLockNode(object):
         if not self._revisions_enabled and value is not None:
             value = DEFAULT_REVISION_V1
         if self._prev is not None:
-            raise ConanException("Trying to modify locked package {}".format(repr(self._ref)))
+            raise ConanException("Trying to modify locked package {}".format(repr(self.ref)))
         if value is not None:
             self._modified = True  # Only for conan_build_info
         self._prev = value
@@ -208,9 +256,11 @@ class GraphLockNode(object):
 
     @property
     def options(self):
+        self._parse()
         return self._options
 
     def only_recipe(self):
+        self._parse()
         self._package_id = None
         self._prev = None
         self._options = None
@@ -220,39 +270,43 @@ class GraphLockNode(object):
     def deserialize(data, revisions_enabled):
         """ constructs a GraphLockNode from a json like dict
         """
-        json_ref = data.get("ref")
-        ref = ConanFileReference.loads(json_ref) if json_ref else None
         package_id = data.get("package_id")
         prev = data.get("prev")
-        python_requires = data.get("python_requires")
-        if python_requires:
-            python_requires = [ConanFileReference.loads(py_req, validate=False)
-                               for py_req in python_requires]
-        options = data.get("options")
-        options = OptionsValues.loads(options) if options else None
         modified = data.get("modified")
         context = data.get("context")
         requires = data.get("requires", [])
         build_requires = data.get("build_requires", [])
         path = data.get("path")
-        return GraphLockNode(ref, package_id, prev, python_requires, options, requires,
+        node = GraphLockNode(None, package_id, prev, None, None, requires,
                              build_requires, path, revisions_enabled, context, modified)
+        # The reference, python_requires and options are parsed when they are used
+        node._serialized = {k: data.get(k) for k in ("ref", "python_requires", "options")}
+        return node
 
     def serialize(self):
         """ returns the object serialized as a dict of plain python types
         that can be converted to json
         """
         result = {}
-        if self._ref:
-            result["ref"] = repr(self._ref)
-        if self._options:
-            result["options"] = self._options.dumps()
+        serialized = self._serialized
+        if serialized is not None:  # Not parsed, there are no changes to serialize
+            for k in ("ref", "options"):
+                if serialized.get(k):
+                    result[k] = serialized[k]
+        else:
+            if self._ref:
+                result["ref"] = repr(self._ref)
+            if self._options:
+                result["options"] = self._options.dumps()
         if self._package_id:
             result["package_id"] = self._package_id
         if self._prev:
             result["prev"] = self._prev
-        if self.python_requires:
-            result["python_requires"] = [repr(r) for r in self.python_requires]
+        if serialized is not None:
+            if serialized.get("python_requires"):
+                result["python_requires"] = serialized["python_requires"]
+        elif self._python_requires:
+            result["python_requires"] = [repr(r) for r in self._python_requires]
         if self._modified:
             result["modified"] = self._modified
         if self._requires:
@@ -266,10 +320,71 @@ class GraphLockNode(object):
         return result
 
 
+class _GraphLockIndex(object):
+    """ secondary indexes of the nodes of a GraphLock, so they can be found without iterating
+    all the nodes for every requirement. The indexes by reference are {key: set(node ids)}
+    """
+
+    def __init__(self, nodes):
+        self._full_refs = defaultdict(set)  # repr(ref), including the RREV
+        self._refs = defaultdict(set)  # str(ref), without RREV
+        self._names = defaultdict(set)
+        self._paths = {}  # {id: name or None} of the nodes of local consumers, with path
+        self._positions = {}  # {id: position}, the iteration order of the nodes
+        for id_, node in nodes.items():
+            self.add(id_, node)
+
+    @staticmethod
+    def _keys(node):
+        # From the repr() of the reference, so the references of the nodes are not parsed
+        full_ref = node.ref_repr
+        if not full_ref:
+            return None, None, None
+        return full_ref, full_ref.split("#")[0], full_ref.split("/")[0]
+
+    def add(self, id_, node):
+        self._positions.setdefault(id_, len(self._positions))
+        full_ref, ref, name = self._keys(node)
+        if full_ref:
+            self._full_refs[full_ref].add(id_)
+            self._refs[ref].add(id_)
+            self._names[name].add(id_)
+        if node.path:
+            self._paths[id_] = name
+
+    def remove(self, id_, node):
+        full_ref, ref, name = self._keys(node)
+        if full_ref:
+            self._full_refs[full_ref].discard(id_)
+            self._refs[ref].discard(id_)
+            self._names[name].discard(id_)
+        self._paths.pop(id_, None)
+
+    @staticmethod
+    def _first(ids):
+        # The same node that iterating the sorted nodes would find first
+        return min(ids) if ids else None
+
+    def by_full_ref(self, ref):
+        return self._first(self._full_refs.get(repr(ref)))
+
+    def by_ref(self, ref):
+        return self._first(self._refs.get(str(ref)))
+
+    def by_name(self, name):
+        """ all the nodes with that name, in the same order as iterating the nodes """
+        return sorted(self._names.get(name, ()), key=self._positions.get)
+
+    def consumer(self, name=None):
+        """ a local consumer node (with path), without reference or with that name """
+        return self._first([id_ for id_, node_name in self._paths.items() if node_name == name])
+
+
 class GraphLock(object):
 
     def __init__(self, deps_graph, revisions_enabled):
         self._nodes = {}  # {id: GraphLockNode}
+        self._index = None  # _GraphLockIndex of the nodes, computed when necessary
         self._revisions_enabled = revisions_enabled
         self._relaxed = False  # If True, the lock can be expanded with new Nodes
 
@@ -346,25 +461,13 @@ class GraphLock(object):
         :return: An ordered list of lists, each inner element is a tuple with the node ID and the
                  reference (as string), possibly including revision, of the node
         """
-        # First do a topological order by levels, the ids of the nodes are stored
-        levels = []
-        opened = list(self._nodes.keys())
-        while opened:
-            current_level = []
-            for o in opened:
-                node = self._nodes[o]
-                requires = node.requires
-                if node.python_requires:
-                    requires += node.python_requires
-                if node.build_requires:
-                    requires += node.build_requires
-                if not any(n in opened for n in requires):
-                    current_level.append(o)
-
-            current_level.sort()
-            levels.append(current_level)
-            # now initialize new level
-            opened = set(opened).difference(current_level)
+        # First do a topological order by levels, the ids of the nodes are stored. The
+        # python_requires are references, not nodes of the lockfile
+        def neighbors(node_id):
+            node = self._nodes[node_id]
+            return (node.requires or []) + (node.build_requires or [])
+
+        levels = order_levels(self._nodes, neighbors)
 
         # Now compute the list of list with prev=None, and prepare them with the right
         # references to be used in cmd line
@@ -376,7 +479,7 @@ class GraphLock(object):
                 locked_node = self._nodes[id_]
                 if locked_node.prev is None and locked_node.package_id is not None:
                     # Manipulate the ref so it can be used directly in install command
-                    ref = repr(locked_node.ref)
+                    ref = locked_node.ref_repr
                     if not self._revisions_enabled:
                         if "@" not in ref:
                             ref += "@"
@@ -471,6 +574,8 @@ class GraphLock(object):
         """
         for id_, node in new_lock.nodes.items():
             current = self._nodes[id_]
+            if node.serialize() == current.serialize():  # Unchanged, nothing to parse or update
+                continue
             if current.ref:
                 if node.ref.copy_clear_rev() != current.ref.copy_clear_rev():
                     raise ConanException("Incompatible reference")
@@ -572,29 +677,27 @@ class GraphLock(object):
         if version.startswith("[") and version.endswith("]"):
             version_range = version[1:-1]
 
+        index = self._get_index()
         if version_range:
-            for id_, node in self._nodes.items():
-                root_ref = node.ref
-                if (ref.name == root_ref.name and ref.user == root_ref.user and
-                        ref.channel == root_ref.channel):
+            for id_ in index.by_name(ref.name):
+                root_ref = self._nodes[id_].ref
+                if ref.user == root_ref.user and ref.channel == root_ref.channel:
                     output = []
                     result = satisfying([str(root_ref.version)], version_range, output)
                     if result:
                         return id_
         else:
-            search_ref = repr(ref)
             if ref.revision:  # Search by exact ref (with RREV)
-                node_id = self._find_first(lambda n: n.ref and repr(n.ref) == search_ref)
+                node_id = index.by_full_ref(ref)
             else:  # search by ref without RREV
-                node_id = self._find_first(lambda n: n.ref and str(n.ref) == search_ref)
+                node_id = index.by_ref(ref)
             if node_id:
                 return node_id
 
-    def _find_first(self, predicate):
-        """ find the first node in the graph matching the predicate"""
-        for id_, node in sorted(self._nodes.items()):
-            if predicate(node):
-                return id_
+    def _get_index(self):
+        if self._index is None:
+            self._index = _GraphLockIndex(self._nodes)
+        return self._index
 
     def get_consumer(self, ref):
         """ given a REF of a conanfile.txt (None) or conanfile.py in user folder,
@@ -607,20 +710,19 @@ class GraphLock(object):
         # None reference
         if ref is None or ref.name is None:
             # Is a conanfile.txt consumer
-            node_id = self._find_first(lambda n: not n.ref and n.path)
+            node_id = self._get_index().consumer()
             if node_id:
                 return node_id
         else:
             assert ref.revision is None
 
-            repr_ref = repr(ref)
-            str_ref = str(ref)
+            index = self._get_index()
             node_id = (  # First search by exact ref with RREV
-                       self._find_first(lambda n: n.ref and repr(n.ref) == repr_ref) or
+                       index.by_full_ref(ref) or
                        # If not mathing, search by exact ref without RREV
-                       self._find_first(lambda n: n.ref and str(n.ref) == str_ref) or
+                       index.by_ref(ref) or
                        # Or it could be a local consumer (n.path defined), search only by name
-                       self._find_first(lambda n: n.ref and n.ref.name == ref.name and n.path))
+                       index.consumer(ref.name))
             if node_id:
                 return node_id
 
@@ -655,11 +757,10 @@ class GraphLock(object):
 
         # The ``create`` command uses this to install pkg/version --build=pkg
         # removing the revision, but it still should match
-        search_ref = repr(ref)
         if ref.revision:  # Match should be exact (with RREV)
-            node_id = self._find_first(lambda n: n.ref and repr(n.ref) == search_ref)
+            node_id = self._get_index().by_full_ref(ref)
         else:
-            node_id = self._find_first(lambda n: n.ref and str(n.ref) == search_ref)
+            node_id = self._get_index().by_ref(ref)
         if node_id:
             return node_id
 
@@ -671,4 +772,11 @@ class GraphLock(object):
         match the existing RREV
         """
         lock_node = self._nodes[node_id]
-        lock_node.ref = ref
+        index = self._index
+        if index is not None:
+            index.remove(node_id, lock_node)
+        try:
+            lock_node.ref = ref
+        finally:
+            if index is not None:
+                index.add(node_id, lock_node)
@@ -2,11 +2,16 @@ import calendar
 import datetime
 import os
 import time
+from multiprocessing.pool import ThreadPool
 
 from conans.errors import ConanException
 from conans.paths import CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME, EXPORT_TGZ_NAME, PACKAGE_TGZ_NAME
 from conans.util.env_reader import get_env
 from conans.util.files import load, md5, md5sum, save, walk
+from conans.util.misc import cpu_threads
+
+# Below this number of files, they are hashed without a pool of threads
+_PARALLEL_HASH_MIN_FILES = 32
 
 
 def discarded_file(filename):
@@ -48,6 +53,33 @@ def gather_files(folder):
     return file_dict, symlinks
 
 
+def _compute_md5sums(paths):
+    """ hashlib releases the GIL while hashing, the files are read and hashed in parallel
+    """
+    threads = min(cpu_threads(), len(paths) // _PARALLEL_HASH_MIN_FILES)
+    if threads <= 1:
+        return [md5sum(path) for path in paths]
+    pool = ThreadPool(threads)
+    try:
+        return pool.map(md5sum, paths, chunksize=16)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def md5sums(paths):
+    """ the md5 of the files, as {path: md5}. If the CONAN_HASH_CACHE (general.hash_cache
+    in conan.conf) database file is defined, only the files that are not there or were
+    modified since they were cached are read
+    """
+    paths = list(paths)
+    hash_cache = os.getenv("CONAN_HASH_CACHE")
+    if hash_cache:
+        from conans.client.cache.hash_cache import HashCache
+        return HashCache(hash_cache).md5sums(paths, _compute_md5sums)
+    return dict(zip(paths, _compute_md5sums(paths)))
+
+
 class FileTreeManifest(object):
 
     def __init__(self, the_time, file_sums):
@@ -118,14 +150,13 @@ class FileTreeManifest(object):
         for f in (PACKAGE_TGZ_NAME, EXPORT_TGZ_NAME, CONAN_MANIFEST, EXPORT_SOURCES_TGZ_NAME):
             files.pop(f, None)
 
-        file_dict = {}
-        for name, filepath in files.items():
-            file_dict[name] = md5sum(filepath)
-
         if exports_sources_folder:
             export_files, _ = gather_files(exports_sources_folder)
             for name, filepath in export_files.items():
-                file_dict["export_source/%s" % name] = md5sum(filepath)
+                files["export_source/%s" % name] = filepath
+
+        sums = md5sums(files.values())
+        file_dict = {name: sums[filepath] for name, filepath in files.items()}
 
         date = calendar.timegm(time.gmtime())
 
@@ -0,0 +1,32 @@
+import json
+from collections import OrderedDict
+
+
+class PackagesSummary(object):
+    """ Summary of the binary packages of a recipe in the local cache: the minimal conaninfo
+    (settings, options, requires) of every package revision, in a single file per recipe, so the
+    packages can be searched without reading all their conaninfo.txt files. The entries are
+    checked against the package revisions of the metadata.json when they are read.
+    """
+
+    def __init__(self):
+        self.packages = OrderedDict()  # {package_id: (revision, recipe_revision, info_min)}
+
+    @staticmethod
+    def loads(content):
+        ret = PackagesSummary()
+        data = json.loads(content)
+        for package_id in sorted(data):
+            revision, recipe_revision, info_min = data[package_id]
+            ret.packages[package_id] = (revision, recipe_revision, info_min)
+        return ret
+
+    def dumps(self):
+        return json.dumps({package_id: list(entry) for package_id, entry in self.packages.items()})
+
+    def update_package(self, package_id, revision, recipe_revision, info_min):
+        self.packages[package_id] = (revision, recipe_revision, info_min)
+
+    def remove_packages(self, package_ids):
+        for package_id in package_ids:
+            self.packages.pop(package_id, None)
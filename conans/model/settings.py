@@ -50,28 +50,30 @@ class SettingsItem(object):
     def __contains__(self, value):
         return value in (self._value or "")
 
+    @staticmethod
+    def _new(name, value, definition):
+        # Fast path for the copies, that are done for every node of the graph, it skips the
+        # __init__ definition processing and the __setattr__ overrides
+        result = SettingsItem.__new__(SettingsItem)
+        result.__dict__.update(_name=name, _value=value, _definition=definition)
+        return result
+
     def copy(self):
-        """ deepcopy, recursive
+        """ deepcopy, recursive. The lists of values are shared, they are never modified in place
         """
-        result = SettingsItem({}, name=self._name)
-        result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy() for k, v in self._definition.items()}
-        return result
+        definition = self._definition
+        if isinstance(definition, dict):
+            definition = {k: v.copy() for k, v in definition.items()}
+        return SettingsItem._new(self._name, self._value, definition)
 
     def copy_values(self):
         if self._value is None and "None" not in self._definition:
             return None
 
-        result = SettingsItem({}, name=self._name)
-        result._value = self._value
-        if self.is_final:
-            result._definition = self._definition[:]
-        else:
-            result._definition = {k: v.copy_values() for k, v in self._definition.items()}
-        return result
+        definition = self._definition
+        if isinstance(definition, dict):
+            definition = {k: v.copy_values() for k, v in definition.items()}
+        return SettingsItem._new(self._name, self._value, definition)
 
     @property
     def is_final(self):
@@ -122,7 +124,8 @@ class SettingsItem(object):
                 if v == "ANY":
                     self._definition = []
             elif v in self._definition:
-                self._definition.remove(v)
+                # Not in place, the list can be shared with other copies
+                self._definition = [d for d in self._definition if d != v]
 
         if self._value is not None and self._value not in self._definition and self._not_any():
             raise ConanException(bad_value_msg(self._name, self._value, self.values_range))
@@ -213,23 +216,27 @@ class Settings(object):
             return str(tmp)
         return default
 
+    @staticmethod
+    def _new(name, parent_value, data):
+        result = Settings.__new__(Settings)
+        result.__dict__.update(_name=name, _parent_value=parent_value, _data=data)
+        return result
+
     def copy(self):
         """ deepcopy, recursive
         """
-        result = Settings({}, name=self._name, parent_value=self._parent_value)
-        for k, v in self._data.items():
-            result._data[k] = v.copy()
-        return result
+        data = {k: v.copy() for k, v in self._data.items()}
+        return Settings._new(self._name, self._parent_value, data)
 
     def copy_values(self):
         """ deepcopy, recursive
         """
-        result = Settings({}, name=self._name, parent_value=self._parent_value)
+        data = {}
         for k, v in self._data.items():
             value = v.copy_values()
             if value is not None:
-                result._data[k] = value
-        return result
+                data[k] = value
+        return Settings._new(self._name, self._parent_value, data)
 
     @staticmethod
     def loads(text):
@@ -10,13 +10,16 @@ import fasteners
 from conans.client.tools.oss import OSInfo
 from conans.errors import NotFoundException, ConanException
 from conans.errors import RecipeNotFoundException, PackageNotFoundException
+from conans.model.info import ConanInfo
 from conans.model.manifest import FileTreeManifest
 from conans.model.manifest import discarded_file
 from conans.model.package_metadata import PackageMetadata
+from conans.model.packages_summary import PackagesSummary
 from conans.model.ref import ConanFileReference
 from conans.model.ref import PackageReference
 from conans.paths import CONANFILE, SYSTEM_REQS, EXPORT_FOLDER, EXPORT_SRC_FOLDER, SRC_FOLDER, \
-    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER
+    BUILD_FOLDER, PACKAGES_FOLDER, SYSTEM_REQS_FOLDER, PACKAGE_METADATA, SCM_SRC_FOLDER, \
+    PACKAGES_SUMMARY
 from conans.util.files import load, save, rmdir
 from conans.util.locks import Lock, NoLock, ReadLock, SimpleLock, WriteLock
 from conans.util.log import logger
@@ -38,17 +41,22 @@ def short_path(func):
 class PackageCacheLayout(object):
     """ This is the package layout for Conan cache """
 
-    def __init__(self, base_folder, ref, short_paths, no_lock):
+    def __init__(self, base_folder, ref, short_paths, no_lock, index=None):
         assert isinstance(ref, ConanFileReference)
         self._ref = ref
         self._base_folder = os.path.normpath(base_folder)
         self._short_paths = short_paths
         self._no_lock = no_lock
+        self._index = index
 
     @property
     def ref(self):
         return self._ref
 
+    @property
+    def cache_index(self):
+        return self._index
+
     def base_folder(self):
         """ Returns the base folder for this package reference """
         return self._base_folder
@@ -113,6 +121,9 @@ class PackageCacheLayout(object):
     def package_metadata(self):
         return os.path.join(self._base_folder, PACKAGE_METADATA)
 
+    def packages_summary(self):
+        return os.path.join(self._base_folder, PACKAGES_SUMMARY)
+
     def recipe_manifest(self):
         return FileTreeManifest.load(self.export())
 
@@ -176,23 +187,52 @@ class PackageCacheLayout(object):
     _metadata_locks = {}  # Needs to be shared among all instances
 
     @contextmanager
-    def update_metadata(self):
-        metadata_path = self.package_metadata()
-        lockfile = metadata_path + ".lock"
+    def _metadata_lock(self):
+        lockfile = self.package_metadata() + ".lock"
         with fasteners.InterProcessLock(lockfile, logger=logger):
             lock_name = self.package_metadata()  # The path is the thing that defines mutex
             thread_lock = PackageCacheLayout._metadata_locks.setdefault(lock_name, threading.Lock())
             thread_lock.acquire()
             try:
-                try:
-                    metadata = self.load_metadata()
-                except RecipeNotFoundException:
-                    metadata = PackageMetadata()
-                yield metadata
-                save(metadata_path, metadata.dumps())
+                yield
             finally:
                 thread_lock.release()
 
+    @contextmanager
+    def update_metadata(self):
+        with self._metadata_lock():
+            try:
+                metadata = self.load_metadata()
+            except RecipeNotFoundException:
+                metadata = PackageMetadata()
+            yield metadata
+            save(self.package_metadata(), metadata.dumps())
+            if self._index:
+                self._index.update_recipe(self._ref, metadata.recipe.revision)
+
+    # Packages summary
+    def load_packages_summary(self):
+        try:
+            text = load(self.packages_summary())
+            return PackagesSummary.loads(text)
+        except (IOError, ValueError):  # Missing or broken, it is rebuilt when searching
+            return PackagesSummary()
+
+    @contextmanager
+    def update_packages_summary(self):
+        with self._metadata_lock():
+            summary = self.load_packages_summary()
+            yield summary
+            save(self.packages_summary(), summary.dumps())
+
+    def summarize_package(self, pref, recipe_revision):
+        """ stores the conaninfo of a new package revision in the packages summary
+        """
+        assert pref.revision, "The packages summary stores package revisions"
+        info = ConanInfo.load_from_package(self.package(pref))
+        with self.update_packages_summary() as summary:
+            summary.update_package(pref.id, pref.revision, recipe_revision, info.serialize_min())
+
     # Locks
     def conanfile_read_lock(self, output):
         if self._no_lock:
@@ -32,40 +32,35 @@ def _parse_expression(subexp):
     return ret
 
 
-def evaluate_postfix(postfix, evaluator):
+def compile_postfix(postfix, compiler):
     """
-    Evaluates a postfix expression and returns a boolean
+    Compiles a postfix expression into a single predicate, so the expressions are parsed only
+    once, not once per evaluated item
     @param postfix:  Postfix expression as a list
-    @param evaluator: Function that will return a bool receiving expressions
-                      like "compiler.version=12"
-    @return: bool
+    @param compiler: Function that receives expressions like "compiler.version=12" and
+                     returns a predicate for them
+    @return: Function that receives the item to evaluate and returns a bool
     """
     if not postfix:  # If no query return all?
-        return True
+        return lambda item: True
+
+    def _or(p1, p2):
+        return lambda item: p1(item) or p2(item)
+
+    def _and(p1, p2):
+        return lambda item: p1(item) and p2(item)
 
     stack = []
     for el in postfix:
         if not is_operator(el):
-            stack.append(el)
+            stack.append(compiler(el))
         else:
-            o1 = stack.pop()
-            o2 = stack.pop()
-            if not isinstance(o1, bool):
-                o1 = evaluator(o1)
-            if not isinstance(o2, bool):
-                o2 = evaluator(o2)
-
-            if el == "|":
-                res = o1 or o2
-            elif el == "&":
-                res = o1 and o2
-            stack.append(res)
+            p1 = stack.pop()
+            p2 = stack.pop()
+            stack.append(_or(p1, p2) if el == "|" else _and(p1, p2))
     if len(stack) != 1:
-        raise Exception("Bad stack: %s" % str(stack))
-    elif not isinstance(stack[0], bool):
-        return evaluator(stack[0])  # Single Expression without AND or OR
-    else:
-        return stack[0]
+        raise Exception("Bad stack: %s" % str(postfix))
+    return stack[0]
 
 
 def infix_to_postfix(exp):
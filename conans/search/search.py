@@ -7,7 +7,7 @@ from conans.errors import ConanException, RecipeNotFoundException
 from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
 from conans.paths import CONANINFO
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
+from conans.search.query_parse import compile_postfix, infix_to_postfix
 from conans.util.files import load
 from conans.util.log import logger
 
@@ -41,55 +41,52 @@ def filter_by_revision(metadata, packages_infos):
 def filter_packages(query, package_infos):
     if query is None:
         return package_infos
+    predicate = compile_query(query)
+    try:
+        return OrderedDict((package_id, info) for package_id, info in package_infos.items()
+                           if predicate(info))
+    except Exception as exc:
+        raise ConanException("Invalid package query: %s. %s" % (query, exc))
+
+
+def compile_query(query):
+    """ parses the query only once, returning a predicate that evaluates it against the
+    conaninfo.serialize_min() of a package
+    """
     try:
         if "!" in query:
             raise ConanException("'!' character is not allowed")
         if " not " in query or query.startswith("not "):
             raise ConanException("'not' operator is not allowed")
         postfix = infix_to_postfix(query) if query else []
-        result = OrderedDict()
-        for package_id, info in package_infos.items():
-            if _evaluate_postfix_with_info(postfix, info):
-                result[package_id] = info
-        return result
+        return compile_postfix(postfix, _compile_expression)
     except Exception as exc:
         raise ConanException("Invalid package query: %s. %s" % (query, exc))
 
 
-def _evaluate_postfix_with_info(postfix, conan_vars_info):
-
-    # Evaluate conaninfo with the expression
-
-    def evaluate_info(expression):
-        """Receives an expression like compiler.version="12"
-        Uses conan_vars_info in the closure to evaluate it"""
-        name, value = expression.split("=", 1)
-        value = value.replace("\"", "")
-        return _evaluate(name, value, conan_vars_info)
+_SETTINGS_PROPERTIES = ("os", "os_build", "compiler", "arch", "arch_build", "build_type")
 
-    return evaluate_postfix(postfix, evaluate_info)
 
-
-def _evaluate(prop_name, prop_value, conan_vars_info):
-    """
-    Evaluates a single prop_name, prop_value like "os", "Windows" against
-    conan_vars_info.serialize_min()
+def _compile_expression(expression):
+    """Receives an expression like compiler.version="12" and returns a predicate that
+    evaluates it against conan_vars_info.serialize_min()
     """
+    prop_name, prop_value = expression.split("=", 1)
+    prop_value = prop_value.replace("\"", "")
+    if (prop_name in _SETTINGS_PROPERTIES or
+            any(prop_name.startswith(setting + '.') for setting in _SETTINGS_PROPERTIES)):
+        field = "settings"
+    else:
+        field = "options"
 
-    def compatible_prop(setting_value, _prop_value):
-        return (_prop_value == setting_value) or (_prop_value == "None" and setting_value is None)
-
-    info_settings = conan_vars_info.get("settings", [])
-    info_options = conan_vars_info.get("options", [])
-    properties = ["os", "os_build", "compiler", "arch", "arch_build", "build_type"]
-
-    def starts_with_common_settings(_prop_name):
-        return any(_prop_name.startswith(setting + '.') for setting in properties)
-
-    if prop_name in properties or starts_with_common_settings(prop_name):
-        return compatible_prop(info_settings.get(prop_name, None), prop_value)
+    if prop_value == "None":
+        def predicate(conan_vars_info):
+            value = conan_vars_info.get(field, {}).get(prop_name, None)
+            return value is None or value == prop_value
     else:
-        return compatible_prop(info_options.get(prop_name, None), prop_value)
+        def predicate(conan_vars_info):
+            return conan_vars_info.get(field, {}).get(prop_name, None) == prop_value
+    return predicate
 
 
 def search_recipes(cache, pattern=None, ignorecase=True):
@@ -141,24 +138,55 @@ def search_packages(package_layout, query):
 
 def _get_local_infos_min(package_layout):
     result = OrderedDict()
+    ref = package_layout.ref
 
+    try:
+        metadata = package_layout.load_metadata()
+    except RecipeNotFoundException:
+        metadata = None
+    index = package_layout.cache_index
+    if metadata is None:  # The package revisions are needed to validate the cached infos
+        cached = {}
+    elif index:
+        cached = index.packages(ref)
+    else:
+        cached = package_layout.load_packages_summary().packages
+
+    updated = OrderedDict()
     package_ids = package_layout.package_ids()
     for package_id in package_ids:
-        # Read conaninfo
-        pref = PackageReference(package_layout.ref, package_id)
-        info_path = os.path.join(package_layout.package(pref), CONANINFO)
-        if not os.path.exists(info_path):
-            logger.error("There is no ConanInfo: %s" % str(info_path))
+        prev = recipe_revision = None
+        if metadata is not None:
+            prev = metadata.packages[package_id].revision
+            recipe_revision = metadata.packages[package_id].recipe_revision
+        if ref.revision and recipe_revision and recipe_revision != ref.revision:
             continue
-        conan_info_content = load(info_path)
 
-        info = ConanInfo.loads(conan_info_content)
-        if package_layout.ref.revision:
-            metadata = package_layout.load_metadata()
-            recipe_revision = metadata.packages[package_id].recipe_revision
-            if recipe_revision and recipe_revision != package_layout.ref.revision:
+        cached_prev, _, conan_vars_info = cached.get(package_id, (None, None, None))
+        if not prev or prev != cached_prev:
+            # Read conaninfo
+            pref = PackageReference(ref, package_id)
+            info_path = os.path.join(package_layout.package(pref), CONANINFO)
+            if not os.path.exists(info_path):
+                logger.error("There is no ConanInfo: %s" % str(info_path))
                 continue
-        conan_vars_info = info.serialize_min()
+            conan_info_content = load(info_path)
+
+            info = ConanInfo.loads(conan_info_content)
+            conan_vars_info = info.serialize_min()
+            if prev:
+                updated[package_id] = (prev, recipe_revision, conan_vars_info)
         result[package_id] = conan_vars_info
 
+    # The packages summary is not written when searching, it is updated when the packages are
+    # created, downloaded, copied or removed
+    if index:
+        package_ids = set(package_ids)
+        removed = [package_id for package_id in cached if package_id not in package_ids]
+        for package_id, (prev, recipe_revision, conan_vars_info) in updated.items():
+            index.update_package(PackageReference(ref, package_id, prev), recipe_revision,
+                                 conan_vars_info)
+        if removed:
+            index.remove_packages(ref, removed)
+
     return result
@@ -49,6 +49,8 @@ class ConanServerConfigParser(ConfigParser):
                            "public_port": get_env("CONAN_SERVER_PUBLIC_PORT", None, environment),
                            "host_name": get_env("CONAN_HOST_NAME", None, environment),
                            "custom_authenticator": get_env("CONAN_CUSTOM_AUTHENTICATOR", None, environment),
+                           "workers": get_env("CONAN_SERVER_WORKERS", None, environment),
+                           "threads": get_env("CONAN_SERVER_THREADS", None, environment),
                            # "user:pass,user2:pass2"
                            "users": get_env("CONAN_SERVER_USERS", None, environment)}
 
@@ -157,6 +159,20 @@ class ConanServerConfigParser(ConfigParser):
         else:
             return self._get_file_conf("write_permissions")
 
+    @property
+    def workers(self):
+        try:
+            return int(self._get_conf_server_string("workers"))
+        except ConanException:
+            return 1
+
+    @property
+    def threads(self):
+        try:
+            return int(self._get_conf_server_string("threads"))
+        except ConanException:
+            return 1
+
     @property
     def custom_authenticator(self):
         try:
@@ -11,6 +11,11 @@ port: 9300
 public_port:
 host_name: localhost
 
+# Serving of the requests: "workers" processes (a single one in Windows), each one serving up to
+# "threads" connections concurrently. By default a single thread serves all the requests
+workers: 1
+threads: 1
+
 # Authorize timeout are seconds the client has to upload/download files until authorization expires
 authorize_timeout: 1800
 
@@ -45,14 +45,17 @@ class ServerLauncher(object):
         self.server = ConanServer(server_config.port, credentials_manager, updown_auth_manager,
                                   authorizer, authenticator, server_store,
                                   server_capabilities)
+        self._workers = server_config.workers
+        self._threads = server_config.threads
         if not self.force_migration:
             print("***********************")
             print("Using config: %s" % server_config.config_filename)
             print("Storage: %s" % server_config.disk_storage_path)
             print("Public URL: %s" % server_config.public_url)
             print("PORT: %s" % server_config.port)
+            print("WORKERS: %s, THREADS: %s" % (self._workers, self._threads))
             print("***********************")
 
     def launch(self):
         if not self.force_migration:
-            self.server.run(host="0.0.0.0")
+            self.server.run(host="0.0.0.0", workers=self._workers, threads=self._threads)
@@ -5,6 +5,7 @@ from conans.server.rest.controller.common.ping import PingController
 from conans.server.rest.controller.common.users import UsersController
 from conans.server.rest.controller.v2.conan import ConanControllerV2
 from conans.server.rest.controller.v2.delete import DeleteControllerV2
+from conans.server.rest.controller.v2.metadata import MetadataController
 from conans.server.rest.controller.v2.revisions import RevisionsController
 from conans.server.rest.controller.v2.search import SearchControllerV2
 
@@ -27,6 +28,7 @@ class ApiV2(ApiV1):
         DeleteControllerV2().attach_to(self)
         ConanControllerV2().attach_to(self)
         RevisionsController().attach_to(self)
+        MetadataController().attach_to(self)
 
         # Install users controller
         UsersController().attach_to(self)
@@ -0,0 +1,30 @@
+import codecs
+import json
+
+from bottle import request
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.server.rest.bottle_routes import BottleRoutes
+from conans.server.service.v2.service_v2 import ConanServiceV2
+
+
+class MetadataController(object):
+    """
+        Serve the revisions, file lists and manifests of many references in one request
+    """
+    @staticmethod
+    def attach_to(app):
+
+        r = BottleRoutes()
+
+        @app.route(r.batch_metadata, method="POST")
+        def get_metadata(auth_user):
+            """ Gets a JSON with the metadata of the "recipes" and "packages" references in the
+            body, the results are in the same order than the requested references
+            """
+            reader = codecs.getreader("utf-8")
+            payload = json.load(reader(request.body))
+            refs = [ConanFileReference.loads(ref) for ref in payload.get("recipes", [])]
+            prefs = [PackageReference.loads(pref) for pref in payload.get("packages", [])]
+            conan_service = ConanServiceV2(app.authorizer, app.server_store)
+            return conan_service.get_metadata(refs, prefs, auth_user)
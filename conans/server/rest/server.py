@@ -1,7 +1,17 @@
+import os
+import signal
+import socket
+import sys
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
+from wsgiref.util import FileWrapper
+
 import bottle
+from six.moves import socketserver
 
 from conans.server.rest.api_v1 import ApiV1
 from conans.server.rest.api_v2 import ApiV2
+from conans.util.log import logger
 
 
 class ConanServer(object):
@@ -42,5 +52,110 @@ class ConanServer(object):
         port = kwargs.pop("port", self.run_port)
         debug_set = kwargs.pop("debug", False)
         host = kwargs.pop("host", "localhost")
-        bottle.Bottle.run(self.root_app, host=host,
+        workers = kwargs.pop("workers", 1)
+        threads = kwargs.pop("threads", 1)
+        if workers > 1 or threads > 1:
+            server = MultiWorkerServer(host=host, port=port, workers=workers, threads=threads)
+        else:
+            server = "wsgiref"  # The bottle default, a single thread serves all the requests
+        bottle.Bottle.run(self.root_app, server=server, host=host,
                           port=port, debug=debug_set, reloader=False)
+
+
+class _ThreadingWSGIServer(socketserver.ThreadingMixIn, WSGIServer):
+    """ serves every connection in a different thread, at most "threads" at the same time, the
+    rest of the connections wait in the listen backlog
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, threads):
+        self._connections = threading.BoundedSemaphore(threads)
+        WSGIServer.__init__(self, server_address, handler_class)
+
+    def get_request(self):
+        connection, client_address = WSGIServer.get_request(self)
+        connection.setblocking(True)  # The listen socket is non-blocking, shared among workers
+        return connection, client_address
+
+    def process_request(self, request, client_address):
+        self._connections.acquire()
+        try:
+            socketserver.ThreadingMixIn.process_request(self, request, client_address)
+        except Exception:
+            self._connections.release()
+            raise
+
+    def process_request_thread(self, request, client_address):
+        try:
+            socketserver.ThreadingMixIn.process_request_thread(self, request, client_address)
+        finally:
+            self._connections.release()
+
+
+class _RequestHandler(WSGIRequestHandler):
+    quiet = False
+
+    def address_string(self):  # Prevent reverse DNS lookups
+        return self.client_address[0]
+
+    def log_request(self, *args, **kwargs):
+        if not self.quiet:
+            WSGIRequestHandler.log_request(self, *args, **kwargs)
+
+
+class MultiWorkerServer(bottle.ServerAdapter):
+    """ Production serving mode: "workers" processes forked after opening the listen socket
+    (a single one in Windows), each one serving up to "threads" connections concurrently. The
+    downloaded files are streamed in big chunks. The store files are coordinated among workers
+    and threads with the ServerDiskAdapter locks.
+    """
+    stream_block_size = 1024 * 1024
+
+    def run(self, handler):
+        workers = self.options.get("workers", 1)
+        threads = self.options.get("threads", 1)
+        _RequestHandler.quiet = self.quiet
+        server_class = _ThreadingWSGIServer
+        if ":" in self.host:  # IPv6
+            class server_class(_ThreadingWSGIServer):
+                address_family = socket.AF_INET6
+
+        server = server_class((self.host, self.port), _RequestHandler, threads)
+        server.set_app(self._streaming(handler))
+        if workers <= 1 or not hasattr(os, "fork"):
+            server.serve_forever()
+            return
+
+        # Only one of the workers accepts each connection, the others go on waiting
+        server.socket.setblocking(False)
+        children = []
+        for _ in range(workers):
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+        logger.debug("SERVER: Started workers %s" % children)
+        # Stopping the main process stops the workers too
+        signal.signal(signal.SIGTERM, lambda *args: sys.exit(0))
+        try:
+            for pid in children:
+                os.waitpid(pid, 0)
+        finally:
+            for pid in children:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except OSError:  # Already finished
+                    pass
+            server.server_close()
+
+    def _streaming(self, app):
+        block_size = self.stream_block_size
+
+        def streaming_app(environ, start_response):
+            environ["wsgi.file_wrapper"] = lambda f, _=None: FileWrapper(f, block_size)
+            return app(environ, start_response)
+        return streaming_app
@@ -2,14 +2,10 @@ import os
 import re
 from fnmatch import translate
 
-from conans import load
-from conans.errors import NotFoundException, ForbiddenException, RecipeNotFoundException
-from conans.model.info import ConanInfo
-from conans.model.ref import PackageReference, ConanFileReference
-from conans.paths import CONANINFO
+from conans.errors import ForbiddenException, RecipeNotFoundException
+from conans.model.ref import ConanFileReference
 from conans.search.search import filter_packages, _partial_match
 from conans.util.files import list_folder_subdirs
-from conans.util.log import logger
 
 
 def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
@@ -19,28 +15,8 @@ def _get_local_infos_min(server_store, ref, look_in_all_rrevs):
 
     for rrev in rrevs:
         new_ref = ref.copy_with_rev(rrev.revision) if rrev else ref
-        subdirs = list_folder_subdirs(server_store.packages(new_ref), level=1)
-        for package_id in subdirs:
-            if package_id in result:
-                continue
-            # Read conaninfo
-            try:
-                pref = PackageReference(new_ref, package_id)
-                revision_entry = server_store.get_last_package_revision(pref)
-                if not revision_entry:
-                    raise NotFoundException("")
-                pref = PackageReference(new_ref, package_id, revision_entry.revision)
-                info_path = os.path.join(server_store.package(pref), CONANINFO)
-                if not os.path.exists(info_path):
-                    raise NotFoundException("")
-                conan_info_content = load(info_path)
-                info = ConanInfo.loads(conan_info_content)
-                conan_vars_info = info.serialize_min()
-                result[package_id] = conan_vars_info
-            except Exception as exc:  # FIXME: Too wide
-                logger.error("Package %s has no ConanInfo file" % str(pref))
-                if str(exc):
-                    logger.error(str(exc))
+        for package_id, conan_vars_info in server_store.get_packages_search_info(new_ref).items():
+            result.setdefault(package_id, conan_vars_info)
     return result
 
 
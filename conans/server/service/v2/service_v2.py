@@ -2,11 +2,13 @@ import os
 
 from bottle import FileUpload, static_file
 
-from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException
+from conans.errors import RecipeNotFoundException, PackageNotFoundException, NotFoundException, \
+    ConanException, EXCEPTION_CODE_MAPPING
+from conans.paths import CONAN_MANIFEST, CONANINFO
 from conans.server.service.common.common import CommonService
 from conans.server.service.mime import get_mime_type
 from conans.server.store.server_store import ServerStore
-from conans.util.files import mkdir
+from conans.util.files import mkdir, load, sha1sum
 
 
 class ConanServiceV2(CommonService):
@@ -44,6 +46,12 @@ class ConanServiceV2(CommonService):
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_revision(reference)
 
+    def deploy_recipe_file_checksum(self, headers, reference, filename, auth_user):
+        self._authorizer.check_write_conan(auth_user, reference)
+        path = self._server_store.get_conanfile_file_path(reference, filename)
+        self._deploy_checksum(headers, path)
+        self._server_store.update_last_revision(reference)
+
     def get_recipe_revisions(self, ref, auth_user):
         self._authorizer.check_read_conan(auth_user, ref)
         root = self._server_store.conan_revisions_root(ref.copy_clear_rev())
@@ -103,7 +111,74 @@ class ConanServiceV2(CommonService):
         # If the upload was ok, update the pointer to the latest
         self._server_store.update_last_package_revision(pref)
 
+    def deploy_package_file_checksum(self, headers, pref, filename, auth_user):
+        self._authorizer.check_write_conan(auth_user, pref.ref)
+        recipe_path = self._server_store.export(pref.ref)
+        if not os.path.exists(recipe_path):
+            raise RecipeNotFoundException(pref.ref)
+        path = self._server_store.get_package_file_path(pref, filename)
+        self._deploy_checksum(headers, path)
+        self._server_store.update_last_package_revision(pref)
+
+    # BATCHED METADATA
+    def get_metadata(self, refs, prefs, auth_user):
+        """ Latest revision, file list and manifest of every recipe, and also the conaninfo of
+        every package, in a single request. The errors are returned per reference, so a missing
+        binary doesn't fail the other ones.
+        """
+        return {"recipes": [self._batch_item(self._get_recipe_metadata, ref, auth_user)
+                            for ref in refs],
+                "packages": [self._batch_item(self._get_package_metadata, pref, auth_user)
+                             for pref in prefs]}
+
+    @staticmethod
+    def _batch_item(method, ref, auth_user):
+        try:
+            return method(ref, auth_user)
+        except ConanException as exc:
+            code = EXCEPTION_CODE_MAPPING.get(exc.__class__, 500)
+            return {"error": {"code": code, "message": str(exc)}}
+
+    def _get_recipe_metadata(self, ref, auth_user):
+        if ref.revision is None:
+            ref = ref.copy_with_rev(self.get_latest_revision(ref, auth_user).revision)
+        files = self.get_recipe_file_list(ref, auth_user)["files"]
+        path = self._server_store.get_conanfile_file_path(ref, CONAN_MANIFEST)
+        return {"reference": repr(ref),
+                "time": self._server_store.get_revision_time(ref),
+                "files": files,
+                "manifest": load(path) if CONAN_MANIFEST in files else None}
+
+    def _get_package_metadata(self, pref, auth_user):
+        if pref.ref.revision is None:
+            rrev = self.get_latest_revision(pref.ref, auth_user).revision
+            pref = pref.copy_with_revs(rrev, pref.revision)
+        if pref.revision is None:
+            prev = self.get_latest_package_revision(pref, auth_user).revision
+            pref = pref.copy_with_revs(pref.ref.revision, prev)
+        files = self.get_package_file_list(pref, auth_user)["files"]
+
+        def _contents(filename):
+            if filename in files:
+                return load(self._server_store.get_package_file_path(pref, filename))
+
+        return {"reference": repr(pref),
+                "time": self._server_store.get_package_revision_time(pref),
+                "files": files,
+                "manifest": _contents(CONAN_MANIFEST),
+                "conaninfo": _contents(CONANINFO)}
+
     # Misc
+    @staticmethod
+    def _deploy_checksum(headers, path):
+        """ Checksum deploy: the client doesn't need to send the file contents if the server
+        already has that file with the same checksum. Raises NotFound otherwise, so the file
+        is uploaded
+        """
+        sha1 = headers.get("X-Checksum-Sha1")
+        if not sha1 or not os.path.isfile(path) or sha1sum(path) != sha1:
+            raise NotFoundException("The file is not in the server, it has to be uploaded")
+
     @staticmethod
     def _upload_to_path(body, headers, path):
         file_saver = FileUpload(body, None,
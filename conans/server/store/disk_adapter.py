@@ -1,4 +1,7 @@
 import os
+import threading
+import weakref
+from contextlib import contextmanager
 
 import fasteners
 
@@ -89,13 +92,30 @@ class ServerDiskAdapter(object):
     def path_exists(self, path):
         return os.path.exists(path)
 
+    # The interprocess locks don't exclude the threads of the same process. The thread locks
+    # are removed when no thread is using them, not to keep one for every file of the server
+    _thread_locks = weakref.WeakValueDictionary()
+    _thread_locks_lock = threading.Lock()
+
+    @contextmanager
+    def lock(self, lock_file):
+        """ locks the lock_file among the threads and the processes (server workers), to do
+        several operations atomically. The read_file() and write_file() inside it must not lock
+        it again
+        """
+        with ServerDiskAdapter._thread_locks_lock:
+            thread_lock = ServerDiskAdapter._thread_locks.setdefault(lock_file, threading.Lock())
+        with thread_lock:
+            with fasteners.InterProcessLock(lock_file):
+                yield
+
     def read_file(self, path, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+        with self.lock(lock_file) if lock_file else no_op():
             with open(path) as f:
                 return f.read()
 
     def write_file(self, path, contents, lock_file):
-        with fasteners.InterProcessLock(lock_file) if lock_file else no_op():
+        with self.lock(lock_file) if lock_file else no_op():
             with open(path, "w") as f:
                 f.write(contents)
 
@@ -1,13 +1,36 @@
+import json
 import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from os.path import join, normpath, relpath
 
 from conans import DEFAULT_REVISION_V1
 from conans.errors import ConanException, PackageNotFoundException, RecipeNotFoundException
+from conans.model.info import ConanInfo
 from conans.model.ref import ConanFileReference, PackageReference
-from conans.paths import EXPORT_FOLDER, PACKAGES_FOLDER
+from conans.paths import CONANINFO, EXPORT_FOLDER, PACKAGES_FOLDER
 from conans.server.revision_list import RevisionList
+from conans.util.files import RACY_SECONDS, list_folder_subdirs
+from conans.util.log import logger
 
 REVISIONS_FILE = "revisions.txt"
+SEARCH_INDEX_FILE = "search_index.json"
+# Maximum number of revisions files kept in memory
+REVISIONS_CACHE_SIZE = 10000
+
+
+def _file_stamp(path):
+    """ [mtime, size] of the file, None if it doesn't exist or if it was modified in the last
+    RACY_SECONDS
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if stat.st_mtime > time.time() - RACY_SECONDS:
+        return None
+    return [getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size]
 
 
 class ServerStore(object):
@@ -15,6 +38,8 @@ class ServerStore(object):
     def __init__(self, storage_adapter):
         self._storage_adapter = storage_adapter
         self._store_folder = storage_adapter._store_folder
+        # {revisions file path: ((mtime, size, inode), RevisionList)}, least recently used first
+        self._revisions_cache = OrderedDict()
 
     @property
     def store(self):
@@ -116,8 +141,10 @@ class ServerStore(object):
         assert isinstance(ref, ConanFileReference)
         if not ref.revision:
             self._storage_adapter.delete_folder(self.conan_revisions_root(ref))
+            self._forget_revisions(self.conan_revisions_root(ref))
         else:
             self._storage_adapter.delete_folder(self.base_folder(ref))
+            self._forget_revisions(self.base_folder(ref))
             self._remove_revision_from_index(ref)
         self._delete_empty_dirs(ref)
 
@@ -128,12 +155,18 @@ class ServerStore(object):
         if not package_ids_filter:  # Remove all packages
             packages_folder = self.packages(ref)
             self._storage_adapter.delete_folder(packages_folder)
+            self._forget_revisions(packages_folder)
         else:
             for package_id in package_ids_filter:
                 pref = PackageReference(ref, package_id)
                 # Remove all package revisions
                 package_folder = self.package_revisions_root(pref)
                 self._storage_adapter.delete_folder(package_folder)
+                self._forget_revisions(package_folder)
+            with self._search_index(ref) as index:
+                for package_id in package_ids_filter:
+                    index.pop(package_id, None)
+            self._remove_empty_search_index(ref)
         self._delete_empty_dirs(ref)
 
     def remove_package(self, pref):
@@ -143,12 +176,14 @@ class ServerStore(object):
         package_folder = self.package(pref)
         self._storage_adapter.delete_folder(package_folder)
         self._remove_package_revision_from_index(pref)
+        self._update_search_index(pref)
 
     def remove_all_packages(self, ref):
         assert ref.revision is not None, "BUG: server store needs RREV remove_all_packages"
         assert isinstance(ref, ConanFileReference)
         packages_folder = self.packages(ref)
         self._storage_adapter.delete_folder(packages_folder)
+        self._forget_revisions(packages_folder)
 
     def remove_conanfile_files(self, ref, files):
         subpath = self.export(ref)
@@ -254,17 +289,18 @@ class ServerStore(object):
         self._update_last_revision(rev_file_path, pref)
 
     def _update_last_revision(self, rev_file_path, ref):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-        else:
-            rev_list = RevisionList()
         if ref.revision is None:
             raise ConanException("Invalid revision for: %s" % ref.full_str())
-        rev_list.add_revision(ref.revision)
-        self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
-                                         lock_file=rev_file_path + ".lock")
+        # Locked while it is read and written, not to lose concurrent revisions
+        with self._storage_adapter.lock(rev_file_path + ".lock"):
+            if self._storage_adapter.path_exists(rev_file_path):
+                rev_file = self._storage_adapter.read_file(rev_file_path, lock_file=None)
+                rev_list = RevisionList.loads(rev_file)
+            else:
+                rev_list = RevisionList()
+            rev_list.add_revision(ref.revision)
+            self._storage_adapter.write_file(rev_file_path, rev_list.dumps(), lock_file=None)
+            self._revisions_cache.pop(rev_file_path, None)
 
     def get_package_revisions(self, pref):
         """Returns a RevisionList"""
@@ -281,14 +317,40 @@ class ServerStore(object):
         return ret
 
     def _get_revisions_list(self, rev_file_path):
-        if self._storage_adapter.path_exists(rev_file_path):
-            rev_file = self._storage_adapter.read_file(rev_file_path,
-                                                       lock_file=rev_file_path + ".lock")
-            rev_list = RevisionList.loads(rev_file)
-            return rev_list
-        else:
+        try:
+            return self._read_revisions_file(rev_file_path)
+        except (IOError, OSError):  # It doesn't exist
             return RevisionList()
 
+    def _read_revisions_file(self, rev_file_path):
+        """ The RevisionList of the file, it is served from memory while the file doesn't
+        change. Other workers of the server can modify it too, so its mtime, size and inode are
+        checked every time. Files modified in the last RACY_SECONDS are not cached. Raises
+        IOError if the file doesn't exist. The returned RevisionList cannot be modified.
+        """
+        stat = os.stat(rev_file_path)
+        stamp = (getattr(stat, "st_mtime_ns", stat.st_mtime), stat.st_size, stat.st_ino)
+        cached = self._revisions_cache.pop(rev_file_path, None)
+        if cached and cached[0] == stamp:
+            self._revisions_cache[rev_file_path] = cached  # Now the most recently used
+            return cached[1]
+        rev_file = self._storage_adapter.read_file(rev_file_path,
+                                                   lock_file=rev_file_path + ".lock")
+        rev_list = RevisionList.loads(rev_file)
+        # The stamp is older than the contents if it was written meanwhile, it is read again
+        if stat.st_mtime < time.time() - RACY_SECONDS:
+            self._revisions_cache[rev_file_path] = (stamp, rev_list)
+            while len(self._revisions_cache) > REVISIONS_CACHE_SIZE:
+                self._revisions_cache.popitem(last=False)
+        return rev_list
+
+    def _forget_revisions(self, folder):
+        """ removes the cached revisions of the files inside a removed folder """
+        folder = os.path.join(folder, "")
+        for path in list(self._revisions_cache):
+            if path.startswith(folder):
+                self._revisions_cache.pop(path, None)
+
     def _get_latest_revision(self, rev_file_path):
         rev_list = self._get_revisions_list(rev_file_path)
         if not rev_list:
@@ -299,6 +361,7 @@ class ServerStore(object):
                 rev_list.add_revision(DEFAULT_REVISION_V1)
                 self._storage_adapter.write_file(rev_file_path, rev_list.dumps(),
                                                  lock_file=rev_file_path + ".lock")
+                self._revisions_cache.pop(rev_file_path, None)
                 return rev_list.latest_revision()
             else:
                 return None
@@ -330,29 +393,105 @@ class ServerStore(object):
         return rev_list.get_time(pref.revision)
 
     def _remove_revision_from_index(self, ref):
-        rev_list = self._load_revision_list(ref)
-        rev_list.remove_revision(ref.revision)
-        self._save_revision_list(rev_list, ref)
+        self._remove_revision(self._recipe_revisions_file(ref), ref.revision)
 
     def _remove_package_revision_from_index(self, pref):
-        rev_list = self._load_package_revision_list(pref)
-        rev_list.remove_revision(pref.revision)
-        self._save_package_revision_list(rev_list, pref)
+        self._remove_revision(self._package_revisions_file(pref), pref.revision)
 
-    def _load_revision_list(self, ref):
-        path = self._recipe_revisions_file(ref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
-
-    def _save_revision_list(self, rev_list, ref):
-        path = self._recipe_revisions_file(ref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+    def _remove_revision(self, rev_file_path, revision):
+        with self._storage_adapter.lock(rev_file_path + ".lock"):
+            rev_file = self._storage_adapter.read_file(rev_file_path, lock_file=None)
+            rev_list = RevisionList.loads(rev_file)
+            rev_list.remove_revision(revision)
+            self._storage_adapter.write_file(rev_file_path, rev_list.dumps(), lock_file=None)
+            self._revisions_cache.pop(rev_file_path, None)
 
-    def _save_package_revision_list(self, rev_list, pref):
-        path = self._package_revisions_file(pref)
-        self._storage_adapter.write_file(path, rev_list.dumps(), lock_file=path + ".lock")
+    def _load_revision_list(self, ref):
+        return self._read_revisions_file(self._recipe_revisions_file(ref))
 
     def _load_package_revision_list(self, pref):
-        path = self._package_revisions_file(pref)
-        rev_file = self._storage_adapter.read_file(path, lock_file=path + ".lock")
-        return RevisionList.loads(rev_file)
+        return self._read_revisions_file(self._package_revisions_file(pref))
+
+    # Packages search index
+    def get_packages_search_info(self, ref):
+        """ Returns {package_id: conaninfo serialize_min()} of the latest revision of every
+        package of the recipe revision. They are read from the search index, the packages not
+        indexed yet, or whose latest revision or conaninfo.txt changed, are read from disk and
+        indexed again
+        """
+        package_ids = list_folder_subdirs(self.packages(ref), level=1)
+        if not package_ids:
+            return {}
+        with self._search_index(ref) as index:
+            for package_id in set(index).difference(package_ids):
+                index.pop(package_id)
+            for package_id in package_ids:
+                self._index_package(index, PackageReference(ref, package_id))
+            return {package_id: entry["info"] for package_id, entry in index.items()}
+
+    def _update_search_index(self, pref):
+        """ the latest revision of the package changed, index its conaninfo again """
+        with self._search_index(pref.ref) as index:
+            self._index_package(index, pref.copy_clear_prev())
+
+    def _index_package(self, index, pref):
+        """ the entry of the package is kept while the latest revision of the package and the
+        stamp of its conaninfo.txt don't change, otherwise it is read again
+        """
+        revision_entry = self.get_last_package_revision(pref)
+        if not revision_entry:
+            index.pop(pref.id, None)
+            return
+        pref = pref.copy_with_revs(pref.ref.revision, revision_entry.revision)
+        info_path = os.path.join(self.package(pref), CONANINFO)
+        stamp = _file_stamp(info_path)
+        entry = index.get(pref.id)
+        if (stamp is not None and entry and entry["revision"] == pref.revision and
+                entry.get("stamp") == stamp):
+            return
+        index.pop(pref.id, None)
+        if not os.path.exists(info_path):
+            # Still being uploaded or corrupted, it is indexed when it is searched again
+            logger.debug("Package %s has no ConanInfo file" % str(pref))
+            return
+        try:
+            info = ConanInfo.load_file(info_path)
+        except Exception as exc:
+            logger.error("Package %s has an invalid ConanInfo file: %s" % (str(pref), str(exc)))
+            return
+        index[pref.id] = {"revision": pref.revision, "stamp": stamp, "info": info.serialize_min()}
+
+    def _remove_empty_search_index(self, ref):
+        """ the search index files are removed with the last package of the recipe revision """
+        packages_folder = self.packages(ref)
+        if not os.path.isdir(packages_folder) or list_folder_subdirs(packages_folder, level=1):
+            return
+        path = join(packages_folder, SEARCH_INDEX_FILE)
+        with self._storage_adapter.lock(path + ".lock"):
+            if os.path.exists(path):
+                os.unlink(path)
+        try:
+            os.unlink(path + ".lock")
+        except OSError:  # Other process is using it
+            pass
+
+    @contextmanager
+    def _search_index(self, ref):
+        """ {package_id: {"revision": prev, "info": conaninfo serialize_min()}} of a recipe
+        revision. The file is locked while it is being updated
+        """
+        packages_folder = self.packages(ref)
+        if not os.path.isdir(packages_folder):
+            yield {}
+            return
+        path = join(packages_folder, SEARCH_INDEX_FILE)
+        with self._storage_adapter.lock(path + ".lock"):
+            try:
+                contents = self._storage_adapter.read_file(path, lock_file=None)
+                index = json.loads(contents)
+            except (IOError, OSError, ValueError):
+                contents, index = None, {}
+            yield index
+            new_contents = json.dumps(index)
+            if new_contents != contents:
+                self._storage_adapter.write_file(path, new_contents, lock_file=None)
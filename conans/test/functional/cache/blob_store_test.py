@@ -0,0 +1,56 @@
+import os
+import platform
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient
+from conans.util.files import load
+
+
+@unittest.skipIf(platform.system() == "Windows", "Hardlinks need NTFS and admin rights")
+class BlobStoreTest(unittest.TestCase):
+
+    def _package_file(self, client, ref, filename):
+        ref = ConanFileReference.loads(ref)
+        layout = client.cache.package_layout(ref)
+        package_id = layout.package_ids()[0]
+        return os.path.join(layout.package(PackageReference(ref, package_id)), filename)
+
+    def test_share_package_files(self):
+        client = TestClient(default_server_user=True)
+        blob_folder = os.path.join(client.cache_folder, "blobs")
+        client.run('config set "storage.blob_store=%s"' % blob_folder)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports = "*"
+                def package(self):
+                    self.copy("*.h")
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "header.h": "header"})
+        client.run("create . pkga/0.1@user/testing")
+        client.run("create . pkgb/0.1@user/testing")
+
+        header_a = self._package_file(client, "pkga/0.1@user/testing", "header.h")
+        header_b = self._package_file(client, "pkgb/0.1@user/testing", "header.h")
+        self.assertTrue(os.path.samefile(header_a, header_b))
+        self.assertEqual(3, os.stat(header_a).st_nlink)
+        # The files rewritten by Conan are not shared
+        info_a = self._package_file(client, "pkga/0.1@user/testing", "conaninfo.txt")
+        self.assertEqual(1, os.stat(info_a).st_nlink)
+
+        # Downloaded packages are shared too
+        client.run("upload pkga* --all --confirm")
+        client.run("remove pkga* -f")
+        self.assertEqual(2, os.stat(header_b).st_nlink)
+        client.run("install pkga/0.1@user/testing")
+        header_a = self._package_file(client, "pkga/0.1@user/testing", "header.h")
+        self.assertTrue(os.path.samefile(header_a, header_b))
+        self.assertEqual("header", load(header_a))
+
+        # The blobs not used by any package are removed
+        client.run("remove * -f")
+        blobs = [f for _, _, files in os.walk(blob_folder) for f in files]
+        self.assertEqual([], blobs)
@@ -0,0 +1,77 @@
+import os
+import textwrap
+import unittest
+
+from conans.client.cache.cache import CACHE_INDEX
+from conans.client.cache.cache_index import CacheIndex
+from conans.model.ref import ConanFileReference
+from conans.test.utils.tools import TestClient
+from conans.util.files import rmdir
+
+
+class CacheIndexTest(unittest.TestCase):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            options = {"shared": [True, False]}
+            default_options = {"shared": False}
+        """)
+
+    def test_search(self):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile})
+        # Existing packages are indexed the first time
+        client.run("create . pkg/0.1@user/testing")
+        client.run("config set general.cache_index=True")
+        client.run("create . other/0.1@user/testing -o other:shared=True")
+
+        index = CacheIndex(os.path.join(client.cache.store, CACHE_INDEX))
+        self.assertEqual([ConanFileReference.loads("other/0.1@user/testing"),
+                          ConanFileReference.loads("pkg/0.1@user/testing")], index.refs())
+        client.run("search")
+        self.assertIn("other/0.1@user/testing", client.out)
+        self.assertIn("pkg/0.1@user/testing", client.out)
+
+        client.run('search other/0.1@user/testing -q "shared=True"')
+        self.assertIn("shared: True", client.out)
+        other = ConanFileReference.loads("other/0.1@user/testing")
+        _, _, info = list(index.packages(other).values())[0]
+        self.assertEqual({"shared": "True"}, info["options"])
+
+        # A new package revision, with different contents, is updated in the index
+        client.save({"conanfile.py": self.conanfile.replace("False}", "True}")})
+        client.run("create . other/0.1@user/testing")
+        client.run('search other/0.1@user/testing -q "shared=True"')
+        self.assertIn("shared: True", client.out)
+
+        # Packages removed by other paths are not listed
+        layout = client.cache.package_layout(other)
+        for package_id in layout.package_ids():
+            rmdir(os.path.join(layout.packages(), package_id))
+        client.run("search other/0.1@user/testing")
+        self.assertIn("There are no packages", client.out)
+        self.assertEqual({}, index.packages(other))
+
+        client.run("remove other* -f")
+        self.assertEqual([ConanFileReference.loads("pkg/0.1@user/testing")], index.refs())
+        client.run("search")
+        self.assertNotIn("other/0.1@user/testing", client.out)
+        client.run("search pkg/0.1@user/testing")
+        self.assertIn("shared: False", client.out)
+
+    def test_removed_recipe_folder(self):
+        client = TestClient()
+        client.run("config set general.cache_index=True")
+        client.save({"conanfile.py": self.conanfile})
+        client.run("export . pkg/1.0@user/testing")
+        client.run("export . other/1.0@user/testing")
+        client.run("search")
+        self.assertIn("pkg/1.0@user/testing", client.out)
+
+        # Recipes removed by other paths are not listed, and they are removed from the index
+        rmdir(os.path.join(client.cache.store, "pkg"))
+        client.run("search")
+        self.assertNotIn("pkg/1.0@user/testing", client.out)
+        self.assertIn("other/1.0@user/testing", client.out)
+        index = CacheIndex(os.path.join(client.cache.store, CACHE_INDEX))
+        self.assertEqual([ConanFileReference.loads("other/1.0@user/testing")], index.refs())
@@ -0,0 +1,85 @@
+import os
+import textwrap
+import unittest
+
+from conans.migrations import CONAN_VERSION
+from conans.model.ref import ConanFileReference
+from conans.paths import CONANINFO
+from conans.test.utils.tools import TestClient
+from conans.util.files import load, rmdir, save
+
+
+class PackagesSummaryTest(unittest.TestCase):
+    conanfile = textwrap.dedent("""
+        from conans import ConanFile
+        class Pkg(ConanFile):
+            settings = "os"
+            options = {"shared": [True, False]}
+            default_options = {"shared": False}
+        """)
+
+    def test_search(self):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile})
+        client.run("create . pkg/0.1@user/testing -s os=Linux")
+        client.run("create . pkg/0.1@user/testing -s os=Windows -o pkg:shared=True")
+        ref = ConanFileReference.loads("pkg/0.1@user/testing")
+        layout = client.cache.package_layout(ref)
+
+        # The packages are summarized when they are created
+        summary = layout.load_packages_summary()
+        self.assertEqual(sorted(layout.package_ids()), sorted(summary.packages))
+        settings = sorted(info["settings"]["os"] for _, _, info in summary.packages.values())
+        self.assertEqual(["Linux", "Windows"], settings)
+
+        # The search doesn't need to read the conaninfo.txt files
+        for package_id in layout.package_ids():
+            save(os.path.join(layout.packages(), package_id, CONANINFO), "[settings]\nos=Other")
+        client.run('search pkg/0.1@user/testing -q "os=Linux AND shared=False"')
+        self.assertIn("os: Linux", client.out)
+        self.assertNotIn("os: Windows", client.out)
+        self.assertNotIn("Other", client.out)
+
+        # With a broken summary the conaninfo.txt files are read, the search doesn't write it
+        save(layout.packages_summary(), "broken")
+        client.run('search pkg/0.1@user/testing -q "os=Other"')
+        self.assertIn("os: Other", client.out)
+        self.assertEqual("broken", load(layout.packages_summary()))
+
+        # Packages removed by other paths are not listed
+        for package_id in layout.package_ids():
+            rmdir(os.path.join(layout.packages(), package_id))
+        client.run("search pkg/0.1@user/testing")
+        self.assertIn("There are no packages", client.out)
+
+    def test_copy(self):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile})
+        client.run("create . pkg/0.1@user/testing -s os=Linux")
+        client.run("copy pkg/0.1@user/testing other/channel --all")
+        layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.1@other/channel"))
+        summary = layout.load_packages_summary()
+        self.assertEqual(layout.package_ids(), list(summary.packages))
+
+    def test_migration(self):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile})
+        client.run("create . pkg/0.1@user/testing -s os=Linux")
+        layout = client.cache.package_layout(ConanFileReference.loads("pkg/0.1@user/testing"))
+        os.remove(layout.packages_summary())
+
+        # The caches of the previous versions are summarized by a migration
+        save(os.path.join(client.cache_folder, CONAN_VERSION), "1.30.0")
+        client.run("search")
+        summary = layout.load_packages_summary()
+        self.assertEqual(layout.package_ids(), list(summary.packages))
+        _, _, info = list(summary.packages.values())[0]
+        self.assertEqual("Linux", info["settings"]["os"])
+
+    def test_invalid_query(self):
+        client = TestClient()
+        client.save({"conanfile.py": self.conanfile})
+        client.run("create . pkg/0.1@user/testing -s os=Linux")
+        client.run('search pkg/0.1@user/testing -q "os=Linux AND !shared=True"', assert_error=True)
+        self.assertIn("Invalid package query: os=Linux AND !shared=True. "
+                      "'!' character is not allowed", client.out)
@@ -0,0 +1,63 @@
+import os
+import time
+import unittest
+from collections import OrderedDict
+
+from conans.client.cache.tgz_cache import TgzCache
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.test_files import temp_folder
+from conans.test.utils.tools import NO_SETTINGS_PACKAGE_ID, TestClient, TestServer, \
+    GenConanfile
+from conans.util.files import load, save
+
+
+class TgzCacheTest(unittest.TestCase):
+
+    def test_upload_downloaded_package(self):
+        servers = OrderedDict([("server1", TestServer()), ("server2", TestServer())])
+        client = TestClient(servers=servers, users={"server1": [("lasote", "mypass")],
+                                                    "server2": [("lasote", "mypass")]})
+        tgz_folder = os.path.join(client.cache_folder, "tgz_cache")
+        client.run('config set "storage.tgz_cache=%s"' % tgz_folder)
+        client.save({"conanfile.py": GenConanfile().with_package_file("file.h", "contents")})
+        client.run("create . pkg/0.1@lasote/testing")
+        client.run("upload pkg/0.1@lasote/testing --all -r server1 --confirm")
+        self.assertIn("Compressing package...", client.out)
+        self.assertEqual(1, len(os.listdir(tgz_folder)))
+
+        # The downloaded tgz is kept, it is not compressed again to upload it to other remote
+        client.run("remove * -f")
+        client.run("install pkg/0.1@lasote/testing -r server1")
+        client.run("upload pkg/0.1@lasote/testing --all -r server2 --confirm")
+        self.assertIn("Uploading conan_package.tgz", client.out)
+        self.assertNotIn("Compressing package...", client.out)
+        self.assertEqual(1, len(os.listdir(tgz_folder)))
+
+        client.run("remove * -f")
+        client.run("install pkg/0.1@lasote/testing -r server2")
+        self.assertIn("pkg/0.1@lasote/testing: Package installed", client.out)
+        ref = ConanFileReference.loads("pkg/0.1@lasote/testing")
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        package_folder = client.cache.package_layout(ref).package(pref)
+        self.assertEqual("contents", load(os.path.join(package_folder, "file.h")))
+
+    def test_least_recently_used(self):
+        folder = temp_folder()
+        tgz_cache = TgzCache(os.path.join(folder, "cache"), max_size=25)
+        for name in ("a", "b", "c"):
+            save(os.path.join(folder, name), name * 10)
+            tgz_cache.store(name, os.path.join(folder, name))
+            time.sleep(0.01)  # Different modification times
+
+        # The "a" file was the least recently used one
+        self.assertFalse(tgz_cache.get("a", os.path.join(folder, "a.tgz")))
+        self.assertTrue(tgz_cache.get("b", os.path.join(folder, "b.tgz")))
+        self.assertEqual("b" * 10, load(os.path.join(folder, "b.tgz")))
+        time.sleep(0.01)
+
+        # Now "c" is the least recently used one
+        save(os.path.join(folder, "d"), "d" * 10)
+        tgz_cache.store("d", os.path.join(folder, "d"))
+        self.assertFalse(tgz_cache.get("c", os.path.join(folder, "c.tgz")))
+        self.assertTrue(tgz_cache.get("b", os.path.join(folder, "b2.tgz")))
+        self.assertTrue(tgz_cache.get("d", os.path.join(folder, "d.tgz")))
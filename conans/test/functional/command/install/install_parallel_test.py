@@ -28,3 +28,52 @@ class InstallParallelTest(unittest.TestCase):
         self.assertIn("Downloading binary packages in %s parallel threads" % threads, client.out)
         for i in range(counter):
             self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+
+    def build_while_downloading_test(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.parallel_download=2")
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(3):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.save({"conanfile.py": GenConanfile().with_require("pkg0/0.1@user/testing")})
+        client.run("export . app/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.save({"conanfile.txt": "[requires]\napp/0.1@user/testing\n"
+                                      "pkg1/0.1@user/testing\npkg2/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install . --build=missing")
+        self.assertIn("Downloading binary packages in 2 parallel threads", client.out)
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        # The dependency is always available before its consumer is built
+        self.assertLess(str(client.out).index("pkg0/0.1@user/testing: Package installed"),
+                        str(client.out).index("app/0.1@user/testing: Calling build()"))
+
+    def parallel_recipe_download_test(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.parallel_recipe_download=4")
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(3):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.save({"conanfile.py": GenConanfile().with_require("pkg0/0.1@user/testing")
+                                                   .with_require("pkg1/0.1@user/testing")})
+        client.run("create . app/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+
+        client.save({"conanfile.txt": "[requires]\napp/0.1@user/testing\n"
+                                      "pkg1/0.1@user/testing\npkg2/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install .")
+        for name in ("app", "pkg0", "pkg1", "pkg2"):
+            self.assertIn("%s/0.1@user/testing: Downloaded recipe revision" % name, client.out)
+            self.assertIn("%s/0.1@user/testing: Package installed" % name, client.out)
+        self.assertIn("pkg1/0.1@user/testing from 'default' - Downloaded", client.out)
+
+        client.run("remove * -f")
+        client.save({"conanfile.txt": "[requires]\npkg1/0.1@user/testing\n"
+                                      "missing/0.1@user/testing"})
+        client.run("install .", assert_error=True)
+        self.assertIn("Unable to find 'missing/0.1@user/testing' in remotes", client.out)
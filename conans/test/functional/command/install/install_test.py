@@ -627,3 +627,33 @@ class Pkg(ConanFile):
         self.assertIn("pkg/0.1@user/channel from local cache - Cache", client.out)
         client.run("install pkg/[0.*]@user/channel")
         self.assertIn("pkg/0.1@user/channel from local cache - Cache", client.out)
+
+    def install_stream_package_download_test(self):
+        client = TestClient(default_server_user=True)
+        client.run("config set general.revisions_enabled=1")
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports_sources = "*"
+                def package(self):
+                    self.copy("*")
+            """)
+        client.save({"conanfile.py": conanfile,
+                     "include/header.h": "header"})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        pref = PackageReference(ConanFileReference.loads("pkg/0.1@user/testing"),
+                                NO_SETTINGS_PACKAGE_ID)
+        layout = client.cache.package_layout(pref.ref)
+        client.run("remove * -f")
+        client.run("install pkg/0.1@user/testing")
+        checksums = layout.load_metadata().packages[pref.id].checksums
+
+        client.run("remove * -f")
+        client.run("config set general.stream_package_download=True")
+        client.run("install pkg/0.1@user/testing")
+        self.assertIn("pkg/0.1@user/testing: Package installed %s" % pref.id, client.out)
+        package_folder = layout.package(pref)
+        self.assertEqual("header", client.load(os.path.join(package_folder, "include/header.h")))
+        self.assertFalse(os.path.exists(os.path.join(package_folder, "conan_package.tgz")))
+        self.assertEqual(checksums, layout.load_metadata().packages[pref.id].checksums)
@@ -1,6 +1,7 @@
 import os
 import platform
 import stat
+import textwrap
 import unittest
 from collections import OrderedDict
 
@@ -88,7 +89,14 @@ class UploadTest(unittest.TestCase):
             client.run("upload * --all --confirm")
             self.assertNotIn("Uploading conan_package.tgz", client.out)
             self.assertIn("Package is up to date, upload skipped", client.out)
+            # The new package has no checksums, it is compressed to compute them but not uploaded
             self.assertIn("Compressing package...", client.out)
+            metadata = client.cache.package_layout(pref.ref).load_metadata()
+            self.assertIn("conan_package.tgz", metadata.packages[pref.id].checksums)
+            client.run("upload * --all --confirm")
+            self.assertIn("Package is up to date, upload skipped", client.out)
+            # The remote manifest is the same, the package is not even compressed
+            self.assertNotIn("Compressing package...", client.out)
 
         client.run("upload * --all --confirm --force")
         self.assertIn("Uploading conanfile.py", client.out)
@@ -891,3 +899,60 @@ class MyPkg(ConanFile):
             "pkg/1.0@user/channel#{}:{} --revisions  -r default".format(pref.ref.revision, pref.id))[
             0]
         self.assertIn(pref.revision, search_result["revision"])
+
+    def upload_files_order_test(self):
+        class RecordPutsRequester(TestRequester):
+            puts = []
+
+            def put(self, url, **kwargs):
+                if "X-Checksum-Deploy" not in kwargs.get("headers", {}):
+                    RecordPutsRequester.puts.append(url.split("?")[0].rsplit("/", 1)[1])
+                return super(RecordPutsRequester, self).put(url, **kwargs)
+
+        client = TestClient(requester_class=RecordPutsRequester, default_server_user=True)
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                exports = "*.txt"
+                exports_sources = "*.h"
+            """)
+        client.save({"conanfile.py": conanfile, "data.txt": "data", "header.h": "header"})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("user user -p password -r default")
+        client.run("upload pkg/0.1@user/testing --all --parallel")
+        self.assertIn("Uploaded conan recipe 'pkg/0.1@user/testing' to 'default'", client.out)
+
+        # The tgz files are uploaded first and the manifest the last one, even if the files are
+        # uploaded concurrently
+        recipe_puts, package_puts = RecordPutsRequester.puts[:4], RecordPutsRequester.puts[4:]
+        self.assertEqual(["conan_export.tgz", "conan_sources.tgz"], sorted(recipe_puts[:2]))
+        self.assertEqual(["conanfile.py", "conanmanifest.txt"], recipe_puts[2:])
+        self.assertEqual(["conan_package.tgz", "conaninfo.txt", "conanmanifest.txt"], package_puts)
+
+    def checksum_deploy_test(self):
+        class RecordUploadsRequester(TestRequester):
+            uploads = []
+
+            def put(self, url, **kwargs):
+                response = super(RecordUploadsRequester, self).put(url, **kwargs)
+                if "X-Checksum-Deploy" not in kwargs.get("headers", {}):
+                    RecordUploadsRequester.uploads.append(url.split("?")[0].rsplit("/", 1)[1])
+                return response
+
+        server = TestServer()
+        client = TurboTestClient(servers={"default": server}, revisions_enabled=True,
+                                 requester_class=RecordUploadsRequester)
+        ref = ConanFileReference.loads("lib/1.0@conan/testing")
+        pref = client.create(ref, conanfile=GenConanfile().with_package_file("file.h", "foo"))
+        client.upload_all(ref)
+        self.assertIn("conan_package.tgz", RecordUploadsRequester.uploads)
+
+        # Simulate a broken previous upload, without the package manifest
+        os.unlink(os.path.join(server.server_store.package(pref), "conanmanifest.txt"))
+        RecordUploadsRequester.uploads = []
+        client.run("remove * -f")
+        client.create(ref, conanfile=GenConanfile().with_package_file("file.h", "foo"))
+        client.upload_all(ref)
+        self.assertIn("Compressing package...", client.out)
+        # The server already has the same conan_package.tgz, it is not transferred again
+        self.assertEqual(["conanmanifest.txt"], RecordUploadsRequester.uploads)
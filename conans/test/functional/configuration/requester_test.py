@@ -99,3 +99,38 @@ class ConanRequesterHeadersTests(unittest.TestCase):
         requester.get(url="aaa", headers={"User-Agent": "MyUserAgent"})
         headers = mock_http_requester.get.call_args[1]["headers"]
         self.assertEqual("MyUserAgent", headers["User-Agent"])
+
+    def keep_alive_test(self):
+        cache_folder = temp_folder()
+        cache = ClientCache(cache_folder, TestBufferConanOutput())
+        mock_http_requester = MagicMock()
+        requester = ConanRequester(cache.config, mock_http_requester)
+        requester.get(url="aaa")
+        headers = mock_http_requester.get.call_args[1]["headers"]
+        self.assertNotIn("Connection", headers)
+
+        with environment_append({"CONAN_HTTP_KEEP_ALIVE": "False"}):
+            requester = ConanRequester(cache.config, mock_http_requester)
+        requester.get(url="aaa")
+        headers = mock_http_requester.get.call_args[1]["headers"]
+        self.assertEqual("close", headers["Connection"])
+
+
+class ConanRequesterPoolTests(unittest.TestCase):
+    def pool_size_test(self):
+        cache = ClientCache(temp_folder(), TestBufferConanOutput())
+        with environment_append({"CONAN_CPU_COUNT": "2"}):
+            requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(10, adapter._pool_maxsize)
+        self.assertEqual({}, requester.connection_stats())
+
+        cache.config.set_item("general.parallel_download", "16")
+        requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(16, adapter._pool_maxsize)
+
+        cache.config.set_item("general.connection_pool_size", "4")
+        requester = ConanRequester(cache.config)
+        adapter = requester._http_requester.get_adapter("https://myremote.com")
+        self.assertEqual(4, adapter._pool_maxsize)
@@ -0,0 +1,145 @@
+import json
+import textwrap
+import unittest
+from collections import OrderedDict
+
+from conans import REVISIONS
+from conans.model.ref import PackageReference
+from conans.test.utils.tools import TestClient, TestServer, TestRequester, GenConanfile, \
+    NO_SETTINGS_PACKAGE_ID
+
+
+class RecordingRequester(TestRequester):
+    urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(("GET", url))
+        return super(RecordingRequester, self).get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        self.urls.append(("POST", url))
+        return super(RecordingRequester, self).post(url, **kwargs)
+
+
+class BatchMetadataTest(unittest.TestCase):
+
+    def _client(self, server_capabilities=None):
+        server = TestServer(users={"user": "password"}, server_capabilities=server_capabilities)
+        servers = OrderedDict([("default", server)])
+        client = TestClient(servers=servers, users={"default": [("user", "password")]},
+                            requester_class=RecordingRequester, revisions_enabled=True)
+        client.save({"conanfile.py": GenConanfile()})
+        for i in range(3):
+            client.run("create . pkg%s/0.1@user/testing" % i)
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.save({"conanfile.txt": "[requires]\npkg0/0.1@user/testing\n"
+                                      "pkg1/0.1@user/testing\npkg2/0.1@user/testing"},
+                    clean_first=True)
+        client.run("install .")  # Retrieve the recipes
+        client.run("remove * -p -f")
+        del RecordingRequester.urls[:]
+        return client
+
+    def batch_install_test(self):
+        client = self._client()
+        client.run("install .")
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        posts = [url for method, url in RecordingRequester.urls if method == "POST"]
+        self.assertEqual(1, len(posts))
+        self.assertTrue(posts[0].endswith("/v2/conans/metadata"))
+        gets = [url for method, url in RecordingRequester.urls if method == "GET"]
+        self.assertFalse([url for url in gets if url.endswith("/latest")])
+
+        # The missing binaries are reported per package, not as a failure of the request
+        client.save({"conanfile.txt": "[requires]\npkg0/0.1@user/testing\n"
+                                      "pkg1/0.1@user/testing"})
+        client.run("remove pkg1* -p -f")
+        client.run("remove pkg1* -p -f -r=default")
+        client.run("install .", assert_error=True)
+        self.assertIn("Missing prebuilt package for 'pkg1/0.1@user/testing'", client.out)
+
+    def update_test(self):
+        client = self._client()
+        client.run("install .")
+        del RecordingRequester.urls[:]
+        client.run("install . --update")
+        posts = [url for method, url in RecordingRequester.urls if method == "POST"]
+        self.assertEqual(1, len(posts))
+        gets = [url for method, url in RecordingRequester.urls if method == "GET"]
+        self.assertFalse([url for url in gets if "/packages/" in url])
+
+    def fallback_test(self):
+        client = self._client(server_capabilities=[REVISIONS])
+        client.run("install .")
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        posts = [url for method, url in RecordingRequester.urls if method == "POST"]
+        self.assertEqual([], posts)
+        gets = [url for method, url in RecordingRequester.urls if method == "GET"]
+        self.assertEqual(3, len([url for url in gets if url.endswith("/latest")]))
+
+    def server_endpoint_test(self):
+        client = self._client()
+        server = client.servers["default"]
+        payload = {"recipes": ["pkg0/0.1@user/testing", "missing/0.1@user/testing"],
+                   "packages": ["pkg1/0.1@user/testing:%s" % NO_SETTINGS_PACKAGE_ID,
+                                "pkg1/0.1@user/testing:%s" % ("0" * 40)]}
+        response = server.app.post("/v2/conans/metadata", params=json.dumps(payload))
+        result = json.loads(response.body.decode())
+        recipe, missing = result["recipes"]
+        self.assertTrue(recipe["reference"].startswith("pkg0/0.1@user/testing#"))
+        self.assertIn("conanfile.py", recipe["files"])
+        self.assertIn("conanfile.py", recipe["manifest"])
+        self.assertEqual(404, missing["error"]["code"])
+        package, missing = result["packages"]
+        pref = PackageReference.loads(package["reference"])
+        self.assertEqual("pkg1/0.1@user/testing", str(pref.ref))
+        self.assertEqual(NO_SETTINGS_PACKAGE_ID, pref.id)
+        self.assertIsNotNone(pref.revision)
+        self.assertIn("conaninfo.txt", package["files"])
+        self.assertIn("[settings]", package["conaninfo"])
+        self.assertEqual(404, missing["error"]["code"])
+
+    def parallel_fallback_test(self):
+        client = self._client(server_capabilities=[REVISIONS])
+        client.run("config set general.parallel_binary_check=4")
+        client.run("install .")
+        for i in range(3):
+            self.assertIn("pkg%s/0.1@user/testing: Package installed" % i, client.out)
+        gets = [url for method, url in RecordingRequester.urls if method == "GET"]
+        # Each binary is checked only once, the results are used by the evaluation
+        self.assertEqual(3, len([url for url in gets if url.endswith("/latest")]))
+
+        client.run("remove pkg1* -p -f")
+        client.run("remove pkg1* -p -f -r=default")
+        client.run("install .", assert_error=True)
+        self.assertIn("Missing prebuilt package for 'pkg1/0.1@user/testing'", client.out)
+
+    def compatible_packages_test(self):
+        conanfile = textwrap.dedent("""
+            from conans import ConanFile
+            class Pkg(ConanFile):
+                settings = "os"
+                def package_id(self):
+                    if self.settings.os == "Windows":
+                        compatible_pkg = self.info.clone()
+                        compatible_pkg.settings.os = "Linux"
+                        self.compatible_packages.append(compatible_pkg)
+            """)
+        server = TestServer(users={"user": "password"})
+        client = TestClient(servers=OrderedDict([("default", server)]),
+                            users={"default": [("user", "password")]},
+                            requester_class=RecordingRequester, revisions_enabled=True)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . pkg/0.1@user/testing -s os=Linux")
+        client.run("upload * --all --confirm")
+        client.run("remove * -p -f")
+        del RecordingRequester.urls[:]
+        client.run("install pkg/0.1@user/testing -s os=Windows")
+        self.assertIn("Using compatible package", client.out)
+        posts = [url for method, url in RecordingRequester.urls if method == "POST"]
+        self.assertEqual(1, len(posts))
+        gets = [url for method, url in RecordingRequester.urls if method == "GET"]
+        self.assertFalse([url for url in gets if url.endswith("/latest")])
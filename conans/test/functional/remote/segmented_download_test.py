@@ -0,0 +1,47 @@
+import os
+import textwrap
+import unittest
+
+from conans.model.ref import ConanFileReference, PackageReference
+from conans.test.utils.tools import TestClient, TestRequester, NO_SETTINGS_PACKAGE_ID
+from conans.util.files import load
+
+
+class RangesRequester(TestRequester):
+    ranges = []
+
+    def get(self, url, **kwargs):
+        headers = kwargs.get("headers") or {}
+        if "range" in headers:
+            self.ranges.append(headers["range"])
+        return super(RangesRequester, self).get(url, **kwargs)
+
+
+class SegmentedDownloadTest(unittest.TestCase):
+
+    def test_install(self):
+        conanfile = textwrap.dedent("""
+            import os
+            from conans import ConanFile, tools
+            class Pkg(ConanFile):
+                def package(self):
+                    tools.save(os.path.join(self.package_folder, "data.bin"),
+                               "".join(str(i) for i in range(50000)))
+            """)
+        client = TestClient(default_server_user=True, requester_class=RangesRequester)
+        client.save({"conanfile.py": conanfile})
+        client.run("create . pkg/0.1@user/testing")
+        client.run("upload * --all --confirm")
+        client.run("remove * -f")
+        client.run("config set general.download_segments=4")
+        client.run("config set general.segmented_download_min_size=0.01")
+        del RangesRequester.ranges[:]
+        client.run("install pkg/0.1@user/testing")
+        self.assertIn("pkg/0.1@user/testing: Package installed", client.out)
+        # Only the package tgz is bigger than 10KB
+        self.assertEqual(4, len(RangesRequester.ranges))
+        ref = ConanFileReference.loads("pkg/0.1@user/testing")
+        pref = PackageReference(ref, NO_SETTINGS_PACKAGE_ID)
+        package_folder = client.cache.package_layout(ref).package(pref)
+        self.assertEqual("".join(str(i) for i in range(50000)),
+                         load(os.path.join(package_folder, "data.bin")))
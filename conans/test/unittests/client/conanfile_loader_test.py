@@ -1,3 +1,4 @@
+import marshal
 import os
 import sys
 import textwrap
@@ -353,3 +354,37 @@ def append(data):
             self.assertIs(loaded1.myconanlogger.value, loaded2.myconanlogger.value)
         finally:
             sys.path.remove(temp)
+
+    def test_compiled_folder(self):
+        tmp = temp_folder()
+        conanfile_path = os.path.join(tmp, "conanfile.py")
+        save(conanfile_path, "value = 42\nfile = __file__")
+        save(os.path.join(tmp, "conandata.yml"), "sources:\n  1.2: {url: 'the_url'}\n")
+        compiled_folder = temp_folder()
+
+        loaded, _ = _parse_conanfile(conanfile_path, compiled_folder)
+        self.assertEqual(42, loaded.value)
+        self.assertEqual(conanfile_path, loaded.file)
+        if six.PY3:
+            self.assertEqual(conanfile_path, loaded.__spec__.origin)
+            self.assertIs(loaded.__spec__.loader, loaded.__loader__)
+        compiled = [os.path.join(root, f) for root, _, files in os.walk(compiled_folder)
+                    for f in files]
+        self.assertEqual(1, len(compiled))
+
+        # The next loads reuse the compiled bytecode
+        save(compiled[0], marshal.dumps(compile("value = 23", conanfile_path, "exec")))
+        loaded, _ = _parse_conanfile(conanfile_path, compiled_folder)
+        self.assertEqual(23, loaded.value)
+        # But not if the conanfile changes
+        save(conanfile_path, "value = 43")
+        loaded, _ = _parse_conanfile(conanfile_path, compiled_folder)
+        self.assertEqual(43, loaded.value)
+
+        loader = ConanFileLoader(None, TestBufferConanOutput(), None,
+                                 compiled_folder=compiled_folder)
+        for _ in range(2):  # Parsed, then read from the compiled folder
+            data = loader._load_data(conanfile_path)
+            self.assertEqual({"sources": {1.2: {"url": "the_url"}}}, data)
+        self.assertTrue(any(f.endswith(".data") for _, _, files in os.walk(compiled_folder)
+                            for f in files))
@@ -1,11 +1,12 @@
 import mock
 import os
 import platform
+import time
 import unittest
 
 from conans.client.file_copier import FileCopier
 from conans.test.utils.test_files import temp_folder
-from conans.util.files import load, save
+from conans.util.files import load, save, walk
 
 
 class FileCopierTest(unittest.TestCase):
@@ -219,3 +220,42 @@ class FileCopierTest(unittest.TestCase):
         copier = FileCopier([src_folder], dst_folder)
         copier("foobar.txt", ignore_case=True)
         self.assertEqual(["FooBar.txt"], os.listdir(dst_folder))
+
+    def test_single_walk(self):
+        src_folder = temp_folder()
+        save(os.path.join(src_folder, "include/header.h"), "header")
+        save(os.path.join(src_folder, "lib/mylib.a"), "lib")
+        save(os.path.join(src_folder, "lib/tmp/other.a"), "tmp")
+
+        def age_folders():
+            # The folders modified in the last seconds are walked again every time
+            old_time = time.time() - 10
+            for root, _, _ in walk(src_folder):
+                os.utime(root, (old_time, old_time))
+
+        dst_folder = temp_folder()
+        copier = FileCopier([src_folder], dst_folder)
+        with mock.patch("conans.client.file_copier.walk", wraps=walk) as walk_mock:
+            copier("*.h", dst="include", keep_path=False)
+            self.assertEqual(1, walk_mock.call_count)
+            copier("*.h", dst="include", keep_path=False)
+            self.assertEqual(2, walk_mock.call_count)
+
+            age_folders()
+            walk_mock.reset_mock()
+            copier("*.h", dst="include", keep_path=False)
+            copier("*.a", dst="lib", keep_path=False, excludes=("*/tmp", "*.txt"))
+            self.assertEqual(1, walk_mock.call_count)
+            self.assertEqual(["mylib.a"], os.listdir(os.path.join(dst_folder, "lib")))
+
+            # The new files are copied, the folder is walked again
+            save(os.path.join(src_folder, "include/new.h"), "new")
+            copier("*.h", dst="include", keep_path=False)
+            self.assertEqual(2, walk_mock.call_count)
+            age_folders()
+            copier("*.h", dst="include", keep_path=False)
+            self.assertEqual(3, walk_mock.call_count)
+            copier("*.h", dst="include", keep_path=False)
+            self.assertEqual(3, walk_mock.call_count)
+        self.assertEqual(sorted(["header.h", "new.h"]),
+                         sorted(os.listdir(os.path.join(dst_folder, "include"))))
@@ -1,7 +1,10 @@
 import unittest
 
-from conans.client.graph.graph import CONTEXT_HOST
+import six
+
+from conans.client.graph.graph import CONTEXT_HOST, order_levels
 from conans.client.graph.graph_builder import DepsGraph, Node
+from conans.errors import ConanException
 from conans.model.conan_file import ConanFile
 from conans.model.ref import ConanFileReference
 from conans.test.utils.mocks import TestBufferConanOutput
@@ -110,3 +113,36 @@ class DepsGraphTest(unittest.TestCase):
         deps.add_edge(n2, n32, None)
         deps.add_edge(n32, n5, None)
         self.assertEqual([[n5, n31], [n32], [n2], [n1]], deps.by_levels())
+
+    def subset_and_inverse_levels_test(self):
+        ref1 = ConanFileReference.loads("Hello/1.0@user/stable")
+        ref2 = ConanFileReference.loads("Hello/2.0@user/stable")
+        ref5 = ConanFileReference.loads("Hello/5.0@user/stable")
+        ref31 = ConanFileReference.loads("Hello/31.0@user/stable")
+        ref32 = ConanFileReference.loads("Hello/32.0@user/stable")
+
+        deps = DepsGraph()
+        n1 = Node(ref1, 1, context=CONTEXT_HOST)
+        n2 = Node(ref2, 2, context=CONTEXT_HOST)
+        n5 = Node(ref5, 5, context=CONTEXT_HOST)
+        n31 = Node(ref31, 31, context=CONTEXT_HOST)
+        n32 = Node(ref32, 32, context=CONTEXT_HOST)
+        for n in (n1, n5, n2, n32, n31):
+            deps.add_node(n)
+        deps.add_edge(n1, n2, None)
+        deps.add_edge(n1, n5, None)
+        deps.add_edge(n2, n31, None)
+        deps.add_edge(n2, n32, None)
+        deps.add_edge(n32, n5, None)
+        # The dependencies out of the subset are ignored
+        self.assertEqual([[n2, n5], [n1]], deps.by_levels({n1, n2, n5}))
+        self.assertEqual([[n1], [n2], [n31, n32], [n5]], deps.inverse_levels())
+
+    def test_order_levels(self):
+        neighbors = {"a": ["b", "c"], "b": ["c", "d"], "c": [], "d": ["c"]}
+        self.assertEqual([["c"], ["d"], ["b"], ["a"]],
+                         order_levels(neighbors, lambda n: neighbors[n]))
+
+        neighbors = {"a": ["b"], "b": ["c"], "c": ["b"], "d": []}
+        with six.assertRaisesRegex(self, ConanException, "these nodes cannot be ordered: a, b, c"):
+            order_levels(neighbors, lambda n: neighbors[n])
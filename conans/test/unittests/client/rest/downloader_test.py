@@ -1,4 +1,8 @@
+import hashlib
+import io
+import os
 import re
+import tarfile
 import tempfile
 import unittest
 
@@ -39,20 +43,25 @@ class MockRequester(object):
         self._chunk_size = chunk_size if chunk_size is not None else len(data)
         self._accept_ranges = accept_ranges
         self._echo_header = echo_header.copy() if echo_header else {}
+        self.ranges = []
 
     def get(self, *_args, **kwargs):
         start = 0
+        end = len(self._data) - 1
         headers = kwargs.get("headers") or {}
         transfer_range = headers.get("range", "")
-        match = re.match(r"bytes=([0-9]+)-", transfer_range)
+        self.ranges.append(transfer_range)
+        match = re.match(r"bytes=([0-9]+)-([0-9]*)", transfer_range)
         status = 200
         headers = {"Content-Length": len(self._data), "Accept-Ranges": "bytes"}
         if match and self._accept_ranges:
             start = int(match.groups()[0])
+            if match.groups()[1]:
+                end = min(int(match.groups()[1]), end)
             if start < len(self._data):
                 status = 206
-                headers.update({"Content-Length": str(len(self._data) - start),
-                                "Content-Range": "bytes {}-{}/{}".format(start, len(self._data) - 1,
+                headers.update({"Content-Length": str(end + 1 - start),
+                                "Content-Range": "bytes {}-{}/{}".format(start, end,
                                                                          len(self._data))})
             else:
                 status = 416
@@ -60,7 +69,7 @@ class MockRequester(object):
                                 "Content-Range": "bytes */{}".format(len(self._data))})
         else:
             headers.update(self._echo_header)
-        response = MockResponse(self._data[start:start + self._chunk_size], status_code=status,
+        response = MockResponse(self._data[start:end + 1][:self._chunk_size], status_code=status,
                                 headers=headers)
         return response
 
@@ -120,6 +129,30 @@ class DownloaderUnitTest(unittest.TestCase):
         with self.assertRaisesRegexp(ConanException, r"Incorrect Content-Range header"):
             downloader.download("fake_url", file_path=self.target)
 
+    def test_segmented_download(self):
+        expected_content = bytes(bytearray(range(256))) * 4
+        config = _ConfigMock()
+        config.download_segments = 4
+        config.segmented_download_min_size = 0
+        requester = MockRequester(expected_content, chunk_size=100)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=config)
+        with self.assertRaisesRegexp(ConanException, r"Transfer interrupted before complete"):
+            downloader.download("fake_url", file_path=self.target)
+        self.assertFalse(os.path.exists(self.target))
+        self.assertEqual(["", "bytes=0-255", "bytes=256-511", "bytes=512-767", "bytes=768-1023"],
+                         sorted(requester.ranges))
+
+        # The segments downloaded before are not requested again
+        requester = MockRequester(expected_content)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=config)
+        downloader.download("fake_url", file_path=self.target)
+        self.assertEqual(expected_content, load(self.target, binary=True))
+        self.assertEqual(["", "bytes=100-255", "bytes=356-511", "bytes=612-767",
+                          "bytes=868-1023"], sorted(requester.ranges))
+        self.assertFalse(os.path.exists(self.target + ".segments"))
+
     def test_download_with_compressed_content_and_bigger_content_length(self):
         expected_content = b"some data"
         echo_header = {"Content-Encoding": "gzip", "Content-Length": len(expected_content) + 1}
@@ -139,3 +172,32 @@ class DownloaderUnitTest(unittest.TestCase):
         downloader.download("fake_url", file_path=self.target)
         actual_content = load(self.target, binary=True)
         self.assertEqual(expected_content, actual_content)
+
+    @staticmethod
+    def _tgz(files):
+        buff = io.BytesIO()
+        with tarfile.open(fileobj=buff, mode="w:gz") as tgz:
+            for name, content in files.items():
+                info = tarfile.TarInfo(name)
+                info.size = len(content)
+                tgz.addfile(info, io.BytesIO(content))
+        return buff.getvalue()
+
+    def test_download_extract(self):
+        tgz = self._tgz({"include/header.h": b"header", "lib/mylib.a": b"lib" * 10000})
+        requester = MockRequester(tgz)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        checksums = downloader.download_extract("fake_url", self.target)
+        self.assertEqual(load(os.path.join(self.target, "include/header.h")), "header")
+        self.assertEqual(load(os.path.join(self.target, "lib/mylib.a")), "lib" * 10000)
+        self.assertEqual(checksums, {"md5": hashlib.md5(tgz).hexdigest(),
+                                     "sha1": hashlib.sha1(tgz).hexdigest()})
+
+    def test_fail_download_extract_if_interrupted(self):
+        tgz = self._tgz({"include/header.h": b"header"})
+        requester = MockRequester(tgz, chunk_size=len(tgz) - 1)
+        downloader = FileDownloader(requester=requester, output=self.out, verify=None,
+                                    config=_ConfigMock())
+        with self.assertRaisesRegexp(ConanException, r"Download failed"):
+            downloader.download_extract("fake_url", self.target)
@@ -0,0 +1,46 @@
+import threading
+import unittest
+from multiprocessing.pool import ThreadPool
+
+from conans.client.rest.rest_client_common import upload_files_in_order
+
+
+class UploadFilesInOrderTest(unittest.TestCase):
+
+    def test_order(self):
+        files = ["conanmanifest.txt", "conaninfo.txt", "conan_package.tgz", "conanfile.py",
+                 "conan_export.tgz"]
+        uploaded = []
+        lock = threading.Lock()
+
+        def upload_file(filename):
+            with lock:
+                uploaded.append(filename)
+            return filename.upper()
+
+        thread_pool = ThreadPool(2)
+        try:
+            result = list(upload_files_in_order(files, upload_file, thread_pool))
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        self.assertEqual({f: f.upper() for f in files}, dict(result))
+        self.assertEqual({"conan_export.tgz", "conan_package.tgz"}, set(uploaded[:2]))
+        self.assertEqual({"conanfile.py", "conaninfo.txt"}, set(uploaded[2:4]))
+        self.assertEqual("conanmanifest.txt", uploaded[4])
+
+    def test_bounded_pool(self):
+        # The packages are uploaded by the threads of the same pool, which is full
+        thread_pool = ThreadPool(1)
+
+        def upload_package(package):
+            files = ["%s_%s.tgz" % (package, i) for i in range(3)]
+            return dict(upload_files_in_order(files, lambda f: f, thread_pool))
+
+        try:
+            results = thread_pool.map_async(upload_package, ["pkg1", "pkg2"]).get(10)
+        finally:
+            thread_pool.close()
+            thread_pool.join()
+        self.assertEqual(["pkg1_0.tgz", "pkg1_1.tgz", "pkg1_2.tgz"], sorted(results[0]))
+        self.assertEqual(["pkg2_0.tgz", "pkg2_1.tgz", "pkg2_2.tgz"], sorted(results[1]))
@@ -215,6 +215,22 @@ VAR2=23
         self.assertListEqual(["sysdep1"], list(deps_cpp_info["dep1"].system_libs))
         self.assertListEqual(["sysdep2", "sysdep3"], list(deps_cpp_info["dep2"].system_libs))
 
+    def cpp_info_merge_order_test(self):
+        info1 = CppInfo("dep1", "folder1")
+        info1.libs = ["lib1", "common"]
+        info1.defines = ["DEF1", "COMMON"]
+        info2 = CppInfo("dep2", "folder2")
+        info2.libs = ["lib2", "common"]
+        info2.defines = ["DEF2", "COMMON"]
+        deps_cpp_info = DepsCppInfo()
+        deps_cpp_info.add("dep1", DepCppInfo(info1))
+        deps_cpp_info.add("dep2", DepCppInfo(info2))
+        # The libs of the latest dependency go last, the defines first
+        self.assertListEqual(["lib1", "lib2", "common"], list(deps_cpp_info.libs))
+        self.assertListEqual(["DEF2", "DEF1", "COMMON"], list(deps_cpp_info.defines))
+        # The dependencies lists are not modified
+        self.assertListEqual(["lib1", "common"], list(deps_cpp_info["dep1"].libs))
+
     def cpp_info_name_test(self):
         folder = temp_folder()
         info = CppInfo("myname", folder)
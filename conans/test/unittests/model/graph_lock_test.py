@@ -0,0 +1,113 @@
+import json
+import unittest
+from collections import OrderedDict
+
+import six
+
+from conans.errors import ConanException
+from conans.model.graph_lock import GraphLock, GraphLockFile, LOCKFILE_VERSION
+from conans.model.ref import ConanFileReference
+
+
+class GraphLockIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        data = {"revisions_enabled": True,
+                "nodes": {"0": {"path": "conanfile.txt", "requires": ["1", "2"]},
+                          "1": {"ref": "pkg/0.1@user/testing#rev1", "requires": ["3"]},
+                          "2": {"ref": "app/0.1@user/testing", "path": "app/conanfile.py",
+                                "requires": ["3"]},
+                          "3": {"ref": "dep/0.1@user/testing#rev3"},
+                          "10": {"ref": "dep/0.1@user/testing#rev3"}}}
+        self.lock = GraphLock.deserialize(data, revisions_enabled=True)
+
+    def test_get_consumer(self):
+        self.assertEqual("0", self.lock.get_consumer(None))
+        # The first node with the same ID, as strings
+        self.assertEqual("10", self.lock.get_consumer(ConanFileReference.loads("dep/0.1@user/"
+                                                                               "testing")))
+        self.assertEqual("2", self.lock.get_consumer(ConanFileReference.loads("app/0.1@user/"
+                                                                              "testing")))
+        # Local consumers are found by name
+        self.assertEqual("2", self.lock.get_consumer(ConanFileReference.loads("app/0.2@user/"
+                                                                              "testing")))
+        with six.assertRaisesRegex(self, ConanException, "Couldn't find 'pkg/0.2@user/testing'"):
+            self.lock.get_consumer(ConanFileReference.loads("pkg/0.2@user/testing"))
+
+    def test_update_exported_ref(self):
+        app = ConanFileReference.loads("app/0.1@user/testing")
+        self.assertEqual("2", self.lock.get_consumer(app))
+        self.lock.update_exported_ref("2", ConanFileReference.loads("app/0.1@user/testing#rev2"))
+        self.assertEqual("2", self.lock.get_consumer(app))
+        self.lock.relax()
+        # The exported node is not a local consumer anymore
+        self.assertIsNone(self.lock.get_consumer(ConanFileReference.loads("app/0.2@user/"
+                                                                          "testing")))
+
+    def test_relaxed_require(self):
+        self.lock.relax()
+        match = self.lock._match_relaxed_require
+        self.assertEqual("10", match(ConanFileReference.loads("dep/0.1@user/testing")))
+        self.assertEqual("10", match(ConanFileReference.loads("dep/0.1@user/testing#rev3")))
+        self.assertEqual("3", match(ConanFileReference.loads("dep/[>0.0]@user/testing")))
+        self.assertIsNone(match(ConanFileReference.loads("dep/[>0.1]@user/testing")))
+        self.assertIsNone(match(ConanFileReference.loads("dep/[>0.0]@other/testing")))
+
+    def test_relaxed_require_order(self):
+        # The version ranges match the first node in the order of the nodes, not of their IDs
+        nodes = OrderedDict([("0", {"path": "conanfile.txt", "requires": ["12", "2"]})])
+        nodes["12"] = {"ref": "dep/0.2@user/testing#rev2"}
+        nodes["2"] = {"ref": "dep/0.1@user/testing#rev1"}
+        for i in range(3, 12):
+            nodes[str(i)] = {"ref": "other%s/0.1@user/testing#rev" % i}
+        lock = GraphLock.deserialize({"revisions_enabled": True, "nodes": nodes},
+                                     revisions_enabled=True)
+        lock.relax()
+        match = lock._match_relaxed_require
+        self.assertEqual("12", match(ConanFileReference.loads("dep/[>0.0]@user/testing")))
+        self.assertEqual("2", match(ConanFileReference.loads("dep/[<0.2]@user/testing")))
+
+
+class GraphLockLazyTest(unittest.TestCase):
+
+    def test_lazy_nodes(self):
+        data = {"revisions_enabled": True,
+                "nodes": {"0": {"path": "conanfile.txt", "requires": ["1"]},
+                          "1": {"ref": "pkg/0.1@user/testing#rev1", "options": "shared=True",
+                                "python_requires": ["tool/0.1@user/testing#rev2"],
+                                "package_id": "id1"}}}
+        lock = GraphLock.deserialize(data, revisions_enabled=True)
+        node = lock.nodes["1"]
+        self.assertEqual("1", lock.get_consumer(ConanFileReference.loads("pkg/0.1@user/"
+                                                                         "testing")))
+        # Neither finding the node nor serializing it needs parsing it
+        self.assertIsNotNone(node._serialized)
+        self.assertEqual(data["nodes"], lock.serialize()["nodes"])
+        self.assertIsNotNone(node._serialized)
+
+        self.assertEqual("pkg/0.1@user/testing#rev1", repr(node.ref))
+        self.assertEqual("shared=True", node.options.dumps())
+        self.assertEqual(["tool/0.1@user/testing#rev2"], [repr(r) for r in node.python_requires])
+        self.assertIsNone(node._serialized)
+        self.assertEqual(data["nodes"], lock.serialize()["nodes"])
+
+    def test_lazy_nodes_revisions_disabled(self):
+        data = {"revisions_enabled": False,
+                "nodes": {"0": {"path": "conanfile.txt", "requires": ["1"]},
+                          "1": {"ref": "pkg/0.1@user/testing#rev1"}}}
+        lock = GraphLock.deserialize(data, revisions_enabled=False)
+        self.assertEqual("pkg/0.1@user/testing", repr(lock.nodes["1"].ref))
+        self.assertEqual([], lock.nodes["1"].python_requires)
+
+    def test_lazy_profiles(self):
+        data = {"version": LOCKFILE_VERSION, "profile_host": "[settings]\nos=Linux\n",
+                "graph_lock": {"revisions_enabled": True,
+                               "nodes": {"0": {"path": "conanfile.txt"}}}}
+        lockfile = GraphLockFile._loads(json.dumps(data), revisions_enabled=True)
+        # The profile text is kept as is if it is not used
+        self.assertEqual(data["profile_host"],
+                         json.loads(lockfile._dumps("conan.lock"))["profile_host"])
+        self.assertIsNone(lockfile.profile_build)
+        self.assertEqual("Linux", lockfile.profile_host.settings["os"])
+        self.assertEqual(lockfile.profile_host.dumps(),
+                         json.loads(lockfile._dumps("conan.lock"))["profile_host"])
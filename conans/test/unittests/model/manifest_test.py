@@ -1,6 +1,9 @@
 import os
+import time
 import unittest
 
+from conans.client.cache.hash_cache import HashCache
+from conans.client.tools import environment_append
 from conans.model.manifest import FileTreeManifest
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, md5, save
@@ -45,3 +48,46 @@ class ManifestTest(unittest.TestCase):
         # Not included the pycs or pyo
         self.assertEqual(set(read_manifest.file_sums.keys()),
                           set(["conanfile.py"]))
+
+    def test_parallel_hash_cache(self):
+        tmp_dir = temp_folder()
+        files = {"file%d.txt" % i: "contents%d" % i for i in range(100)}
+        for filename, content in files.items():
+            save(os.path.join(tmp_dir, filename), content)
+        expected = {filename: md5(content) for filename, content in files.items()}
+
+        with environment_append({"CONAN_CPU_COUNT": "4"}):
+            self.assertEqual(expected, FileTreeManifest.create(tmp_dir).file_sums)
+        db_file = os.path.join(temp_folder(), "hashes.db")
+        with environment_append({"CONAN_HASH_CACHE": db_file}):
+            # The recently modified files are not cached
+            self.assertEqual(expected, FileTreeManifest.create(tmp_dir).file_sums)
+            self.assertEqual(expected, FileTreeManifest.create(tmp_dir).file_sums)
+
+    def test_hash_cache(self):
+        tmp_dir = temp_folder()
+        paths = [os.path.join(tmp_dir, name) for name in ("a.txt", "b.txt")]
+        old = time.time() - 100
+        for path in paths:
+            save(path, "contents")
+            os.utime(path, (old, old))
+        hash_cache = HashCache(os.path.join(temp_folder(), "hashes.db"))
+
+        computed = []
+
+        def compute(files):
+            computed.extend(files)
+            return [md5(load(f)) for f in files]
+
+        self.assertEqual({p: md5("contents") for p in paths}, hash_cache.md5sums(paths, compute))
+        self.assertEqual(paths, computed)
+        del computed[:]
+        self.assertEqual({p: md5("contents") for p in paths}, hash_cache.md5sums(paths, compute))
+        self.assertEqual([], computed)
+
+        # Modified files are read again, and not cached while they are recently modified
+        save(paths[0], "modified")
+        expected = {paths[0]: md5("modified"), paths[1]: md5("contents")}
+        self.assertEqual(expected, hash_cache.md5sums(paths, compute))
+        self.assertEqual(expected, hash_cache.md5sums(paths, compute))
+        self.assertEqual([paths[0], paths[0]], computed)
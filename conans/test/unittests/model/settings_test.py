@@ -230,6 +230,25 @@ class SettingsTest(unittest.TestCase):
         self.sut.os = "Linux"
         self.assertEqual(self.sut.os, "Linux")
 
+    def copy_test(self):
+        self.sut.compiler = "Visual Studio"
+        copied = self.sut.copy()
+        copied.compiler["Visual Studio"].version.remove("12")
+        copied.os.remove("Windows")
+        copied.compiler.version = "11"
+        # The original is not modified by the changes in the copy
+        self.sut.compiler.version = "12"
+        self.sut.os = "Windows"
+        self.assertEqual(self.sut.compiler.version, "12")
+        self.assertEqual(copied.compiler.version, "11")
+        with self.assertRaises(ConanException):
+            copied.os = "Windows"
+        values = self.sut.copy_values()
+        values.compiler.version = "10"
+        self.assertEqual(self.sut.compiler.version, "12")
+        self.assertEqual(values.values.dumps(), "compiler=Visual Studio\n"
+                                                "compiler.version=10\nos=Windows")
+
     def loads_default_test(self):
         settings = Settings.loads("""os: [Windows, Linux, Macos, Android, FreeBSD, SunOS]
 arch: [x86, x86_64, arm]
@@ -2,7 +2,7 @@ import unittest
 
 import six
 
-from conans.search.query_parse import evaluate_postfix, infix_to_postfix
+from conans.search.query_parse import compile_postfix, infix_to_postfix
 
 
 class QueryParseTest(unittest.TestCase):
@@ -33,7 +33,7 @@ class QueryParseTest(unittest.TestCase):
 
         def evaluate(q):
             r = infix_to_postfix(q)
-            return evaluate_postfix(r, evaluator)
+            return compile_postfix(r, lambda expr: lambda item: evaluator(expr))(None)
 
         self.assertTrue(evaluate("a=2"))
         self.assertFalse(evaluate("a=4"))
@@ -46,3 +46,23 @@ class QueryParseTest(unittest.TestCase):
         self.assertTrue(evaluate("a=2 AND j=45 OR (h=23 AND a=2)"))
         self.assertTrue(evaluate("((((a=2 AND ((((f=23 OR j=45))))))))"))
         self.assertFalse(evaluate("((((a=2 AND ((((f=23 OR j=42))))))))"))
+
+    def test_compile_postfix(self):
+        compiled = []
+
+        def compiler(expr):
+            compiled.append(expr)
+            return lambda item: expr in item
+
+        queries = ["a=2", "a=2 OR a=3", "a=4 AND j=45", "a=2 AND (f=23 OR j=45)",
+                   "a=2 AND j=45 OR (h=23 AND a=2)", "((((a=2 AND ((((f=23 OR j=42))))))))"]
+        items = [("a=2", "j=45"), ("a=3", ), ("f=23", "a=2"), ()]
+        expected = [[True, False, True, False], [True, True, True, False],
+                    [False, False, False, False], [True, False, True, False],
+                    [True, False, True, False], [False, False, True, False]]
+        for q, results in zip(queries, expected):
+            predicate = compile_postfix(infix_to_postfix(q), compiler)
+            self.assertEqual(results, [predicate(item) for item in items])
+        # Every expression is compiled only once, not once per item
+        self.assertEqual(len(compiled), 15)
+        self.assertTrue(compile_postfix([], compiler)(("a=1", )))
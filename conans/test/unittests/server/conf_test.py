@@ -20,6 +20,7 @@ ssl_enabled: true
 port: 9220
 host_name: localhost
 public_port: 12345
+workers: 4
 
 
 [write_permissions]
@@ -87,6 +88,8 @@ text=value
         self.assertEqual(config.host_name, "localhost")
         self.assertEqual(config.public_port, 12345)
         self.assertEqual(config.public_url, "https://localhost:12345/v1")
+        self.assertEqual(config.workers, 4)
+        self.assertEqual(config.threads, 1)
 
         # Now check with environments
         tmp_storage = temp_folder()
@@ -98,6 +101,7 @@ text=value
         self.environ["CONAN_SERVER_USERS"] = "lasote:lasotepass,pepe2:pepepass2"
         self.environ["CONAN_HOST_NAME"] = "remotehost"
         self.environ["CONAN_SERVER_PUBLIC_PORT"] = "33333"
+        self.environ["CONAN_SERVER_THREADS"] = "16"
 
         config = ConanServerConfigParser(self.file_path, environment=self.environ)
         self.assertEqual(config.jwt_secret,  "newkey")
@@ -112,3 +116,5 @@ text=value
         self.assertEqual(config.host_name, "remotehost")
         self.assertEqual(config.public_port, 33333)
         self.assertEqual(config.public_url, "http://remotehost:33333/v1")
+        self.assertEqual(config.workers, 4)
+        self.assertEqual(config.threads, 16)
@@ -0,0 +1,53 @@
+import os
+import threading
+import unittest
+
+import requests
+
+from conans.server.rest.server import _RequestHandler, _ThreadingWSGIServer, MultiWorkerServer
+from conans.server.store.disk_adapter import ServerDiskAdapter
+from conans.test.utils.test_files import temp_folder
+
+
+class ThreadingServerTest(unittest.TestCase):
+
+    def test_concurrent_requests(self):
+        release = threading.Event()
+
+        def app(environ, start_response):
+            if environ["PATH_INFO"] == "/slow":
+                release.wait(10)
+            start_response("200 OK", [("Content-Type", "text/plain")])
+            return [environ["PATH_INFO"].encode()]
+
+        _RequestHandler.quiet = True
+        server = _ThreadingWSGIServer(("localhost", 0), _RequestHandler, threads=2)
+        server.set_app(MultiWorkerServer()._streaming(app))
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        try:
+            url = "http://localhost:%s" % server.server_port
+            slow = []
+            slow_request = threading.Thread(target=lambda: slow.append(requests.get(url + "/slow")))
+            slow_request.start()
+            # A slow request doesn't block the other clients
+            self.assertEqual("/fast", requests.get(url + "/fast", timeout=5).text)
+            release.set()
+            slow_request.join()
+            self.assertEqual("/slow", slow[0].text)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+
+class DiskAdapterLockTest(unittest.TestCase):
+
+    def test_thread_locks_released(self):
+        folder = temp_folder()
+        adapter = ServerDiskAdapter("http://localhost", folder, None)
+        lock_file = os.path.join(folder, "revisions.txt.lock")
+        with adapter.lock(lock_file):
+            self.assertIn(lock_file, ServerDiskAdapter._thread_locks)
+        # Not kept when no thread is using it
+        self.assertNotIn(lock_file, ServerDiskAdapter._thread_locks)
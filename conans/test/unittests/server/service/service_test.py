@@ -1,8 +1,11 @@
 import os
+import time
 import unittest
 from datetime import timedelta
 from time import sleep
 
+import mock
+
 from conans import DEFAULT_REVISION_V1
 from conans.errors import NotFoundException, RequestErrorException
 from conans.model.manifest import FileTreeManifest
@@ -14,7 +17,7 @@ from conans.server.service.common.search import SearchService
 from conans.server.service.v1.service import ConanService
 from conans.server.service.v1.upload_download_service import FileUploadDownloadService
 from conans.server.store.disk_adapter import ServerDiskAdapter
-from conans.server.store.server_store import ServerStore
+from conans.server.store.server_store import SEARCH_INDEX_FILE, ServerStore
 from conans.test.utils.cpp_test_files import cpp_hello_source_files
 from conans.test.utils.test_files import temp_folder
 from conans.util.files import load, md5sum, mkdir, save, save_files
@@ -237,6 +240,113 @@ class ConanServiceTest(unittest.TestCase):
                                                 'settings': {},
                                                 'recipe_hash': None}})
 
+    def test_search_index(self):
+        conan_vars = "[options]\n    use_Qt=%s\n"
+        old_time = time.time() - 100
+
+        def save_info(pref, value, mtime=old_time):
+            info_path = os.path.join(self.server_store.package(pref), CONANINFO)
+            save(info_path, conan_vars % value)
+            os.utime(info_path, (mtime, mtime))
+
+        save_info(self.pref, "True")
+        self.server_store.update_last_package_revision(self.pref)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(["123123123"], list(info))
+        index_path = os.path.join(self.server_store.packages(self.ref), SEARCH_INDEX_FILE)
+        self.assertIn('"revision": "0"', load(index_path))
+
+        # The searches are answered from the index while the conaninfo.txt stamp doesn't change
+        save_info(self.pref, "Abcd")
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(["123123123"], list(info))
+        save_info(self.pref, "Abcd", old_time + 1)
+        info = self.search_service.search_packages(self.ref, None)
+        self.assertEqual({"use_Qt": "Abcd"}, info["123123123"]["options"])
+
+        # A new package revision is indexed when it is searched
+        pref2 = self.pref.copy_with_revs(self.ref.revision, "prev2")
+        save_info(pref2, "False")
+        self.server_store.update_last_package_revision(pref2)
+        info = self.search_service.search_packages(self.ref, "use_Qt=False")
+        self.assertEqual(["123123123"], list(info))
+
+        # Removing the latest revision indexes the previous one again
+        self.server_store.remove_package(pref2)
+        info = self.search_service.search_packages(self.ref, None)
+        self.assertEqual({"use_Qt": "Abcd"}, info["123123123"]["options"])
+
+        # Packages not indexed yet are indexed the first time they are searched
+        pref3 = PackageReference(self.ref, "456456456", DEFAULT_REVISION_V1)
+        save_info(pref3, "True")
+        self.server_store.update_last_package_revision(pref3)
+        os.unlink(index_path)
+        info = self.search_service.search_packages(self.ref, "use_Qt=True")
+        self.assertEqual(["456456456"], list(info))
+        self.assertIn("123123123", load(index_path))
+
+        # Packages without conaninfo.txt are not found
+        os.unlink(os.path.join(self.server_store.package(pref3), CONANINFO))
+        self.assertEqual(["123123123"], list(self.search_service.search_packages(self.ref, None)))
+
+        # The index is removed with the last package
+        self.service.remove_packages(self.ref, ["456456456"])
+        self.assertNotIn("456456456", load(index_path))
+        self.service.remove_packages(self.ref, ["123123123"])
+        self.assertEqual([], os.listdir(self.server_store.packages(self.ref)))
+
+    def test_revisions_cache(self):
+        reads = []
+        read_file = self.server_store._storage_adapter.read_file
+
+        def counted_read_file(path, lock_file):
+            reads.append(path)
+            return read_file(path, lock_file)
+
+        def age(path):
+            old_time = time.time() - 100
+            os.utime(path, (old_time, old_time))
+
+        self.server_store._storage_adapter.read_file = counted_read_file
+        self.server_store.update_last_package_revision(self.pref)
+        pref = self.pref.copy_clear_prev()
+        # Recently modified files are not cached, they can change again keeping the same mtime
+        del reads[:]
+        for _ in range(2):
+            self.assertEqual("0", self.server_store.get_last_package_revision(pref).revision)
+        self.assertEqual(2, len(reads))
+
+        age(self.server_store._package_revisions_file(pref))
+        age(self.server_store._recipe_revisions_file(self.ref))
+        self.assertEqual("0", self.server_store.get_last_package_revision(pref).revision)
+        self.assertEqual("0", self.server_store.get_last_revision(self.ref).revision)
+        del reads[:]
+        for _ in range(3):
+            self.assertEqual("0", self.server_store.get_last_package_revision(pref).revision)
+            self.assertEqual("0", self.server_store.get_last_revision(self.ref).revision)
+        # The revisions are not read again from disk
+        self.assertEqual(0, len(reads))
+
+        # The least recently used files are removed from memory
+        pref2 = PackageReference(self.ref, "456456456", DEFAULT_REVISION_V1)
+        self.server_store.update_last_package_revision(pref2)
+        age(self.server_store._package_revisions_file(pref2))
+        with mock.patch("conans.server.store.server_store.REVISIONS_CACHE_SIZE", 1):
+            self.server_store.get_last_package_revision(pref2.copy_clear_prev())
+        self.assertEqual([self.server_store._package_revisions_file(pref2)],
+                         list(self.server_store._revisions_cache))
+
+        # Changed by other worker of the server
+        other_store = ServerStore(self.server_store._storage_adapter)
+        other_store.update_last_package_revision(self.pref.copy_with_revs("0", "prev2"))
+        self.assertEqual("prev2", self.server_store.get_last_package_revision(pref).revision)
+
+        # Removed
+        self.server_store.remove_packages(self.ref, [])
+        self.assertIsNone(self.server_store.get_last_package_revision(pref))
+        self.assertEqual([], [p for p in self.server_store._revisions_cache
+                              if p.startswith(self.server_store.packages(self.ref))])
+
     def remove_test(self):
         ref2 = ConanFileReference("OpenCV", "3.0", "lasote", "stable", DEFAULT_REVISION_V1)
         ref3 = ConanFileReference("Assimp", "1.10", "lasote", "stable", DEFAULT_REVISION_V1)
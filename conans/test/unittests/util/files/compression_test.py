@@ -0,0 +1,60 @@
+import gzip
+import io
+import os
+import tarfile
+import unittest
+
+from conans.errors import ConanException
+from conans.test.utils.test_files import temp_folder
+from conans.util.compression import ParallelGzipFile, gzip_compressor, PARALLEL_GZIP_COMPRESSOR
+from conans.util.files import gzopen_without_timestamps, save, tar_extract, load
+from conans.client.tools.env import environment_append
+
+
+class ParallelGzipTest(unittest.TestCase):
+
+    @staticmethod
+    def _compress(data, threads, block_size=None, level=9):
+        output = io.BytesIO()
+        gz = ParallelGzipFile(output, level, threads)
+        if block_size:
+            gz.block_size = block_size
+        for i in range(0, len(data), 1000):
+            gz.write(data[i:i + 1000])
+        gz.close()
+        return output.getvalue()
+
+    def test_roundtrip(self):
+        data = b"".join(b"line %d of some repeated contents\n" % i for i in range(20000))
+        for size in (0, 10, len(data)):
+            compressed = self._compress(data[:size], threads=4, block_size=32 * 1024)
+            self.assertEqual(gzip.decompress(compressed), data[:size])
+
+    def test_reproducible(self):
+        data = os.urandom(50000) * 4
+        first = self._compress(data, threads=1, block_size=16 * 1024)
+        second = self._compress(data, threads=8, block_size=16 * 1024)
+        self.assertEqual(first, second)
+        self.assertEqual(gzip.decompress(first), data)
+
+    def test_invalid_compressor(self):
+        with self.assertRaisesRegexp(ConanException, "Invalid compressor 'zip'"):
+            gzip_compressor("name", io.BytesIO(), 9, compressor="zip")
+
+    def test_tgz(self):
+        tmp_folder = temp_folder()
+        save(os.path.join(tmp_folder, "file1"), "contents1" * 1000)
+        tgz_file = os.path.join(tmp_folder, "file.tgz")
+        with environment_append({"CONAN_COMPRESSOR": PARALLEL_GZIP_COMPRESSOR}):
+            with open(tgz_file, "wb") as tgz_handle:
+                tgz = gzopen_without_timestamps("name", mode="w", fileobj=tgz_handle)
+                info = tarfile.TarInfo(name="file1")
+                info.size = os.stat(os.path.join(tmp_folder, "file1")).st_size
+                with open(os.path.join(tmp_folder, "file1"), "rb") as file_handler:
+                    tgz.addfile(tarinfo=info, fileobj=file_handler)
+                tgz.close()
+
+        dest_folder = os.path.join(tmp_folder, "dest")
+        with open(tgz_file, "rb") as file_handler:
+            tar_extract(file_handler, dest_folder)
+        self.assertEqual(load(os.path.join(dest_folder, "file1")), "contents1" * 1000)
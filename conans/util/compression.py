@@ -0,0 +1,104 @@
+import gzip
+import os
+import struct
+import zlib
+from collections import deque
+from multiprocessing.pool import ThreadPool
+
+import six
+
+from conans.errors import ConanException
+from conans.util.misc import cpu_threads
+
+GZIP_COMPRESSOR = "gzip"
+PARALLEL_GZIP_COMPRESSOR = "parallel_gzip"
+
+
+class ParallelGzipFile(object):
+    """ Write-only file object that produces a gzip stream, deflating blocks of the input
+    concurrently in a thread pool (zlib releases the GIL), the same way pigz does. Every block
+    is primed with the tail of the previous one as dictionary, so the compression ratio is close
+    to the single-threaded one. The result is a standard single-member gzip with mtime=0, that
+    only depends on the input, the level and the block size, so it is reproducible.
+    """
+    block_size = 1024 * 1024
+    _dict_size = 32 * 1024
+
+    def __init__(self, fileobj, compresslevel=9, threads=None):
+        self._fileobj = fileobj
+        self._level = compresslevel
+        threads = threads or 1
+        self._thread_pool = ThreadPool(threads)
+        self._max_pending = 2 * threads
+        self._pending = deque()  # AsyncResult of the blocks being deflated, in order
+        self._buffer = bytearray()
+        self._dict = None
+        self._crc = 0
+        self._size = 0
+        self._closed = False
+        xfl = b"\002" if compresslevel == 9 else (b"\004" if compresslevel == 1 else b"\000")
+        # magic, deflate method, no flags, mtime=0, extra flags, OS=unknown
+        self._fileobj.write(b"\037\213\010\000" + struct.pack("<L", 0) + xfl + b"\377")
+
+    def _deflate(self, block, zdict, last):
+        if zdict is not None and six.PY3:
+            compressor = zlib.compressobj(self._level, zlib.DEFLATED, -zlib.MAX_WBITS,
+                                          zlib.DEF_MEM_LEVEL, zlib.Z_DEFAULT_STRATEGY, zdict)
+        else:
+            compressor = zlib.compressobj(self._level, zlib.DEFLATED, -zlib.MAX_WBITS)
+        data = compressor.compress(block)
+        # The sync flush keeps the deflate stream open, byte aligned, to append the next block
+        return data + compressor.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+    def _submit(self, block, last):
+        block = bytes(block)
+        self._crc = zlib.crc32(block, self._crc)
+        self._size += len(block)
+        self._pending.append(self._thread_pool.apply_async(self._deflate,
+                                                           (block, self._dict, last)))
+        self._dict = block[-self._dict_size:]
+        while len(self._pending) > self._max_pending:
+            self._fileobj.write(self._pending.popleft().get())
+
+    def write(self, data):
+        self._buffer.extend(data)
+        # Strictly greater, so the last block is always submitted by close()
+        while len(self._buffer) > self.block_size:
+            self._submit(self._buffer[:self.block_size], last=False)
+            del self._buffer[:self.block_size]
+        return len(data)
+
+    def tell(self):
+        return self._size + len(self._buffer)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._submit(self._buffer, last=True)
+            self._buffer = bytearray()
+            while self._pending:
+                self._fileobj.write(self._pending.popleft().get())
+            self._fileobj.write(struct.pack("<LL", self._crc & 0xffffffff,
+                                            self._size & 0xffffffff))
+        finally:
+            self._thread_pool.close()
+            self._thread_pool.join()
+
+
+def gzip_compressor(name, fileobj, compresslevel, compressor=None):
+    """ returns the writable file object that compresses into fileobj with the compressor
+    defined in CONAN_COMPRESSOR (conan.conf general.compressor). All of them produce gzip
+    files, so nothing changes for the consumers of the packages.
+    """
+    compressor = compressor or os.getenv("CONAN_COMPRESSOR") or GZIP_COMPRESSOR
+    if compressor == GZIP_COMPRESSOR:
+        return gzip.GzipFile(name, "w", compresslevel, fileobj, mtime=0)
+    if compressor == PARALLEL_GZIP_COMPRESSOR:
+        return ParallelGzipFile(fileobj, compresslevel, cpu_threads())
+    raise ConanException("Invalid compressor '%s', allowed values: %s"
+                         % (compressor, ", ".join([GZIP_COMPRESSOR, PARALLEL_GZIP_COMPRESSOR])))
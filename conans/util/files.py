@@ -106,6 +106,11 @@ def decode_text(text, encoding="auto"):
     return text[bom_length:].decode(encoding)
 
 
+# Files and folders modified in the last RACY_SECONDS can be modified again without changing
+# their mtime, so their mtime is not trusted to detect changes
+RACY_SECONDS = 2
+
+
 def touch(fname, times=None):
     os.utime(fname, times)
 
@@ -159,7 +164,7 @@ def _generic_algorithm_sum(file_path, algorithm_name):
         except ValueError:  # FIPS error https://github.com/conan-io/conan/issues/7800
             m = hashlib.new(algorithm_name, usedforsecurity=False)
         while True:
-            data = fh.read(8192)
+            data = fh.read(1 << 20)  # Big chunks, hashlib releases the GIL while hashing them
             if not data:
                 break
             m.update(data)
@@ -307,6 +312,7 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
         previous tarfile open because arguments are not passed to GzipFile constructor
     """
     from tarfile import CompressionError, ReadError
+    from conans.util.compression import gzip_compressor
 
     compresslevel = compresslevel or int(os.getenv("CONAN_COMPRESSION_LEVEL", 9))
 
@@ -320,7 +326,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
         raise CompressionError("gzip module is not available")
 
     try:
-        fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
+        if mode == "w":
+            fileobj = gzip_compressor(name, fileobj, compresslevel)
+        else:
+            fileobj = gzip.GzipFile(name, mode, compresslevel, fileobj, mtime=0)
     except OSError:
         if fileobj is not None and mode == 'r':
             raise ReadError("not a gzip file")
@@ -342,9 +351,10 @@ def gzopen_without_timestamps(name, mode="r", fileobj=None, compresslevel=None,
     return t
 
 
-def tar_extract(fileobj, destination_dir):
+def tar_extract(fileobj, destination_dir, stream=False):
     """Extract tar file controlling not absolute paths and fixing the routes
-    if the tar was zipped in windows"""
+    if the tar was zipped in windows.
+    With stream=True the fileobj is read sequentially, it doesn't need to be seekable"""
     def badpath(path, base):
         # joinpath will ignore base if path is absolute
         return not realpath(abspath(joinpath(base, path))).startswith(base)
@@ -361,7 +371,7 @@ def tar_extract(fileobj, destination_dir):
                 finfo.name = finfo.name.replace("\\", "/")
                 yield finfo
 
-    the_tar = tarfile.open(fileobj=fileobj)
+    the_tar = tarfile.open(fileobj=fileobj, mode="r|*" if stream else "r")
     # NOTE: The errorlevel=2 has been removed because it was failing in Win10, it didn't allow to
     # "could not change modification time", with time=0
     # the_tar.errorlevel = 2  # raise exception if any error
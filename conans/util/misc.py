@@ -1,3 +1,5 @@
+import os
+
 import six
 
 try:
@@ -21,3 +23,15 @@ def make_tuple(value):
         return tuple(value)
     else:
         return value,
+
+
+def cpu_threads():
+    """ number of threads for the CPU bound tasks, CONAN_CPU_COUNT or the number of CPUs """
+    cpu_count = os.getenv("CONAN_CPU_COUNT")
+    if cpu_count and cpu_count.isdigit():
+        return int(cpu_count)
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
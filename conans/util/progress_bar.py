@@ -60,6 +60,10 @@ class Progress(object):
             self._last_time = time.time()
             self._output.write(TIMEOUT_BEAT_CHARACTER)
 
+    def increment(self, size):
+        self._processed_size += size
+        self._pb_update(size)
+
     def update(self, chunks):
         for chunk in chunks:
             yield chunk
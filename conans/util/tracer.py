@@ -68,23 +68,30 @@ def _append_action(action_name, props):
 
 # ############## LOG METHODS ######################
 
-def _file_document(name, path):
+def _file_document(name, path, checksums=None):
+    """checksums is an optional dict {name: {"md5": md5, "sha1": sha1}}, for the files that were
+    already hashed or that are not in the local cache"""
+    checksum = (checksums or {}).get(name)
+    if checksum:
+        return {"name": name, "path": path, "md5": checksum["md5"], "sha1": checksum["sha1"]}
     return {"name": name, "path": path, "md5": md5sum(path), "sha1": sha1sum(path)}
 
 
-def log_recipe_upload(ref, duration, files_uploaded, remote_name):
+def log_recipe_upload(ref, duration, files_uploaded, remote_name, checksums=None):
     files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = [_file_document(name, path, checksums)
+                      for name, path in files_uploaded.items()]
     _append_action("UPLOADED_RECIPE", {"_id": repr(ref.copy_clear_rev()),
                                        "duration": duration,
                                        "files": files_uploaded,
                                        "remote": remote_name})
 
 
-def log_package_upload(pref, duration, files_uploaded, remote):
+def log_package_upload(pref, duration, files_uploaded, remote, checksums=None):
     """files_uploaded is a dict with relative path as keys and abs path as values"""
     files_uploaded = files_uploaded or {}
-    files_uploaded = [_file_document(name, path) for name, path in files_uploaded.items()]
+    files_uploaded = [_file_document(name, path, checksums)
+                      for name, path in files_uploaded.items()]
     _append_action("UPLOADED_PACKAGE", {"_id": repr(pref.copy_clear_revs()),
                                         "duration": duration,
                                         "files": files_uploaded,